@@ -6,21 +6,24 @@ import os
 import json
 import logging
 import threading
+from contextlib import ExitStack
 from datetime import datetime, timedelta
 from typing import Dict, List, Any
 
-import psycopg
-from psycopg.rows import dict_row
 import pytz
 from dotenv import load_dotenv
 
-from flask import Flask, render_template, request, jsonify, send_file, redirect, url_for
+from flask import Flask, g, render_template, request, jsonify, send_file, redirect, url_for
 from flask_restful import Api, Resource
 from flask_cors import CORS
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
 from apscheduler.schedulers.background import BackgroundScheduler
 
+from db import DatabasePool
+from counts import CountService
+from pagination import PageRequest, InvalidCursor, ORDER_BY_SQL, MAX_OFFSET_PAGE
+from search import SearchQuery
 from scrapers import SCRAPERS
 
 # Load environment variables
@@ -53,6 +56,8 @@ api = Api(app)
 
 # Database connection
 DATABASE_URL = os.getenv('DATABASE_URL')
+db_pool = DatabasePool.from_env(DATABASE_URL)
+job_counts = CountService()
 TIMEZONE = pytz.timezone(os.getenv('TIMEZONE', 'Asia/Karachi'))
 
 # Global scraper progress tracker
@@ -60,6 +65,17 @@ scraper_progress = {}
 scraper_lock = threading.Lock()
 scraper_stop_flags = {}  # Stop signals for each scraper
 
+# Jobs columns used for search and change detection, never returned to clients
+INTERNAL_JOB_COLUMNS = ('search_vector', 'content_hash')
+
+
+def public_job_rows(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Drop internal columns from SELECT * job rows before they are returned or exported"""
+    for row in rows:
+        for column in INTERNAL_JOB_COLUMNS:
+            row.pop(column, None)
+    return rows
+
 
 def update_scraper_progress(site_name: str, status: str, progress: int, message: str = "", stats: Dict = None):
     """Update scraper progress for real-time tracking"""
@@ -74,13 +90,39 @@ def update_scraper_progress(site_name: str, status: str, progress: int, message:
 
 
 def get_db_connection():
-    """Get PostgreSQL database connection"""
+    """
+    Get a pooled PostgreSQL connection for the current request
+    
+    The connection is checked out once per request and returned to the
+    pool by release_db_connection when the request ends, including on
+    errors, so routes must not close it.
+    """
+    if 'db_conn' not in g:
+        stack = ExitStack()
+        try:
+            g.db_conn = stack.enter_context(db_pool.connection())
+        except Exception as e:
+            stack.close()
+            logger.error(f"Database connection failed: {e}")
+            return None
+        g.db_stack = stack
+    return g.db_conn
+
+
+@app.teardown_appcontext
+def release_db_connection(exc):
+    """Return the request's connection to the pool (rolled back if the request failed)"""
+    stack = g.pop('db_stack', None)
+    g.pop('db_conn', None)
+    if stack is None:
+        return
     try:
-        conn = psycopg.connect(DATABASE_URL, row_factory=dict_row)
-        return conn
+        if exc is not None:
+            stack.__exit__(type(exc), exc, exc.__traceback__)
+        else:
+            stack.close()
     except Exception as e:
-        logger.error(f"Database connection failed: {e}")
-        return None
+        logger.error(f"Error returning database connection to the pool: {e}")
 
 
 def should_stop_scraper(site_name: str) -> bool:
@@ -207,15 +249,16 @@ def index():
     try:
         cursor = conn.cursor()
         
-        # Get statistics
-        cursor.execute("SELECT COUNT(*) as total FROM jobs WHERE is_active = true")
-        total_jobs = cursor.fetchone()['total']
+        # Get statistics (cached for COUNT_CACHE_SECONDS)
+        total_jobs = job_counts.exact(cursor, "is_active = true")
         
-        cursor.execute("SELECT COUNT(DISTINCT company) as total FROM jobs WHERE is_active = true")
-        total_companies = cursor.fetchone()['total']
+        total_companies = job_counts.query(
+            cursor, "SELECT COUNT(DISTINCT company) as total FROM jobs WHERE is_active = true"
+        )[0]['total']
         
-        cursor.execute("SELECT COUNT(DISTINCT location) as total FROM jobs WHERE is_active = true AND location IS NOT NULL")
-        total_cities = cursor.fetchone()['total']
+        total_cities = job_counts.query(
+            cursor, "SELECT COUNT(DISTINCT location) as total FROM jobs WHERE is_active = true AND location IS NOT NULL"
+        )[0]['total']
         
         # Recent scrapes
         cursor.execute("""
@@ -227,17 +270,15 @@ def index():
         recent_scrapes = cursor.fetchall()
         
         # Jobs by site
-        cursor.execute("""
+        jobs_by_site = job_counts.query(cursor, """
             SELECT source_site, COUNT(*) as count
             FROM jobs
             WHERE is_active = true
             GROUP BY source_site
             ORDER BY count DESC
         """)
-        jobs_by_site = cursor.fetchall()
         
         cursor.close()
-        conn.close()
         
         return render_template('home.html',
                              total_jobs=total_jobs,
@@ -269,18 +310,23 @@ def jobs():
         remote = request.args.get('remote', type=bool)
         page = request.args.get('page', 1, type=int)
         per_page = 50
-        offset = (page - 1) * per_page
+        search = SearchQuery(query)
+        
+        # Numbered pages up to MAX_OFFSET_PAGE, cursor (keyset) pages beyond;
+        # ranked search results are not in keyset order, so they only get numbered pages
+        try:
+            page_request = PageRequest(request.args.get('cursor'), page, per_page, keyset=not search)
+        except InvalidCursor as e:
+            return render_template('error.html', message=str(e)), 400
         
         # Build query
         where_clauses = ["is_active = true"]
         params = []
         
-        if query:
-            where_clauses.append("""
-                to_tsvector('english', title || ' ' || COALESCE(description, '') || ' ' || company)
-                @@ plainto_tsquery('english', %s)
-            """)
-            params.append(query)
+        if search:
+            search_sql, search_params = search.where()
+            where_clauses.append(search_sql)
+            params.extend(search_params)
         
         if city:
             where_clauses.append("location ILIKE %s")
@@ -298,21 +344,24 @@ def jobs():
         
         where_sql = " AND ".join(where_clauses)
         
-        # Get total count
-        cursor.execute(f"SELECT COUNT(*) as total FROM jobs WHERE {where_sql}", params)
-        total_results = cursor.fetchone()['total']
+        # Get total count: cached, and never more than COUNT_CAP rows read
+        total_results = job_counts.count(cursor, where_sql, params)
         
         # Get jobs
+        cursor_sql, cursor_params = page_request.where()
+        page_where_sql = f"{where_sql} AND {cursor_sql}" if cursor_sql else where_sql
+        order_sql, order_params = search.order_by() if search else (ORDER_BY_SQL, [])
+        limit_sql, limit_params = page_request.limit()
         cursor.execute(f"""
             SELECT id, title, company, location, salary, job_type, 
-                   experience_level, posted_date, apply_url, source_site
+                   experience_level, posted_date, scraped_at, apply_url, source_site
             FROM jobs
-            WHERE {where_sql}
-            ORDER BY posted_date DESC, scraped_at DESC
-            LIMIT %s OFFSET %s
-        """, params + [per_page, offset])
+            WHERE {page_where_sql}
+            ORDER BY {order_sql}
+            {limit_sql}
+        """, params + cursor_params + order_params + limit_params)
         
-        job_results = cursor.fetchall()
+        job_results, next_cursor = page_request.finish(cursor.fetchall())
         
         # Get available cities for filter
         cursor.execute("""
@@ -326,15 +375,16 @@ def jobs():
         cities = cursor.fetchall()
         
         cursor.close()
-        conn.close()
         
-        total_pages = (total_results + per_page - 1) // per_page
+        total_pages = (total_results.value + per_page - 1) // per_page
         
         return render_template('jobs.html',
                              jobs=job_results,
                              total_results=total_results,
                              page=page,
                              total_pages=total_pages,
+                             next_cursor=next_cursor,
+                             max_offset_page=MAX_OFFSET_PAGE,
                              cities=cities,
                              filters={'q': query, 'city': city, 'site': site})
     
@@ -379,7 +429,6 @@ def scrapers():
                 })
         
         cursor.close()
-        conn.close()
         
         return render_template('scrapers.html', scrapers=scraper_status)
     
@@ -451,7 +500,6 @@ def analytics():
         work_mode = cursor.fetchone()
         
         cursor.close()
-        conn.close()
         
         return render_template('analytics.html',
                              salary_stats=salary_stats,
@@ -540,9 +588,8 @@ def export_jobs():
             LIMIT 10000
         """)
         
-        jobs = cursor.fetchall()
+        jobs = public_job_rows(cursor.fetchall())
         cursor.close()
-        conn.close()
         
         # Export
         exporter = JobExporter()
@@ -565,12 +612,11 @@ def export_jobs():
 def health():
     """Health check endpoint for Render"""
     try:
-        conn = get_db_connection()
-        if conn:
-            conn.close()
-            return jsonify({'status': 'healthy', 'database': 'connected'}), 200
+        if db_pool.check():
+            return jsonify({'status': 'healthy', 'database': 'connected', 'pool': db_pool.stats(),
+                            'count_cache': job_counts.stats()}), 200
         else:
-            return jsonify({'status': 'unhealthy', 'database': 'disconnected'}), 503
+            return jsonify({'status': 'unhealthy', 'database': 'disconnected', 'pool': db_pool.stats()}), 503
     except:
         return jsonify({'status': 'unhealthy'}), 503
 
@@ -586,7 +632,14 @@ class JobsListAPI(Resource):
         page = request.args.get('page', 1, type=int)
         limit = request.args.get('limit', 100, type=int)
         limit = min(limit, 1000)  # Max 1000 per request
-        offset = (page - 1) * limit
+        # count=none skips the total; has_more still tells whether another page exists
+        with_total = request.args.get('count', 'exact').lower() != 'none'
+        
+        # cursor (from next_cursor) for constant-cost paging; page only for shallow pages
+        try:
+            page_request = PageRequest(request.args.get('cursor'), page, limit)
+        except InvalidCursor as e:
+            return {'error': str(e)}, 400
         
         conn = get_db_connection()
         if not conn:
@@ -595,28 +648,32 @@ class JobsListAPI(Resource):
         try:
             cursor = conn.cursor()
             
-            cursor.execute("""
+            where_sql = "is_active = true"
+            cursor_sql, cursor_params = page_request.where()
+            if cursor_sql:
+                where_sql += f" AND {cursor_sql}"
+            limit_sql, limit_params = page_request.limit()
+            cursor.execute(f"""
                 SELECT * FROM jobs
-                WHERE is_active = true
-                ORDER BY posted_date DESC
-                LIMIT %s OFFSET %s
-            """, (limit, offset))
+                WHERE {where_sql}
+                ORDER BY {ORDER_BY_SQL}
+                {limit_sql}
+            """, cursor_params + limit_params)
             
-            jobs = cursor.fetchall()
+            jobs, next_cursor = page_request.finish(public_job_rows(cursor.fetchall()))
             
-            cursor.execute("SELECT COUNT(*) as total FROM jobs WHERE is_active = true")
-            total = cursor.fetchone()['total']
+            response = {'page': page, 'limit': limit}
+            if with_total:
+                total = job_counts.exact(cursor, "is_active = true")
+                response['total'] = total
+                response['total_pages'] = (total + limit - 1) // limit
+            response['has_more'] = page_request.has_more
+            response['next_cursor'] = next_cursor
+            response['jobs'] = jobs
             
             cursor.close()
-            conn.close()
             
-            return {
-                'page': page,
-                'limit': limit,
-                'total': total,
-                'total_pages': (total + limit - 1) // limit,
-                'jobs': jobs
-            }, 200
+            return response, 200
         
         except Exception as e:
             logger.error(f"API error: {e}")
@@ -631,6 +688,9 @@ class JobSearchAPI(Resource):
         city = request.args.get('city', '')
         site = request.args.get('site', '')
         limit = request.args.get('limit', 100, type=int)
+        limit = min(limit, 1000)  # Max 1000 per request
+        recency = request.args.get('recency', 'true').lower() != 'false'
+        search = SearchQuery(query, recency=recency)
         
         conn = get_db_connection()
         if not conn:
@@ -642,12 +702,10 @@ class JobSearchAPI(Resource):
             where_clauses = ["is_active = true"]
             params = []
             
-            if query:
-                where_clauses.append("""
-                    to_tsvector('english', title || ' ' || COALESCE(description, ''))
-                    @@ plainto_tsquery('english', %s)
-                """)
-                params.append(query)
+            if search:
+                search_sql, search_params = search.where()
+                where_clauses.append(search_sql)
+                params.extend(search_params)
             
             if city:
                 where_clauses.append("location ILIKE %s")
@@ -658,17 +716,17 @@ class JobSearchAPI(Resource):
                 params.append(site)
             
             where_sql = " AND ".join(where_clauses)
+            order_sql, order_params = search.order_by() if search else (ORDER_BY_SQL, [])
             
             cursor.execute(f"""
                 SELECT * FROM jobs
                 WHERE {where_sql}
-                ORDER BY posted_date DESC
+                ORDER BY {order_sql}
                 LIMIT %s
-            """, params + [limit])
+            """, params + order_params + [limit])
             
-            jobs = cursor.fetchall()
+            jobs = public_job_rows(cursor.fetchall())
             cursor.close()
-            conn.close()
             
             return {'total': len(jobs), 'jobs': jobs}, 200
         
@@ -690,22 +748,23 @@ class StatsAPI(Resource):
             
             stats = {}
             
-            cursor.execute("SELECT COUNT(*) as total FROM jobs WHERE is_active = true")
-            stats['total_jobs'] = cursor.fetchone()['total']
+            # Same cached counts as the home page
+            stats['total_jobs'] = job_counts.exact(cursor, "is_active = true")
             
-            cursor.execute("SELECT COUNT(DISTINCT company) as total FROM jobs WHERE is_active = true")
-            stats['total_companies'] = cursor.fetchone()['total']
+            stats['total_companies'] = job_counts.query(
+                cursor, "SELECT COUNT(DISTINCT company) as total FROM jobs WHERE is_active = true"
+            )[0]['total']
             
-            cursor.execute("""
+            by_site = job_counts.query(cursor, """
                 SELECT source_site, COUNT(*) as count
                 FROM jobs
                 WHERE is_active = true
                 GROUP BY source_site
+                ORDER BY count DESC
             """)
-            stats['by_site'] = {row['source_site']: row['count'] for row in cursor.fetchall()}
+            stats['by_site'] = {row['source_site']: row['count'] for row in by_site}
             
             cursor.close()
-            conn.close()
             
             return stats, 200
         
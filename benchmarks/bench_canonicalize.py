@@ -0,0 +1,89 @@
+"""
+Microbenchmark for scrapers.urls.canonicalize_url
+
+Usage:
+    python benchmarks/bench_canonicalize.py [--urls N] [--repeat N]
+
+Times the old HTTPTEMP/HTTPSTEMP string-replace normalization against the
+canonicalizer with a cold memo cache (first sighting of every URL) and a
+warm one (the same URLs seen again on later pages / sources).
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scrapers.urls import canonicalize_url, extract_rozee_job_id
+
+BASE_URL = 'https://www.rozee.pk'
+
+
+def legacy_normalize(url):
+    """Normalization as scrape_source_with_pagination used to do it"""
+    url = url.strip()
+    if url.startswith('http'):
+        full_url = url
+    elif url.startswith('//'):
+        full_url = f"https:{url}"
+    elif url.startswith('/'):
+        full_url = f"{BASE_URL}{url}"
+    else:
+        full_url = f"{BASE_URL}/{url}"
+    full_url = full_url.replace('http://', 'HTTPTEMP').replace('https://', 'HTTPSTEMP')
+    full_url = full_url.replace('//', '/')
+    return full_url.replace('HTTPTEMP', 'http://').replace('HTTPSTEMP', 'https://')
+
+
+def sample_hrefs(count):
+    """Mix of href shapes seen on listing pages (the same job appears in several shapes)"""
+    rng = random.Random(42)
+    shapes = [
+        '/company-{i}-developer-jobs-{i}',
+        '//www.rozee.pk/company-{i}-developer-jobs-{i}',
+        'https://www.rozee.pk/company-{i}-developer-jobs-{i}?utm_source=home&utm_medium=list',
+        'https://WWW.ROZEE.PK//company-{i}-developer-jobs-{i}/',
+        'company-{i}-developer-jobs-{i}?ref=similar',
+    ]
+    return [rng.choice(shapes).format(i=100000 + rng.randrange(max(1, count // 3))) for _ in range(count)]
+
+
+def us_per_url(func, urls, repeat, before_pass=None):
+    total = 0.0
+    for _ in range(repeat):
+        if before_pass:
+            before_pass()
+        started = time.perf_counter()
+        for url in urls:
+            func(url)
+        total += time.perf_counter() - started
+    return total * 1e6 / (repeat * len(urls))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--urls', type=int, default=20000, help='Distinct hrefs')
+    parser.add_argument('--repeat', type=int, default=5, help='Passes over the hrefs')
+    args = parser.parse_args()
+    
+    hrefs = sample_hrefs(args.urls)
+    
+    legacy = us_per_url(legacy_normalize, hrefs, args.repeat)
+    cold = us_per_url(lambda u: canonicalize_url(u, BASE_URL), hrefs, args.repeat, canonicalize_url.cache_clear)
+    us_per_url(lambda u: canonicalize_url(u, BASE_URL), hrefs, 1)
+    warm = us_per_url(lambda u: canonicalize_url(u, BASE_URL), hrefs, args.repeat)
+    job_id = us_per_url(extract_rozee_job_id, [canonicalize_url(u, BASE_URL) for u in hrefs], args.repeat)
+    
+    print(f"{len(hrefs)} hrefs, {len(set(canonicalize_url(u, BASE_URL) for u in hrefs))} canonical URLs, "
+          f"{len(set(map(legacy_normalize, hrefs)))} after legacy normalization")
+    print(f"  legacy string replace : {legacy:7.2f} us/url")
+    print(f"  canonicalize (cold)   : {cold:7.2f} us/url")
+    print(f"  canonicalize (warm)   : {warm:7.2f} us/url")
+    print(f"  extract_rozee_job_id  : {job_id:7.2f} us/url")
+
+
+if __name__ == '__main__':
+    main()
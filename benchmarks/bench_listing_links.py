@@ -0,0 +1,112 @@
+"""
+Benchmark listing-page link extraction: full BeautifulSoup parse vs href scan
+
+Usage:
+    python benchmarks/bench_listing_links.py [listing.html ...] [--repeat N]
+
+Without files a synthetic listing page is generated. Reports per-page CPU
+time for the old soup + find_all path and the raw-bytes href scan used by
+RozeeScraper.extract_job_links, and checks both return the same URLs.
+"""
+
+import os
+import re
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Keep the benchmark from touching the cache / archive directories
+os.environ.setdefault('HTTP_CACHE_DIR', '')
+os.environ.setdefault('PAGE_ARCHIVE_DIR', '')
+
+from bs4 import BeautifulSoup
+
+from scrapers.rozee import RozeeScraper
+
+
+def soup_extract(scraper, html):
+    """Link extraction as it was before the href scan (full tree, regex compiled per page)"""
+    soup = BeautifulSoup(html, 'lxml')
+    page_links = []
+    for link in soup.find_all('a', href=re.compile(r'-jobs-\d+$')):
+        url = link.get('href')
+        if url:
+            url = url.strip()
+            if url.startswith('http'):
+                full_url = url
+            elif url.startswith('//'):
+                full_url = f"https:{url}"
+            elif url.startswith('/'):
+                full_url = f"{scraper.base_url}{url}"
+            else:
+                full_url = f"{scraper.base_url}/{url}"
+            full_url = full_url.replace('http://', 'HTTPTEMP').replace('https://', 'HTTPSTEMP')
+            full_url = full_url.replace('//', '/')
+            full_url = full_url.replace('HTTPTEMP', 'http://').replace('HTTPSTEMP', 'https://')
+            page_links.append(full_url)
+    return list(dict.fromkeys(page_links))
+
+
+def synthetic_listing(jobs=40):
+    """Listing page roughly the size and shape of a Rozee search page"""
+    parts = ['<html><head><title>Jobs</title>']
+    parts += [f'<script>var cfg{i} = {{"k": "{"x" * 200}"}};</script>' for i in range(30)]
+    parts.append('</head><body><nav>')
+    parts += [f'<a href="/category/c{i}">Category {i}</a>' for i in range(150)]
+    parts.append('</nav><div id="jobs">')
+    for i in range(jobs):
+        parts.append(
+            f'<div class="job"><div class="jhead"><h3><a href="//www.rozee.pk/company-{i}-role-{i}-jobs-{100000 + i}" '
+            f'class="jlink">Role {i}</a></h3></div><div class="jbody"><p>{"Lorem ipsum dolor sit amet. " * 20}</p>'
+            f'<span class="loc">Karachi</span><span class="date">Oct 18, 2026</span>'
+            f'<a href="/company/c{i}">Company {i}</a></div></div>'
+        )
+    parts.append('</div><footer>')
+    parts += [f'<a href="https://www.rozee.pk/page-{i}">Footer {i}</a>' for i in range(100)]
+    parts.append('</footer></body></html>')
+    return ''.join(parts).encode('utf-8')
+
+
+def cpu_ms_per_page(func, pages, repeat):
+    started = time.process_time()
+    for _ in range(repeat):
+        for page in pages:
+            func(page)
+    return (time.process_time() - started) * 1000 / (repeat * len(pages))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('files', nargs='*', help='Saved listing pages (default: synthetic page)')
+    parser.add_argument('--repeat', type=int, default=50, help='Passes over the page set')
+    args = parser.parse_args()
+    
+    pages = []
+    for path in args.files:
+        with open(path, 'rb') as f:
+            pages.append(f.read())
+    if not pages:
+        pages = [synthetic_listing()]
+    
+    scraper = RozeeScraper()
+    
+    for page in pages:
+        before = soup_extract(scraper, page.decode('utf-8', 'replace'))
+        after = scraper.extract_job_links(page)
+        if before != after:
+            print(f"WARNING: URL mismatch ({len(before)} soup vs {len(after)} scan)")
+    
+    soup_ms = cpu_ms_per_page(lambda p: soup_extract(scraper, p.decode('utf-8', 'replace')), pages, args.repeat)
+    scan_ms = cpu_ms_per_page(scraper.extract_job_links, pages, args.repeat)
+    
+    avg_kb = sum(len(p) for p in pages) / len(pages) / 1024
+    print(f"{len(pages)} page(s), {avg_kb:.0f} KB average, {args.repeat} passes")
+    print(f"  soup + find_all : {soup_ms:8.3f} ms CPU/page")
+    print(f"  href scan       : {scan_ms:8.3f} ms CPU/page")
+    print(f"  speedup         : {soup_ms / scan_ms:8.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,234 @@
+"""
+Cheap job counts: short-TTL cache, capped counts and planner estimates
+"""
+
+import os
+import time
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Seconds a count (or cached aggregate) is served before it is recomputed
+COUNT_CACHE_SECONDS = float(os.getenv('COUNT_CACHE_SECONDS', '60'))
+
+# Filtered counts stop after this many rows; past it the planner estimate
+# (or "COUNT_CAP+") is shown, so a count never reads more than COUNT_CAP rows
+COUNT_CAP = int(os.getenv('COUNT_CAP', '10000'))
+
+# Distinct filter combinations kept per worker
+COUNT_CACHE_ENTRIES = int(os.getenv('COUNT_CACHE_ENTRIES', '512'))
+
+
+class Count:
+    """
+    A row count that may be exact, capped or a planner estimate
+    
+    str() gives the display form: "1,234", "10,000+" or "~25,000".
+    """
+    
+    EXACT = 'exact'
+    CAPPED = 'capped'
+    ESTIMATE = 'estimate'
+    
+    def __init__(self, value: int, kind: str = EXACT):
+        """
+        Initialize count
+        
+        Args:
+            value: Row count (the cap for CAPPED, the estimate for ESTIMATE)
+            kind: EXACT, CAPPED or ESTIMATE
+        """
+        self.value = value
+        self.kind = kind
+    
+    @property
+    def exact(self) -> bool:
+        return self.kind == self.EXACT
+    
+    def __str__(self) -> str:
+        if self.kind == self.CAPPED:
+            return f"{self.value:,}+"
+        if self.kind == self.ESTIMATE:
+            return f"~{self.value:,}"
+        return f"{self.value:,}"
+    
+    def __repr__(self) -> str:
+        return f"Count({self.value}, {self.kind!r})"
+
+
+def _cache_key(kind: str, sql: str, params: Sequence[Any]) -> Hashable:
+    """Cache key: SQL with whitespace collapsed, parameters as a (hashable) tuple"""
+    def freeze(value):
+        if isinstance(value, (list, tuple)):
+            return tuple(freeze(v) for v in value)
+        return value
+    
+    return kind, ' '.join(sql.split()), freeze(list(params))
+
+
+class CountService:
+    """
+    Per-worker cache of job counts and dashboard aggregates
+    
+    Entries are keyed by the WHERE clause (whitespace collapsed) and its
+    parameters, so every request with the same filters shares one entry. Counts
+    are recomputed at most once per ttl seconds per key; the cache is an LRU
+    of max_entries keys.
+    """
+    
+    def __init__(self, ttl: float = COUNT_CACHE_SECONDS, cap: int = COUNT_CAP,
+                 max_entries: int = COUNT_CACHE_ENTRIES):
+        """
+        Initialize count service
+        
+        Args:
+            ttl: Seconds a cached value stays fresh (0 disables caching)
+            cap: Rows a filtered count reads before falling back to an estimate
+            max_entries: Cached keys kept (least recently used dropped first)
+        """
+        self.ttl = ttl
+        self.cap = max(1, cap)
+        self.max_entries = max(1, max_entries)
+        self._cache: 'OrderedDict[Hashable, Tuple[float, Any]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    def cached(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """
+        Value for key from the cache, or compute() it and cache it for ttl seconds
+        
+        Args:
+            key: Cache key
+            compute: Called on a miss or an expired entry
+        
+        Returns:
+            Cached or freshly computed value
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None and entry[0] > now:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+        
+        value = compute()
+        
+        if self.ttl > 0:
+            with self._lock:
+                self._cache[key] = (now + self.ttl, value)
+                self._cache.move_to_end(key)
+                while len(self._cache) > self.max_entries:
+                    self._cache.popitem(last=False)
+        return value
+    
+    def query(self, cursor, sql: str, params: Sequence[Any] = ()) -> List[Dict[str, Any]]:
+        """
+        Cached fetchall() of an aggregate query (distinct counts, GROUP BY)
+        
+        Args:
+            cursor: Database cursor (dict rows)
+            sql: Query
+            params: Query parameters
+        
+        Returns:
+            Result rows
+        """
+        def compute():
+            cursor.execute(sql, list(params))
+            return cursor.fetchall()
+        
+        return self.cached(_cache_key('query', sql, params), compute)
+    
+    def exact(self, cursor, where_sql: str, params: Sequence[Any] = ()) -> int:
+        """
+        Cached exact COUNT(*) of jobs matching where_sql
+        
+        Meant for unfiltered totals, where a full count once per ttl is fine.
+        
+        Args:
+            cursor: Database cursor (dict rows)
+            where_sql: WHERE condition
+            params: Condition parameters
+        
+        Returns:
+            Row count
+        """
+        def compute():
+            cursor.execute(f"SELECT COUNT(*) AS total FROM jobs WHERE {where_sql}", list(params))
+            return cursor.fetchone()['total']
+        
+        return self.cached(_cache_key('exact', where_sql, params), compute)
+    
+    def count(self, cursor, where_sql: str, params: Sequence[Any] = ()) -> Count:
+        """
+        Cached count of jobs matching where_sql that reads at most cap rows
+        
+        Up to cap matches the count is exact. Past it, the planner's row
+        estimate is returned if it is above the cap, else the capped count.
+        
+        Args:
+            cursor: Database cursor (dict rows)
+            where_sql: WHERE condition
+            params: Condition parameters
+        
+        Returns:
+            Count
+        """
+        def compute():
+            cursor.execute(f"""
+                SELECT COUNT(*) AS total FROM (
+                    SELECT 1 FROM jobs WHERE {where_sql} LIMIT %s
+                ) AS capped
+            """, list(params) + [self.cap + 1])
+            total = cursor.fetchone()['total']
+            if total <= self.cap:
+                return Count(total)
+            
+            estimate = self.estimate(cursor, where_sql, params)
+            if estimate is not None and estimate > self.cap:
+                return Count(estimate, Count.ESTIMATE)
+            return Count(self.cap, Count.CAPPED)
+        
+        return self.cached(_cache_key('count', where_sql, params), compute)
+    
+    def estimate(self, cursor, where_sql: str, params: Sequence[Any] = ()) -> Optional[int]:
+        """
+        Planner's row estimate for jobs matching where_sql (no rows are read)
+        
+        Args:
+            cursor: Database cursor (dict rows)
+            where_sql: WHERE condition
+            params: Condition parameters
+        
+        Returns:
+            Estimated rows, or None if the plan can't be read
+        """
+        try:
+            cursor.execute(f"EXPLAIN (FORMAT JSON) SELECT 1 FROM jobs WHERE {where_sql}", list(params))
+            plan = cursor.fetchone()['QUERY PLAN']
+            return int(plan[0]['Plan']['Plan Rows'])
+        except (KeyError, IndexError, TypeError, ValueError) as e:
+            logger.warning(f"Could not read row estimate: {e}")
+            return None
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Cache size and hit counts
+        
+        Returns:
+            Dictionary of cache metrics
+        """
+        with self._lock:
+            return {
+                'entries': len(self._cache),
+                'hits': self.hits,
+                'misses': self.misses,
+                'ttl_seconds': self.ttl,
+                'cap': self.cap,
+            }
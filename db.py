@@ -0,0 +1,168 @@
+"""
+Pooled PostgreSQL connections for the web app (one pool per gunicorn worker)
+"""
+
+import os
+import time
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+import psycopg
+from psycopg.rows import dict_row
+from psycopg_pool import ConnectionPool
+
+logger = logging.getLogger(__name__)
+
+
+class DatabasePool:
+    """
+    Lazily opened psycopg_pool.ConnectionPool with checkout metrics
+    
+    The pool is opened on first use inside the process that uses it, so
+    gunicorn workers forked from one master each get their own sockets.
+    Connections use dict rows, like the rest of the app.
+    """
+    
+    def __init__(self, conninfo: str, min_size: int = 1, max_size: int = 5,
+                 timeout: float = 10.0, max_idle: float = 300.0):
+        """
+        Initialize pool settings (no connections are opened yet)
+        
+        Args:
+            conninfo: PostgreSQL connection string
+            min_size: Connections kept open
+            max_size: Upper bound on open connections
+            timeout: Seconds a request waits for a free connection
+            max_idle: Seconds an idle connection above min_size is kept
+        """
+        self.conninfo = conninfo
+        self.min_size = max(0, min_size)
+        self.max_size = max(1, max_size, self.min_size)
+        self.timeout = timeout
+        self.max_idle = max_idle
+        self._pool: Optional[ConnectionPool] = None
+        self._pid = None
+        self._lock = threading.Lock()
+        self._in_use = 0
+        self._checkouts = 0
+        self._wait_ms = 0.0
+        self._max_wait_ms = 0.0
+    
+    @classmethod
+    def from_env(cls, conninfo: str) -> 'DatabasePool':
+        """
+        Build a pool sized by DB_POOL_* environment variables
+        
+        Args:
+            conninfo: PostgreSQL connection string
+        
+        Returns:
+            DatabasePool
+        """
+        return cls(
+            conninfo,
+            min_size=int(os.getenv('DB_POOL_MIN_SIZE', '1')),
+            max_size=int(os.getenv('DB_POOL_MAX_SIZE', '5')),
+            timeout=float(os.getenv('DB_POOL_TIMEOUT_SECONDS', '10')),
+            max_idle=float(os.getenv('DB_POOL_MAX_IDLE_SECONDS', '300'))
+        )
+    
+    @property
+    def pool(self) -> ConnectionPool:
+        """The process's pool, opened on first access (and again after a fork)"""
+        with self._lock:
+            if self._pool is None or self._pid != os.getpid():
+                self._pool = ConnectionPool(
+                    self.conninfo,
+                    kwargs={'row_factory': dict_row},
+                    min_size=self.min_size,
+                    max_size=self.max_size,
+                    timeout=self.timeout,
+                    max_idle=self.max_idle,
+                    check=ConnectionPool.check_connection,
+                    name='web',
+                    open=True
+                )
+                self._pid = os.getpid()
+                logger.info(f"Database pool opened ({self.min_size}-{self.max_size} connections)")
+            return self._pool
+    
+    @contextmanager
+    def connection(self, timeout: Optional[float] = None) -> Iterator[psycopg.Connection]:
+        """
+        Check out a connection for the duration of a with block
+        
+        The transaction is committed on success and rolled back on error,
+        and the connection always goes back to the pool.
+        
+        Args:
+            timeout: Seconds to wait for a free connection (default: pool timeout)
+        
+        Yields:
+            psycopg connection with dict rows
+        """
+        started = time.perf_counter()
+        with self.pool.connection(timeout=timeout) as conn:
+            waited = (time.perf_counter() - started) * 1000
+            with self._lock:
+                self._in_use += 1
+                self._checkouts += 1
+                self._wait_ms += waited
+                self._max_wait_ms = max(self._max_wait_ms, waited)
+            try:
+                yield conn
+            finally:
+                with self._lock:
+                    self._in_use -= 1
+    
+    def check(self, timeout: float = 2.0) -> bool:
+        """
+        Health check: borrow a connection and run a trivial query
+        
+        Args:
+            timeout: Seconds to wait for a free connection
+        
+        Returns:
+            True if the database answered
+        """
+        try:
+            with self.connection(timeout=timeout) as conn:
+                conn.execute("SELECT 1")
+            return True
+        except Exception as e:
+            logger.error(f"Database health check failed: {e}")
+            return False
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Pool size, connections in use and checkout wait times
+        
+        Returns:
+            Dictionary of pool metrics
+        """
+        with self._lock:
+            checkouts = self._checkouts
+            metrics = {
+                'in_use': self._in_use,
+                'checkouts': checkouts,
+                'avg_wait_ms': round(self._wait_ms / checkouts, 2) if checkouts else 0.0,
+                'max_wait_ms': round(self._max_wait_ms, 2),
+                'min_size': self.min_size,
+                'max_size': self.max_size,
+            }
+        if self._pool is not None and self._pid == os.getpid():
+            pool_stats = self._pool.get_stats()
+            metrics['pool_size'] = pool_stats.get('pool_size', 0)
+            metrics['available'] = pool_stats.get('pool_available', 0)
+            metrics['requests_waiting'] = pool_stats.get('requests_waiting', 0)
+            metrics['timeouts'] = pool_stats.get('requests_errors', 0)
+        return metrics
+    
+    def close(self):
+        """Close every pooled connection"""
+        with self._lock:
+            if self._pool is not None and self._pid == os.getpid():
+                self._pool.close()
+            self._pool = None
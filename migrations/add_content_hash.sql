@@ -0,0 +1,8 @@
+-- Migration: Add Content Hash To Jobs
+-- Date: 2026-10-18
+-- Description: Fingerprint of each posting's title, company, salary, deadline and description so refresh runs only rewrite changed jobs
+
+ALTER TABLE jobs
+ADD COLUMN IF NOT EXISTS content_hash VARCHAR(64);
+
+COMMENT ON COLUMN jobs.content_hash IS 'SHA-256 of normalized title, company, salary, deadline and description; NULL until the job is next scraped';
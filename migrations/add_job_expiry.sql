@@ -0,0 +1,13 @@
+-- Migration: Add Job Expiry Tracking
+-- Date: 2026-10-18
+-- Description: Record how many unseen, past-deadline jobs each full_refresh deactivated, and index the expiry scan
+
+ALTER TABLE scraping_logs
+ADD COLUMN IF NOT EXISTS jobs_expired INTEGER DEFAULT 0;
+
+-- full_refresh expiry only looks at active jobs of one site with a deadline
+CREATE INDEX IF NOT EXISTS idx_jobs_active_deadline
+ON jobs(source_site, application_deadline)
+WHERE is_active = true;
+
+COMMENT ON COLUMN scraping_logs.jobs_expired IS 'Active jobs not seen by a full_refresh whose application deadline had passed, set inactive';
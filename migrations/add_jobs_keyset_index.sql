@@ -0,0 +1,10 @@
+-- Migration: Add Jobs Keyset Index
+-- Date: 2026-10-18
+-- Description: Index the newest-first sort key so cursor pagination reads one index range per page
+
+-- Matches ORDER_BY_SQL / AFTER_CURSOR_SQL in pagination.py; the expression must stay identical
+CREATE INDEX IF NOT EXISTS idx_jobs_active_keyset
+ON jobs ((COALESCE(posted_date, DATE '1970-01-01')) DESC, scraped_at DESC, id DESC)
+WHERE is_active = true;
+
+COMMENT ON INDEX idx_jobs_active_keyset IS 'Keyset pagination of active jobs: (posted_date, scraped_at, id) newest first';
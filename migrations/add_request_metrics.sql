@@ -0,0 +1,12 @@
+-- Migration: Add Request Metrics To Scraping Logs
+-- Date: 2026-10-18
+-- Description: Track retries, timeouts and circuit-breaker rejections per scrape run
+
+ALTER TABLE scraping_logs
+ADD COLUMN IF NOT EXISTS retries INTEGER DEFAULT 0,
+ADD COLUMN IF NOT EXISTS timeouts INTEGER DEFAULT 0,
+ADD COLUMN IF NOT EXISTS breaker_open INTEGER DEFAULT 0;
+
+COMMENT ON COLUMN scraping_logs.retries IS 'HTTP requests retried after a transient failure';
+COMMENT ON COLUMN scraping_logs.timeouts IS 'HTTP requests that timed out';
+COMMENT ON COLUMN scraping_logs.breaker_open IS 'Requests rejected because the host circuit breaker was open';
@@ -0,0 +1,21 @@
+-- Migration: Add Weighted Search Vector
+-- Date: 2026-10-18
+-- Description: Store a weighted tsvector per job (title > company > description) and index it for full-text search
+
+-- Generated column: PostgreSQL recomputes it whenever title, company or
+-- description change, so every write path (including staged merges) keeps it current
+ALTER TABLE jobs
+ADD COLUMN IF NOT EXISTS search_vector tsvector
+GENERATED ALWAYS AS (
+    setweight(to_tsvector('english'::regconfig, COALESCE(title, '')), 'A') ||
+    setweight(to_tsvector('english'::regconfig, COALESCE(company, '')), 'B') ||
+    setweight(to_tsvector('english'::regconfig, COALESCE(description, '')), 'C')
+) STORED;
+
+-- Queries match against search_vector (search.py); the old expression index is never used
+DROP INDEX IF EXISTS idx_jobs_fulltext;
+
+CREATE INDEX IF NOT EXISTS idx_jobs_search_vector
+ON jobs USING GIN(search_vector);
+
+COMMENT ON COLUMN jobs.search_vector IS 'Weighted full-text vector: title (A), company (B), description (C)';
@@ -0,0 +1,48 @@
+-- Migration: Backfill Job IDs
+-- Date: 2026-10-18
+-- Description: Recompute job_id for rows written before ids became sha256('<site>:<job_key>') (previously sha256('<apply_url>_<title>')), so upserts, reparse and full_refresh expiry match existing rows instead of inserting duplicates
+
+BEGIN;
+
+-- Rozee's job_key is 'rozee-job:<numeric id>' taken from the job URL path
+-- (RozeeScraper.job_key / extract_rozee_job_id), falling back to the stored
+-- external_job_id. job_id is the first 32 hex digits of the SHA-256.
+CREATE TEMP TABLE job_id_backfill ON COMMIT DROP AS
+SELECT id, old_job_id, new_job_id,
+       ROW_NUMBER() OVER (
+           PARTITION BY new_job_id
+           ORDER BY (old_job_id = new_job_id) DESC, scraped_at DESC, id
+       ) AS keep_rank
+FROM (
+    SELECT id, scraped_at, job_id AS old_job_id,
+           LEFT(encode(sha256(convert_to('rozee:rozee-job:' || numeric_id, 'UTF8')), 'hex'), 32) AS new_job_id
+    FROM (
+        SELECT id, scraped_at, job_id,
+               COALESCE(
+                   substring(split_part(split_part(apply_url, '#', 1), '?', 1) FROM '-jobs-([0-9]+)/?$'),
+                   NULLIF(external_job_id, '')
+               ) AS numeric_id
+        FROM jobs
+        WHERE source_site = 'rozee'
+    ) keyed
+    WHERE numeric_id IS NOT NULL
+) ids;
+
+-- Several rows of one job (URL variants, edited titles, or a row already
+-- written with the new id): one keeps the job, the rest are deactivated
+-- and keep their old ids so the unique job_id never collides
+UPDATE jobs
+SET is_active = false
+FROM job_id_backfill b
+WHERE jobs.id = b.id
+  AND b.keep_rank > 1
+  AND jobs.is_active;
+
+UPDATE jobs
+SET job_id = b.new_job_id
+FROM job_id_backfill b
+WHERE jobs.id = b.id
+  AND b.keep_rank = 1
+  AND jobs.job_id IS DISTINCT FROM b.new_job_id;
+
+COMMIT;
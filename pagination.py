@@ -0,0 +1,146 @@
+"""
+Keyset (cursor) pagination over jobs, newest first
+"""
+
+import os
+import json
+import base64
+import binascii
+import uuid
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+# Sort key (posted_date, scraped_at, id), newest first. A missing posted_date
+# sorts as the epoch so the row comparison below never meets a NULL; the
+# expression matches idx_jobs_active_keyset (migrations/add_jobs_keyset_index.sql)
+SORT_DATE_SQL = "COALESCE(posted_date, DATE '1970-01-01')"
+ORDER_BY_SQL = f"{SORT_DATE_SQL} DESC, scraped_at DESC, id DESC"
+AFTER_CURSOR_SQL = f"({SORT_DATE_SQL}, scraped_at, id) < (%s, %s, %s)"
+
+EPOCH = date(1970, 1, 1)
+
+# Deepest page still served with OFFSET; anything further needs a cursor
+MAX_OFFSET_PAGE = int(os.getenv('MAX_OFFSET_PAGE', '10'))
+
+
+class InvalidCursor(ValueError):
+    """Cursor token that can't be decoded, or an OFFSET page that is too deep"""
+
+
+def encode_cursor(row: Dict[str, Any]) -> str:
+    """
+    Opaque token for the position just after a row
+    
+    Args:
+        row: Job row with posted_date, scraped_at and id
+    
+    Returns:
+        URL-safe token
+    """
+    posted = row.get('posted_date') or EPOCH
+    if isinstance(posted, datetime):
+        posted = posted.date()
+    payload = [posted.isoformat(), row['scraped_at'].isoformat(), str(row['id'])]
+    raw = json.dumps(payload, separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(token: str) -> Tuple[date, datetime, uuid.UUID]:
+    """
+    Sort key encoded in a cursor token
+    
+    Args:
+        token: Token from encode_cursor
+    
+    Returns:
+        (posted_date, scraped_at, id)
+    
+    Raises:
+        InvalidCursor: If the token is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(token + '=' * (-len(token) % 4))
+        posted, scraped, job_id = json.loads(raw)
+        return date.fromisoformat(posted), datetime.fromisoformat(scraped), uuid.UUID(job_id)
+    except (binascii.Error, ValueError, TypeError, AttributeError) as e:
+        raise InvalidCursor(f"Invalid cursor: {token!r}") from e
+
+
+class PageRequest:
+    """
+    One page of a newest-first job listing
+    
+    With a cursor the page starts right after the cursor row (an index
+    range scan, so every page costs the same). Without one, pages up to
+    MAX_OFFSET_PAGE use OFFSET so numbered links keep working. Listings
+    not in ORDER_BY_SQL order (ranked search) pass keyset=False and only
+    get OFFSET pages.
+    """
+    
+    def __init__(self, cursor: Optional[str], page: int, per_page: int,
+                 max_offset_page: int = MAX_OFFSET_PAGE, keyset: bool = True):
+        """
+        Initialize page request
+        
+        Args:
+            cursor: Token from a previous page's next_cursor, or None/''
+            page: 1-based page number (used only without a cursor)
+            per_page: Rows per page
+            max_offset_page: Deepest page served with OFFSET
+            keyset: Rows come in ORDER_BY_SQL order, so cursors can be used
+        
+        Raises:
+            InvalidCursor: If the cursor is malformed or not supported, or page
+                is past max_offset_page
+        """
+        if cursor and not keyset:
+            raise InvalidCursor("Cursors are not supported for ranked search results")
+        self.keyset = keyset
+        self.has_more = False
+        self.after = decode_cursor(cursor) if cursor else None
+        self.page = max(1, page)
+        self.per_page = max(1, per_page)
+        if self.after is None and self.page > max_offset_page:
+            if not keyset:
+                raise InvalidCursor(f"Only the first {max_offset_page} pages of search results are available")
+            raise InvalidCursor(f"Pages past {max_offset_page} need a cursor (use next_cursor)")
+    
+    def where(self) -> Tuple[Optional[str], List[Any]]:
+        """
+        Extra WHERE condition for the cursor
+        
+        Returns:
+            (SQL or None, params)
+        """
+        if self.after is None:
+            return None, []
+        return AFTER_CURSOR_SQL, list(self.after)
+    
+    def limit(self) -> Tuple[str, List[Any]]:
+        """
+        LIMIT (and OFFSET) clause; one extra row is fetched to detect a next page
+        
+        Returns:
+            (SQL, params)
+        """
+        if self.after is not None:
+            return "LIMIT %s", [self.per_page + 1]
+        return "LIMIT %s OFFSET %s", [self.per_page + 1, (self.page - 1) * self.per_page]
+    
+    def finish(self, rows: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Trim the look-ahead row, set has_more and build the next cursor
+        
+        Args:
+            rows: Rows fetched with limit()
+        
+        Returns:
+            (rows for this page, next_cursor or None on the last page)
+        """
+        self.has_more = len(rows) > self.per_page
+        if not self.has_more:
+            return rows, None
+        rows = rows[:self.per_page]
+        if not self.keyset:
+            return rows, None
+        return rows, encode_cursor(rows[-1])
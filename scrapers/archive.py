@@ -0,0 +1,269 @@
+"""
+Append-only compressed archive of fetched pages (WARC-like segments + index)
+"""
+
+import os
+import json
+import gzip
+import logging
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import zstandard
+except ImportError:  # optional dependency, fall back to gzip members
+    zstandard = None
+
+try:
+    import fcntl
+except ImportError:  # not on Windows; appends are then only serialized within the process
+    fcntl = None
+
+logger = logging.getLogger('scraper.archive')
+
+INDEX_FILE = 'index.jsonl'
+LOCK_FILE = '.lock'
+
+
+class PageArchive:
+    """
+    Raw page archive
+    
+    Pages are appended to segment files as WARC-style response records. Each
+    record is compressed as its own zstd frame (or gzip member when zstandard
+    is not installed), so any record can be decompressed on its own from the
+    (segment, offset, length) stored in the JSON-lines index. Segments roll
+    over once they reach segment_max_bytes, and the oldest segments are
+    deleted once the archive exceeds max_bytes.
+    
+    Several processes (one scheduler per gunicorn worker) may append to the
+    same archive, so appends hold an exclusive flock on the archive's lock
+    file and take the record offset from the segment's size after writing.
+    """
+    
+    def __init__(self, archive_dir: str, segment_max_bytes: int = 256 * 1024 * 1024,
+                 max_bytes: int = 2 * 1024 * 1024 * 1024):
+        """
+        Initialize archive
+        
+        Args:
+            archive_dir: Directory holding segments and index (created if missing)
+            segment_max_bytes: Size after which a new segment is started
+            max_bytes: Total segment size after which the oldest segments are deleted
+        """
+        self.archive_dir = archive_dir
+        self.segment_max_bytes = segment_max_bytes
+        self.max_bytes = max(segment_max_bytes, max_bytes)
+        self.codec = 'zstd' if zstandard else 'gzip'
+        self._lock = threading.Lock()
+        self._compressor = zstandard.ZstdCompressor(level=6) if zstandard else None
+        os.makedirs(archive_dir, exist_ok=True)
+        self._segment = self._latest_segment()
+    
+    @property
+    def index_path(self) -> str:
+        return os.path.join(self.archive_dir, INDEX_FILE)
+    
+    def _segment_name(self, number: int) -> str:
+        suffix = 'zst' if self.codec == 'zstd' else 'gz'
+        return f'pages-{number:05d}.warc.{suffix}'
+    
+    def _segment_numbers(self) -> List[int]:
+        return sorted(
+            int(name[6:11]) for name in os.listdir(self.archive_dir)
+            if name.startswith('pages-') and name[6:11].isdigit()
+        )
+    
+    def _latest_segment(self) -> int:
+        numbers = self._segment_numbers()
+        return numbers[-1] if numbers else 1
+    
+    @contextmanager
+    def _exclusive(self) -> Iterator[None]:
+        """Hold the archive lock (thread lock, plus a flock shared with other processes)"""
+        with self._lock:
+            if fcntl is None:
+                yield
+                return
+            with open(os.path.join(self.archive_dir, LOCK_FILE), 'a') as lock_file:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+    
+    def _compress(self, data: bytes) -> bytes:
+        if self.codec == 'zstd':
+            return self._compressor.compress(data)
+        return gzip.compress(data)
+    
+    @staticmethod
+    def _decompress(data: bytes, codec: str) -> bytes:
+        if codec == 'zstd':
+            if not zstandard:
+                raise RuntimeError('zstandard is required to read zstd archive segments')
+            return zstandard.ZstdDecompressor().decompress(data)
+        return gzip.decompress(data)
+    
+    def append(self, url: str, response) -> None:
+        """
+        Append a response to the archive
+        
+        Args:
+            url: Requested URL
+            response: requests.Response
+        """
+        body = response.content
+        fetched_at = datetime.now(timezone.utc).isoformat()
+        content_type = response.headers.get('Content-Type', '')
+        header = (
+            'WARC/1.0\r\n'
+            'WARC-Type: response\r\n'
+            f'WARC-Target-URI: {url}\r\n'
+            f'WARC-Date: {fetched_at}\r\n'
+            f'Content-Type: {content_type}\r\n'
+            f'Content-Length: {len(body)}\r\n'
+            '\r\n'
+        ).encode('utf-8')
+        record = self._compress(header + body + b'\r\n\r\n')
+        
+        with self._exclusive():
+            # Another process may have rolled over to a newer segment
+            self._segment = max(self._segment, self._latest_segment())
+            segment = self._segment_name(self._segment)
+            path = os.path.join(self.archive_dir, segment)
+            try:
+                fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+                try:
+                    os.write(fd, record)
+                    end = os.fstat(fd).st_size
+                finally:
+                    os.close(fd)
+                offset = end - len(record)
+                entry = {
+                    'url': url,
+                    'segment': segment,
+                    'offset': offset,
+                    'length': len(record),
+                    'codec': self.codec,
+                    'status': response.status_code,
+                    'encoding': response.encoding,
+                    'content_type': content_type,
+                    'fetched_at': fetched_at,
+                }
+                with open(self.index_path, 'a', encoding='utf-8') as f:
+                    f.write(json.dumps(entry) + '\n')
+            except OSError as e:
+                logger.warning(f"Could not archive {url}: {e}")
+                return
+            
+            if end >= self.segment_max_bytes:
+                self._segment += 1
+                self._prune()
+    
+    def _prune(self):
+        """Delete the oldest segments (and their index entries) while over max_bytes; caller holds the lock"""
+        numbers = self._segment_numbers()
+        sizes = {n: os.path.getsize(os.path.join(self.archive_dir, self._segment_name(n))) for n in numbers}
+        total = sum(sizes.values())
+        removed = set()
+        for number in numbers:
+            if total <= self.max_bytes or number >= self._segment - 1:
+                break
+            name = self._segment_name(number)
+            try:
+                os.remove(os.path.join(self.archive_dir, name))
+            except OSError as e:
+                logger.warning(f"Could not prune archive segment {name}: {e}")
+                break
+            total -= sizes[number]
+            removed.add(name)
+        
+        if not removed:
+            return
+        
+        tmp_path = self.index_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for entry in self.iter_index():
+                if entry.get('segment') not in removed:
+                    f.write(json.dumps(entry) + '\n')
+        os.replace(tmp_path, self.index_path)
+        logger.info(f"Pruned {len(removed)} archive segments (archive over {self.max_bytes // (1024 * 1024)}MB)")
+    
+    def iter_index(self) -> Iterator[Dict[str, Any]]:
+        """Yield index entries in append order"""
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        yield json.loads(line)
+                    except ValueError:
+                        # Torn write from a crash; skip it
+                        continue
+        except FileNotFoundError:
+            return
+    
+    def latest_records(self, url_filter: Optional[Callable[[str], bool]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Most recent index entry per URL
+        
+        Args:
+            url_filter: Optional predicate selecting which URLs to keep
+        
+        Returns:
+            Dictionary of url -> index entry
+        """
+        latest = {}
+        for entry in self.iter_index():
+            if entry.get('status') != 200:
+                continue
+            if url_filter and not url_filter(entry['url']):
+                continue
+            latest[entry['url']] = entry
+        return latest
+    
+    def read(self, entry: Dict[str, Any]) -> Tuple[Dict[str, str], bytes]:
+        """
+        Read one record back
+        
+        Args:
+            entry: Index entry
+        
+        Returns:
+            Tuple of (record headers, body bytes)
+        """
+        with open(os.path.join(self.archive_dir, entry['segment']), 'rb') as f:
+            f.seek(entry['offset'])
+            data = self._decompress(f.read(entry['length']), entry.get('codec', 'gzip'))
+        
+        head, _, rest = data.partition(b'\r\n\r\n')
+        headers = {}
+        for line in head.decode('utf-8', 'replace').split('\r\n')[1:]:
+            name, _, value = line.partition(':')
+            headers[name.strip()] = value.strip()
+        length = int(headers.get('Content-Length', len(rest)))
+        return headers, rest[:length]
+    
+    def read_text(self, entry: Dict[str, Any]) -> str:
+        """Read a record body decoded with the encoding seen at fetch time"""
+        _, body = self.read(entry)
+        return body.decode(entry.get('encoding') or 'utf-8', 'replace')
+
+
+def archive_from_env() -> Optional[PageArchive]:
+    """Build the page archive from PAGE_ARCHIVE_DIR / PAGE_ARCHIVE_SEGMENT_MB / PAGE_ARCHIVE_MAX_MB (off unless a dir is set)"""
+    archive_dir = os.getenv('PAGE_ARCHIVE_DIR', '')
+    if not archive_dir:
+        return None
+    segment_mb = float(os.getenv('PAGE_ARCHIVE_SEGMENT_MB', '256'))
+    max_mb = float(os.getenv('PAGE_ARCHIVE_MAX_MB', '2048'))
+    try:
+        return PageArchive(archive_dir, int(segment_mb * 1024 * 1024), int(max_mb * 1024 * 1024))
+    except OSError as e:
+        logger.warning(f"Page archive disabled, cannot use {archive_dir}: {e}")
+        return None
@@ -3,12 +3,14 @@ Base scraper class providing common functionality for all job site scrapers
 """
 
 import os
+import re
 import time
 import logging
 import hashlib
+import threading
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterable, List, Optional, Any, Set
 from urllib.parse import urljoin, urlparse
 
 import requests
@@ -17,8 +19,25 @@ import psycopg
 from psycopg.rows import dict_row
 from dotenv import load_dotenv
 
+from .session import get_session, build_session, enable_dns_cache, connection_stats, session_settings
+from .ratelimit import get_rate_limiter
+from .retry import RetryPolicy, RETRYABLE_STATUSES, CircuitBreaker, get_circuit_breaker
+from .httpcache import cache_from_env
+from .archive import archive_from_env
+from .fixtures import FixtureRecorder, ReplayAdapter, fixture_settings
+from .parsing import get_backend, HtmlParserBackend
+from .parsepool import ParsePool, PARSE_STATS
+from .extraction import ExtractionSpec
+from .frontier import URLFrontier
+from .known_urls import KnownURLIndex
+from .writebuffer import WriteBuffer, statement_chunks
+from .writer import BackgroundWriter
+from .urls import canonicalize_url
+
 load_dotenv()
 
+WHITESPACE_RE = re.compile(r'\s+')
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
@@ -31,6 +50,57 @@ class BaseScraper(ABC):
     Provides common functionality: database connection, HTTP requests, logging, etc.
     """
     
+    # Declarative field-extraction spec for job pages (see scrapers.extraction)
+    EXTRACTION_SPEC: Optional[Dict[str, Any]] = None
+    
+    # Fields whose (normalized) values make up a job's content_hash
+    CONTENT_HASH_FIELDS = ('title', 'company', 'salary', 'salary_min', 'salary_max',
+                           'application_deadline', 'description')
+    
+    # Columns a refresh never overwrites on an existing row
+    REFRESH_KEEP_COLUMNS = ('job_id', 'posted_date')
+    
+    # Columns a refresh always overwrites; every other column keeps its stored
+    # value when this fetch didn't find the field (NULL, or no skills)
+    REFRESH_OVERWRITE_COLUMNS = ('source_site', 'apply_url', 'title', 'company',
+                                 'salary_currency', 'total_positions', 'is_active', 'content_hash')
+    
+    # Every job row is written with exactly these columns, in this order, so
+    # the insert statement text (and its prepared plan) never changes shape.
+    # Fields a parser didn't find get the default here.
+    JOB_COLUMNS = (
+        ('job_id', None),
+        ('source_site', None),
+        ('apply_url', None),
+        ('external_job_id', None),
+        ('title', None),
+        ('company', None),
+        ('location', None),
+        ('description', None),
+        ('job_type', None),
+        ('posted_date', None),
+        ('application_deadline', None),
+        ('salary', None),
+        ('salary_currency', 'PKR'),
+        ('salary_period', None),
+        ('experience_level', None),
+        ('minimum_experience', None),
+        ('industry', None),
+        ('functional_area', None),
+        ('career_level', None),
+        ('job_shift', None),
+        ('total_positions', 1),
+        ('minimum_education', None),
+        ('degree_title', None),
+        ('gender', None),
+        ('age_range', None),
+        ('company_logo_url', None),
+        ('company_profile_url', None),
+        ('skills', ()),
+        ('is_active', True),
+        ('content_hash', None),
+    )
+    
     def __init__(self, site_name: str, base_url: str):
         """
         Initialize base scraper
@@ -39,16 +109,89 @@ class BaseScraper(ABC):
             site_name: Name of the job site (e.g., 'rozee', 'mustakbil')
             base_url: Base URL of the site
         """
-        self.site_name = site_name
-        self.base_url = base_url
-        self.logger = logging.getLogger(f'scraper.{site_name}')
+        self.init_parse_state(site_name, base_url)
         
         # Configuration from environment
         self.user_agent = os.getenv('USER_AGENT', 'Mozilla/5.0 (compatible; PakJobsBot/1.0)')
-        self.scrape_delay = int(os.getenv('SCRAPE_DELAY_SECONDS', '3'))
+        self.scrape_delay = float(os.getenv('SCRAPE_DELAY_SECONDS', '3'))
+        self.scrape_burst = float(os.getenv('SCRAPE_BURST', '1'))
         self.max_pages = int(os.getenv('MAX_SCRAPE_PAGES', '50'))
+        self.fetch_concurrency = int(os.getenv('DETAIL_FETCH_CONCURRENCY', '8'))
+        self.fetch_per_host = int(os.getenv('DETAIL_FETCH_PER_HOST', '4'))
+        self.discovery_workers = int(os.getenv('PIPELINE_DISCOVERY_WORKERS', '2'))
+        self.pipeline_queue_size = int(os.getenv('PIPELINE_QUEUE_SIZE', '100'))
+        self.progress_interval = float(os.getenv('PIPELINE_PROGRESS_SECONDS', '2'))
+        self.existence_batch_size = int(os.getenv('EXISTENCE_BATCH_SIZE', '500'))
+        self.request_timeout = float(os.getenv('HTTP_TIMEOUT_SECONDS', '30'))
+        self.retry_policy = RetryPolicy.from_env()
         self.database_url = os.getenv('DATABASE_URL')
         
+        # Pooled keep-alive HTTP session (per scraper, or process-wide if shared)
+        http_settings = session_settings()
+        self.session_shared = http_settings['shared']
+        self.session = get_session(http_settings['pool_size'], shared=self.session_shared)
+        enable_dns_cache(http_settings['dns_cache_ttl'])
+        self._http_baseline = connection_stats(self.session)
+        
+        # Per-domain token bucket shared with every other scraper in the process
+        self.rate_limiter = get_rate_limiter(urlparse(base_url).hostname, self.scrape_delay, self.scrape_burst)
+        
+        # Record/replay fixtures (HTTP_FIXTURE_MODE=record|replay)
+        self.fixture_mode = None
+        self.fixture_recorder = None
+        fixtures = fixture_settings()
+        if fixtures['mode'] == 'replay':
+            # Private session whose transport serves the recorded bundle, never the network
+            self.fixture_mode = 'replay'
+            self.session = build_session(http_settings['pool_size'])
+            self.session_shared = False
+            replay = ReplayAdapter(fixtures['bundle_dir'], fixtures['latency'])
+            self.session.mount('http://', replay)
+            self.session.mount('https://', replay)
+        elif fixtures['mode'] == 'record':
+            self.fixture_mode = 'record'
+            self.fixture_recorder = FixtureRecorder(fixtures['bundle_dir'])
+        
+        # Conditional-request cache (used for listing pages); off with fixtures so
+        # recordings hold full pages and replays don't depend on local cache state
+        self.http_cache = None if self.fixture_mode else cache_from_env()
+        
+        # Raw page archive (enables offline reparse runs)
+        self.page_archive = None if self.fixture_mode == 'replay' else archive_from_env()
+        self.reparse_workers = int(os.getenv('REPARSE_WORKERS', '0')) or os.cpu_count() or 1
+        
+        # Persisted URL frontier (pending detail fetches survive interrupted runs)
+        frontier_dir = os.getenv('FRONTIER_DIR', '.cache/frontier')
+        self.frontier_path = os.path.join(frontier_dir, f'{site_name}.json') if frontier_dir else None
+        
+        # Known-URL Bloom filter, rebuilt from the jobs table every run
+        self.known_urls_error_rate = float(os.getenv('KNOWN_URLS_ERROR_RATE', '0.001'))
+        self.known_urls = None
+        
+        # Optional process pool for detail-page parsing (PARSE_WORKERS=0 parses inline)
+        self.parse_workers = int(os.getenv('PARSE_WORKERS', '0'))
+        self.parse_stage_workers = int(os.getenv('PIPELINE_PARSE_WORKERS', '0')) or self.parse_workers or 2
+        self.parse_pool = None
+        
+        # Set by run(): full_refresh and reparse update stored jobs whose content changed
+        self.refresh_existing = False
+        
+        # Fixed write schema, and statements prepared on the current connection
+        self.job_column_names = tuple(column for column, _ in self.JOB_COLUMNS)
+        self.dropped_columns = set()
+        self.prepared_statements = set()
+        
+        # New jobs are written in batches (WRITE_BATCH_SIZE=1 writes each row immediately),
+        # on a background thread with its own connection unless WRITE_BEHIND=false
+        self.write_behind = os.getenv('WRITE_BEHIND', 'true').lower() == 'true'
+        self.write_queue_batches = int(os.getenv('WRITE_QUEUE_BATCHES', '4'))
+        self.writer = None
+        self.write_buffer = WriteBuffer(
+            self.dispatch_jobs,
+            batch_size=int(os.getenv('WRITE_BATCH_SIZE', '200')),
+            flush_seconds=float(os.getenv('WRITE_FLUSH_SECONDS', '5'))
+        )
+        
         # Scraping statistics
         self.stats = {
             'jobs_found': 0,
@@ -56,32 +199,192 @@ class BaseScraper(ABC):
             'jobs_updated': 0,
             'jobs_skipped': 0,
             'errors': 0,
+            'http_requests': 0,
+            'http_connections_opened': 0,
+            'http_connections_reused': 0,
+            'dns_cache_hits': 0,
+            'rate_limit_rps': self.rate_limiter.effective_rate(),
+            'retries': 0,
+            'timeouts': 0,
+            'breaker_open': 0,
+            'http_cache_hits': 0,
+            'http_cache_misses': 0,
+            'http_cache_not_modified': 0,
+            'pages_parsed': 0,
+            'parse_time_ms': 0,
+            'parse_fast_path': 0,
+            'parse_fallback': 0,
+            'db_lookups_avoided': 0,
+            'known_url_false_positives': 0,
+            'existence_queries': 0,
+            'write_batches': 0,
+            'prepared_statement_hits': 0,
+            'prepared_statement_misses': 0,
+            'jobs_expired': 0,
         }
         
         # Database connection
         self.conn = None
         self.cursor = None
         
+        # Connection used by write_jobs: the main one, or the write-behind thread's
+        self.write_conn = None
+        self.write_cursor = None
+        
+        # full_refresh staging tables (on the write connection) and whether
+        # jobs_seen covers the whole run
+        self.staging = False
+        self.seen_complete = False
+        
         # Stop signal (can be set externally)
         self.should_stop = lambda: False
         
         # Progress callback (can be set externally)
         self.progress_callback = None
         
+    def init_parse_state(self, site_name: str, base_url: str):
+        """
+        Set up what parse_job_page needs: parser backend, extraction rules and stats lock
+        
+        Args:
+            site_name: Name of the job site
+            base_url: Base URL of the site
+        """
+        self.site_name = site_name
+        self.base_url = base_url
+        self.logger = logging.getLogger(f'scraper.{site_name}')
+        
+        # Detail-page parser backend (HTML_PARSER_BACKEND=lxml|selectolax|html.parser)
+        self.parser_backend = get_backend()
+        self.soup_features = 'html.parser' if isinstance(self.parser_backend, HtmlParserBackend) else 'lxml'
+        
+        # Field extraction rules, compiled once per scraper
+        self.extraction = ExtractionSpec(self.EXTRACTION_SPEC) if self.EXTRACTION_SPEC else None
+        
+        # Stats may be updated from fetch worker threads
+        self.stats_lock = threading.Lock()
+    
+    @classmethod
+    def for_parsing(cls, site_name: str, base_url: str) -> 'BaseScraper':
+        """
+        Scraper that can only parse pages (used by parse worker processes)
+        
+        Skips __init__, so no HTTP session, DNS cache, HTTP cache, page
+        archive, fixtures or database state is created.
+        
+        Args:
+            site_name: Name of the job site
+            base_url: Base URL of the site
+            
+        Returns:
+            Scraper instance with parse state and parse counters only
+        """
+        scraper = cls.__new__(cls)
+        scraper.init_parse_state(site_name, base_url)
+        scraper.stats = dict.fromkeys(PARSE_STATS, 0)
+        return scraper
+    
     def update_progress(self, message: str, progress: int = None):
         """Update progress via callback if available"""
         if self.progress_callback:
             self.progress_callback(message, progress, self.stats.copy())
         
+    def incr_stat(self, key: str, amount: int = 1):
+        """Thread-safe increment of a stats counter"""
+        with self.stats_lock:
+            self.stats[key] = self.stats.get(key, 0) + amount
+    
+    def record_parse_time(self, started: float):
+        """
+        Count one parsed page and the time spent on it
+        
+        Args:
+            started: time.perf_counter() value taken before parsing
+        """
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        with self.stats_lock:
+            self.stats['pages_parsed'] += 1
+            self.stats['parse_time_ms'] += round(elapsed_ms)
+    
+    def merge_parse_stats(self, metrics: Dict[str, int]):
+        """Add parse counters reported by a parse worker process"""
+        metrics = dict(metrics)
+        fields = metrics.pop('fields', None)
+        if fields and self.extraction:
+            self.extraction.merge(fields)
+        with self.stats_lock:
+            for key, value in metrics.items():
+                self.stats[key] = self.stats.get(key, 0) + value
+    
     def connect_db(self):
         """Establish database connection"""
         try:
             self.conn = psycopg.connect(self.database_url)
             self.cursor = self.conn.cursor()
+            self.use_write_connection(self.conn)
             self.logger.info(f"Database connected for {self.site_name}")
         except Exception as e:
             self.logger.error(f"Database connection failed: {e}")
             raise
+        
+        self.load_scrape_config()
+    
+    def load_scrape_config(self):
+        """
+        Apply scrape_delay_seconds from user_config when SCRAPE_DELAY_SECONDS is not set
+        """
+        if 'SCRAPE_DELAY_SECONDS' in os.environ:
+            return
+        
+        try:
+            self.cursor.execute(
+                "SELECT config_value FROM user_config WHERE config_key = 'scrape_delay_seconds'"
+            )
+            row = self.cursor.fetchone()
+            if row and row[0]:
+                self.scrape_delay = float(row[0])
+                self.rate_limiter = get_rate_limiter(
+                    urlparse(self.base_url).hostname, self.scrape_delay, self.scrape_burst
+                )
+                self.logger.info(f"Using scrape delay from user_config: {self.scrape_delay}s")
+        except Exception as e:
+            self.logger.debug(f"Could not read scrape_delay_seconds from user_config: {e}")
+            self.conn.rollback()
+    
+    def build_known_urls(self):
+        """
+        Load every stored apply_url into the known-URL Bloom filter
+        
+        Streams the column through a server-side cursor. On failure the
+        index stays off and job_exists queries the database for every URL.
+        """
+        started = time.perf_counter()
+        try:
+            self.cursor.execute("SELECT count(*) FROM jobs")
+            stored = self.cursor.fetchone()[0]
+            
+            with self.conn.cursor(name='known_urls') as cur:
+                cur.itersize = 10000
+                cur.execute("SELECT apply_url FROM jobs WHERE apply_url IS NOT NULL")
+                self.known_urls = KnownURLIndex.build(
+                    (self.canonical_url(row[0]) or row[0] for row in cur),
+                    capacity=int(stored * 1.2) + 10000,
+                    error_rate=self.known_urls_error_rate
+                )
+            self.conn.commit()
+            
+            elapsed = time.perf_counter() - started
+            self.logger.info(f"Known-URL index built from {stored} jobs in {elapsed:.2f}s")
+        except Exception as e:
+            self.logger.warning(f"Known-URL index unavailable, checking every URL in the database: {e}")
+            self.conn.rollback()
+            self.close_known_urls()
+    
+    def close_known_urls(self):
+        """Release the known-URL index"""
+        if self.known_urls:
+            self.known_urls.close()
+            self.known_urls = None
     
     def close_db(self):
         """Close database connection"""
@@ -91,13 +394,53 @@ class BaseScraper(ABC):
             self.conn.close()
             self.logger.info(f"Database connection closed for {self.site_name}")
     
-    def make_request(self, url: str, method: str = 'GET', **kwargs) -> Optional[requests.Response]:
+    def update_http_stats(self):
+        """Copy connection reuse counters for this run into stats"""
+        current = connection_stats(self.session)
+        delta = {key: current[key] - self._http_baseline.get(key, 0) for key in current}
+        self.stats['http_requests'] = delta['http_requests']
+        self.stats['http_connections_opened'] = delta['http_connections_opened']
+        self.stats['http_connections_reused'] = max(0, delta['http_requests'] - delta['http_connections_opened'])
+        self.stats['dns_cache_hits'] = delta['dns_cache_hits']
+    
+    def update_field_stats(self):
+        """Copy per-field extraction hit rates and timings into stats"""
+        if self.extraction:
+            self.stats['field_stats'] = self.extraction.report()
+    
+    def open_frontier(self) -> URLFrontier:
+        """
+        Create this run's URL frontier, restoring URLs left pending by the last run
+        
+        Returns:
+            URLFrontier
         """
-        Make HTTP request with error handling and rate limiting
+        frontier = URLFrontier(self.frontier_path)
+        restored = frontier.load()
+        if restored:
+            self.logger.info(f"Resuming {restored} pending job URLs from the previous run")
+        return frontier
+    
+    def close_session(self):
+        """Close the HTTP session unless it is shared with other scrapers"""
+        if self.session and not self.session_shared:
+            self.session.close()
+    
+    def make_request(self, url: str, method: str = 'GET', conditional: bool = False,
+                     **kwargs) -> Optional[requests.Response]:
+        """
+        Make HTTP request with error handling, rate limiting and retries
+        
+        Idempotent requests are retried with jittered exponential backoff on
+        timeouts, connection errors and 429/5xx responses. Requests to a host
+        whose circuit breaker is open fail immediately. Replayed fixtures skip
+        the rate limiter, backoff sleeps and the shared circuit breaker.
         
         Args:
             url: URL to request
             method: HTTP method (GET/POST)
+            conditional: Revalidate against the HTTP cache; the response may
+                then be a 304 (see cached_extraction)
             **kwargs: Additional arguments for requests
             
         Returns:
@@ -105,22 +448,122 @@ class BaseScraper(ABC):
         """
         headers = kwargs.get('headers', {})
         headers['User-Agent'] = self.user_agent
+        
+        if conditional and self.http_cache:
+            entry = self.http_cache.lookup(url)
+            if entry:
+                self.incr_stat('http_cache_hits')
+                headers.update(self.http_cache.conditional_headers(entry))
+            else:
+                self.incr_stat('http_cache_misses')
+        
         kwargs['headers'] = headers
+        kwargs.setdefault('timeout', self.request_timeout)
         
-        try:
-            # Rate limiting
-            time.sleep(self.scrape_delay)
+        # Replayed responses come from disk: no pacing, and they must not
+        # trip (or reset) the process-wide breaker of the live host
+        replay = self.fixture_mode == 'replay'
+        limiter = None if replay else self.rate_limiter_for(url)
+        breaker = CircuitBreaker() if replay else get_circuit_breaker(urlparse(url).hostname)
+        attempts = self.retry_policy.attempts_for(method)
+        last_error = None
+        
+        for attempt in range(attempts):
+            if attempt > 0:
+                self.incr_stat('retries')
+                if not replay:
+                    time.sleep(self.retry_policy.backoff(attempt - 1))
             
-            response = requests.request(method, url, timeout=30, **kwargs)
-            response.raise_for_status()
+            if not breaker.allow_request():
+                self.logger.warning(f"Circuit open for {urlparse(url).hostname}, skipping {url}")
+                self.incr_stat('breaker_open')
+                self.incr_stat('errors')
+                return None
             
-            self.logger.debug(f"Successfully fetched: {url}")
-            return response
+            try:
+                # Rate limiting (shared token bucket per domain)
+                if limiter:
+                    limiter.acquire()
+                
+                response = self.session.request(method, url, **kwargs)
+                if self.fixture_recorder:
+                    self.fixture_recorder.record(method, url, response)
+                if limiter:
+                    limiter.on_response(response.status_code, response.headers.get('Retry-After'))
+                    self.stats['rate_limit_rps'] = limiter.effective_rate()
+                
+                if response.status_code in RETRYABLE_STATUSES:
+                    # 429 means the host is up but busy; only 5xx counts against the breaker
+                    if response.status_code == 429:
+                        breaker.record_success()
+                    else:
+                        breaker.record_failure()
+                    last_error = f"HTTP {response.status_code}"
+                    self.logger.warning(f"{last_error} for {url} (attempt {attempt + 1}/{attempts})")
+                    continue
+                
+                breaker.record_success()
+                response.raise_for_status()
+                
+                if response.status_code == 304:
+                    self.incr_stat('http_cache_not_modified')
+                elif self.page_archive and method.upper() == 'GET':
+                    self.page_archive.append(url, response)
+                
+                self.logger.debug(f"Successfully fetched: {url}")
+                return response
+                
+            except requests.Timeout as e:
+                self.incr_stat('timeouts')
+                breaker.record_failure()
+                last_error = e
+                self.logger.warning(f"Timeout for {url} (attempt {attempt + 1}/{attempts})")
+            except requests.ConnectionError as e:
+                breaker.record_failure()
+                last_error = e
+                self.logger.warning(f"Connection error for {url} (attempt {attempt + 1}/{attempts}): {e}")
+            except requests.RequestException as e:
+                # Other client errors (4xx, invalid URL, ...) are not worth retrying
+                breaker.release_probe()
+                self.logger.error(f"Request failed for {url}: {e}")
+                self.incr_stat('errors')
+                return None
+            except Exception:
+                # Never leave a half-open breaker waiting on a probe that is gone
+                breaker.release_probe()
+                raise
+        
+        self.logger.error(f"Request failed for {url} after {attempts} attempt(s): {last_error}")
+        self.incr_stat('errors')
+        return None
+    
+    def cached_extraction(self, url: str, response: requests.Response) -> Optional[Any]:
+        """
+        Get what was extracted from a page last time, if the server says it is unchanged
+        
+        Args:
+            url: URL that was requested with conditional=True
+            response: The response to that request
             
-        except requests.RequestException as e:
-            self.logger.error(f"Request failed for {url}: {e}")
-            self.stats['errors'] += 1
+        Returns:
+            Previously stored extraction result, or None if the page must be parsed
+        """
+        if response.status_code != 304 or not self.http_cache:
             return None
+        entry = self.http_cache.lookup(url)
+        return entry.get('extracted') if entry else None
+    
+    def cache_extraction(self, url: str, response: requests.Response, extracted: Any):
+        """Store a freshly parsed page's extraction result alongside its validators"""
+        if self.http_cache and response.status_code == 200:
+            self.http_cache.store(url, response, extracted)
+    
+    def rate_limiter_for(self, url: str):
+        """Get the shared rate limiter for the URL's domain"""
+        host = urlparse(url).hostname
+        if host == urlparse(self.base_url).hostname:
+            return self.rate_limiter
+        return get_rate_limiter(host, self.scrape_delay, self.scrape_burst)
     
     def parse_html(self, html: str) -> Optional[BeautifulSoup]:
         """
@@ -133,23 +576,52 @@ class BaseScraper(ABC):
             BeautifulSoup object or None
         """
         try:
-            return BeautifulSoup(html, 'lxml')
+            return BeautifulSoup(html, self.soup_features)
         except Exception as e:
             self.logger.error(f"HTML parsing failed: {e}")
             return None
     
+    def canonical_url(self, url: str) -> str:
+        """
+        Canonical form of a URL on this site (see scrapers.urls.canonicalize_url)
+        
+        Args:
+            url: Absolute or site-relative URL
+            
+        Returns:
+            Canonical URL ('' if invalid)
+        """
+        return canonicalize_url(url, self.base_url)
+    
+    def job_key(self, apply_url: str) -> str:
+        """
+        Stable identity of a job posting - override when the site has numeric job ids
+        
+        Args:
+            apply_url: Job posting URL
+            
+        Returns:
+            Key that is the same for every URL variant of the job
+        """
+        return self.canonical_url(apply_url)
+    
     def generate_job_id(self, apply_url: str, title: str) -> str:
         """
-        Generate unique job ID based on URL and title
+        Generate unique job ID from the job's canonical key
+        
+        The title is no longer part of the key, so query strings, trailing
+        slashes or an edited title never produce a second row for one job.
+        Rows written under the old apply_url/title scheme are rekeyed by
+        migrations/backfill_job_ids.sql; keep the two in step.
         
         Args:
             apply_url: Original job posting URL
-            title: Job title
+            title: Job title (kept for compatibility, not hashed)
             
         Returns:
             SHA-256 hash string
         """
-        unique_string = f"{apply_url}_{title}"
+        unique_string = f"{self.site_name}:{self.job_key(apply_url)}"
         return hashlib.sha256(unique_string.encode()).hexdigest()[:32]
     
     def job_exists(self, apply_url: str) -> bool:
@@ -162,108 +634,561 @@ class BaseScraper(ABC):
         Returns:
             True if exists, False otherwise
         """
+        apply_url = self.canonical_url(apply_url) or apply_url
+        if self.known_urls:
+            # Inserted this run: definitely stored
+            if self.known_urls.is_known(apply_url):
+                self.incr_stat('db_lookups_avoided')
+                return True
+            # Bloom negative: definitely not stored
+            if not self.known_urls.might_exist(apply_url):
+                self.incr_stat('db_lookups_avoided')
+                return False
+        
         try:
             self.cursor.execute(
                 "SELECT id FROM jobs WHERE apply_url = %s",
                 (apply_url,)
             )
-            return self.cursor.fetchone() is not None
+            exists = self.cursor.fetchone() is not None
+            if self.known_urls and not exists:
+                self.incr_stat('known_url_false_positives')
+            return exists
         except Exception as e:
             self.logger.error(f"Error checking job existence: {e}")
             return False
     
+    def known_job_urls(self, urls: Iterable[str]) -> Set[str]:
+        """
+        Bulk version of job_exists: which of these URLs are already stored
+        
+        URLs the known-URL index can answer on its own never reach the
+        database; the rest are checked with one "= ANY" query per
+        EXISTENCE_BATCH_SIZE URLs instead of one query each.
+        
+        Args:
+            urls: Job URLs (raw or canonical)
+            
+        Returns:
+            Set of canonical URLs that already exist
+        """
+        known = set()
+        candidates = []
+        for url in dict.fromkeys(self.canonical_url(url) or url for url in urls):
+            if self.known_urls:
+                if self.known_urls.is_known(url):
+                    known.add(url)
+                    self.incr_stat('db_lookups_avoided')
+                    continue
+                if not self.known_urls.might_exist(url):
+                    self.incr_stat('db_lookups_avoided')
+                    continue
+            candidates.append(url)
+        
+        batch_size = max(1, self.existence_batch_size)
+        for start in range(0, len(candidates), batch_size):
+            batch = candidates[start:start + batch_size]
+            try:
+                self.cursor.execute(
+                    "SELECT apply_url FROM jobs WHERE apply_url = ANY(%s)",
+                    (batch,)
+                )
+                found = {row[0] for row in self.cursor.fetchall()}
+            except Exception as e:
+                # Treat the batch as new; insert_job's ON CONFLICT still prevents duplicates
+                self.logger.error(f"Error checking job existence for {len(batch)} URLs: {e}")
+                self.conn.rollback()
+                continue
+            self.incr_stat('existence_queries')
+            if self.known_urls:
+                self.incr_stat('known_url_false_positives', len(batch) - len(found))
+            known.update(found)
+        
+        return known
+    
+    def prepare_job(self, job_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Validate a job and fill in job_id, canonical URL and defaults
+        
+        Args:
+            job_data: Dictionary with job fields (modified in place)
+            
+        Returns:
+            The job row (see normalize_job), or None if it was rejected
+        """
+        # Required fields
+        required_fields = ['source_site', 'apply_url', 'title', 'company']
+        for field in required_fields:
+            if field not in job_data:
+                self.logger.error(f"Missing required field: {field}")
+                return None
+        
+        # Validate data quality
+        invalid_titles = ['Recommended Jobs', 'Similar Jobs', 'Jobs', 'Related Jobs', 'Popular Jobs', 'All Jobs']
+        if job_data['title'] in invalid_titles:
+            self.logger.warning(f"Rejected invalid title: {job_data['title']}")
+            self.incr_stat('errors')
+            return None
+        
+        # Validate URL doesn't have obvious issues and store its canonical form
+        url = self.canonical_url(job_data['apply_url'])
+        if not url or ' ' in url:
+            self.logger.warning(f"Rejected malformed URL: {job_data['apply_url']}")
+            self.incr_stat('errors')
+            return None
+        job_data['apply_url'] = url
+        
+        # Generate job_id
+        job_data['job_id'] = self.generate_job_id(job_data['apply_url'], job_data['title'])
+        
+        # Set defaults
+        job_data.setdefault('posted_date', datetime.now().date())
+        job_data.setdefault('is_active', True)
+        
+        # Skills should be array, not JSON string
+        if 'skills' not in job_data:
+            job_data['skills'] = []
+        elif not isinstance(job_data['skills'], list):
+            job_data['skills'] = []
+        
+        job_data['content_hash'] = self.content_hash(job_data)
+        return self.normalize_job(job_data)
+    
+    def normalize_job(self, job_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Project a job onto JOB_COLUMNS, filling defaults for missing fields
+        
+        Args:
+            job_data: Validated job fields
+            
+        Returns:
+            Row with exactly the JOB_COLUMNS keys, in order
+        """
+        unknown = job_data.keys() - self.job_column_names - self.dropped_columns
+        if unknown:
+            self.dropped_columns.update(unknown)
+            self.logger.warning(f"Dropping fields not in JOB_COLUMNS: {', '.join(sorted(unknown))}")
+        
+        row = {}
+        for column, default in self.JOB_COLUMNS:
+            value = job_data.get(column)
+            if value is None:
+                value = list(default) if isinstance(default, tuple) else default
+            row[column] = value
+        return row
+    
+    def content_hash(self, job_data: Dict[str, Any]) -> str:
+        """
+        Fingerprint of the parts of a posting that matter to readers
+        
+        Values are whitespace-collapsed and lowercased first, so markup or
+        spacing changes on the site don't count as edits.
+        
+        Args:
+            job_data: Job fields
+            
+        Returns:
+            SHA-256 hex digest
+        """
+        parts = []
+        for field in self.CONTENT_HASH_FIELDS:
+            value = job_data.get(field)
+            parts.append(WHITESPACE_RE.sub(' ', str(value)).strip().lower() if value is not None else '')
+        return hashlib.sha256('\x1f'.join(parts).encode('utf-8')).hexdigest()
+    
     def insert_job(self, job_data: Dict[str, Any]) -> bool:
         """
-        Insert new job into database
+        Queue a new job for insertion
+        
+        The job is validated now and written with the next batch (see
+        write_jobs); jobs_new/jobs_updated/jobs_skipped are counted when
+        the batch is flushed.
         
         Args:
             job_data: Dictionary with job fields
             
         Returns:
-            True if successful, False otherwise
+            True if the job was accepted, False if it was rejected
         """
         try:
-            # Required fields
-            required_fields = ['source_site', 'apply_url', 'title', 'company']
-            for field in required_fields:
-                if field not in job_data:
-                    self.logger.error(f"Missing required field: {field}")
-                    return False
-            
-            # Validate data quality
-            invalid_titles = ['Recommended Jobs', 'Similar Jobs', 'Jobs', 'Related Jobs', 'Popular Jobs', 'All Jobs']
-            if job_data['title'] in invalid_titles:
-                self.logger.warning(f"Rejected invalid title: {job_data['title']}")
-                self.stats['errors'] += 1
-                return False
+            row = self.prepare_job(job_data)
+        except Exception as e:
+            self.logger.error(f"Error preparing job: {e}")
+            self.incr_stat('errors')
+            return False
+        if row is None:
+            return False
+        
+        self.write_buffer.add(row['job_id'], row)
+        return True
+    
+    def flush_jobs(self):
+        """Write any buffered jobs now (called at the end of a run and on stop)"""
+        if self.conn:
+            self.write_buffer.flush()
+        if self.writer:
+            self.writer.drain()
+    
+    def dispatch_jobs(self, rows: List[Dict[str, Any]]):
+        """Hand a flushed batch to the write-behind thread, or write it inline"""
+        if self.writer:
+            self.writer.submit(rows)
+        else:
+            self.write_jobs(rows)
+    
+    def use_write_connection(self, conn):
+        """
+        Point write_jobs at a connection (the main one, or the writer thread's)
+        
+        Args:
+            conn: psycopg connection
+        """
+        self.write_conn = conn
+        self.write_cursor = self.cursor if conn is self.conn else conn.cursor()
+        self.prepared_statements = set()
+        if self.staging:
+            # Temp tables died with the old connection, and so did the record
+            # of jobs seen so far; expiring now could hit jobs this run saw
+            self.seen_complete = False
+            self.create_staging_tables()
+    
+    def start_writer(self):
+        """Start the write-behind thread if WRITE_BEHIND is on"""
+        if not self.write_behind or self.writer:
+            return
+        try:
+            self.writer = BackgroundWriter(self, self.write_queue_batches)
+            self.writer.start()
+            self.logger.info("Writing jobs on a background connection")
+        except Exception as e:
+            self.logger.warning(f"Write-behind writer unavailable, writing inline: {e}")
+            self.writer = None
+            self.use_write_connection(self.conn)
+    
+    def close_writer(self):
+        """Write everything still buffered or queued, then stop the writer thread"""
+        try:
+            self.flush_jobs()
+        except Exception as e:
+            self.logger.error(f"Could not write buffered jobs: {e}")
+        self.staging = False
+        if self.writer:
+            self.writer.close()
+            self.writer = None
+            if self.conn:
+                self.use_write_connection(self.conn)
+    
+    def execute_prepared(self, query: str, params: List[Any]):
+        """
+        Execute a write statement as a server-side prepared statement
+        
+        psycopg prepares the statement on first use and reuses the plan for
+        the same text afterwards; hits and misses are counted in stats.
+        
+        Args:
+            query: SQL text
+            params: Bind parameters
+        """
+        if query in self.prepared_statements:
+            self.incr_stat('prepared_statement_hits')
+        else:
+            self.prepared_statements.add(query)
+            self.incr_stat('prepared_statement_misses')
+        self.write_cursor.execute(query, params, prepare=True)
+    
+    def insert_statement(self, columns: tuple, row_count: int) -> str:
+        """
+        Multi-row INSERT for prepared jobs
+        
+        New jobs are inserted. With refresh_existing set, a conflicting row
+        is updated only when its content_hash differs, so unchanged jobs
+        cost no write; otherwise conflicts are ignored.
+        
+        Args:
+            columns: Column names (the same for every row)
+            row_count: Number of rows in the VALUES list
             
-            # Validate URL doesn't have obvious issues
-            url = job_data['apply_url']
-            if ' ' in url or '//' in url.replace('https://', '').replace('http://', ''):
-                self.logger.warning(f"Rejected malformed URL: {url}")
-                self.stats['errors'] += 1
-                return False
+        Returns:
+            SQL returning (job_id, inserted) for every row written
+        """
+        placeholders = ', '.join(['(' + ', '.join(['%s'] * len(columns)) + ')'] * row_count)
+        query = f"INSERT INTO jobs ({', '.join(columns)}) VALUES {placeholders} "
+        return query + self.conflict_clause(columns)
+    
+    def conflict_clause(self, columns: tuple) -> str:
+        """
+        ON CONFLICT ... RETURNING tail shared by the VALUES and staging inserts
+        
+        Args:
+            columns: Columns being inserted
             
-            # Generate job_id
-            job_data['job_id'] = self.generate_job_id(job_data['apply_url'], job_data['title'])
+        Returns:
+            SQL fragment
+        """
+        updates = [column for column in columns if column not in self.REFRESH_KEEP_COLUMNS]
+        if self.refresh_existing and 'content_hash' in columns:
+            # Expired jobs that show up again are reactivated even if unchanged
+            set_clause = ', '.join(f"{column} = {self.refresh_value_sql(column)}" for column in updates)
+            query = (
+                f"ON CONFLICT (job_id) DO UPDATE SET {set_clause}, last_updated = NOW() "
+                f"WHERE jobs.content_hash IS DISTINCT FROM EXCLUDED.content_hash OR NOT jobs.is_active "
+            )
+        else:
+            query = "ON CONFLICT (job_id) DO NOTHING "
+        
+        # xmax is 0 only for freshly inserted tuples
+        return query + "RETURNING job_id, (xmax = 0) AS inserted"
+    
+    def refresh_value_sql(self, column: str) -> str:
+        """
+        New value of a column when a refresh updates an existing row
+        
+        Every row carries all JOB_COLUMNS, so a field the parser missed
+        arrives as NULL (or an empty skills list); that keeps the stored value
+        instead of erasing it.
+        
+        Args:
+            column: Column being updated
             
-            # Set defaults
-            job_data.setdefault('posted_date', datetime.now().date())
-            job_data.setdefault('is_active', True)
+        Returns:
+            SQL expression
+        """
+        if column in self.REFRESH_OVERWRITE_COLUMNS:
+            return f"EXCLUDED.{column}"
+        if column == 'skills':
+            return "COALESCE(NULLIF(EXCLUDED.skills, '{}'), jobs.skills)"
+        return f"COALESCE(EXCLUDED.{column}, jobs.{column})"
+    
+    def create_staging_tables(self):
+        """
+        Create the full_refresh staging tables on the write connection
+        
+        jobs_staging receives each batch by COPY and empties itself on
+        commit; jobs_seen accumulates the job_id and canonical apply_url of
+        every job the run saw, for expire_unseen_jobs.
+        """
+        self.write_cursor.execute(
+            "CREATE TEMP TABLE IF NOT EXISTS jobs_staging (LIKE jobs INCLUDING DEFAULTS) ON COMMIT DELETE ROWS"
+        )
+        self.write_cursor.execute(
+            "CREATE TEMP TABLE IF NOT EXISTS jobs_seen (job_id VARCHAR(64) PRIMARY KEY, apply_url TEXT)"
+        )
+        self.write_cursor.execute(
+            "CREATE INDEX IF NOT EXISTS jobs_seen_apply_url ON jobs_seen (apply_url)"
+        )
+        self.write_conn.commit()
+        self.staging = True
+    
+    def start_staging(self):
+        """Stage full_refresh writes (falls back to direct upserts if the tables can't be created)"""
+        try:
+            self.create_staging_tables()
+            self.seen_complete = True
+        except Exception as e:
+            self.logger.warning(f"Staging tables unavailable, unseen jobs will not be expired: {e}")
+            self.write_conn.rollback()
+            self.staging = False
+    
+    def merge_staged(self, rows: List[Dict[str, Any]]) -> List[tuple]:
+        """
+        COPY a batch into jobs_staging and merge it into jobs in one statement
+        
+        Runs inside write_jobs' transaction; the caller commits.
+        
+        Args:
+            rows: Prepared job rows
             
-            # Skills should be array, not JSON string
-            if 'skills' not in job_data:
-                job_data['skills'] = []
-            elif not isinstance(job_data['skills'], list):
-                job_data['skills'] = []
+        Returns:
+            (job_id, inserted) tuples for rows inserted or updated
+        """
+        columns = self.job_column_names
+        column_list = ', '.join(columns)
+        with self.write_cursor.copy(f"COPY jobs_staging ({column_list}) FROM STDIN") as copy:
+            for row in rows:
+                copy.write_row([row[column] for column in columns])
+        
+        self.write_cursor.execute(
+            "INSERT INTO jobs_seen (job_id, apply_url) SELECT job_id, apply_url FROM jobs_staging ON CONFLICT DO NOTHING"
+        )
+        self.execute_prepared(
+            f"INSERT INTO jobs ({column_list}) SELECT {column_list} FROM jobs_staging " + self.conflict_clause(columns),
+            []
+        )
+        return self.write_cursor.fetchall()
+    
+    def expire_unseen_jobs(self) -> int:
+        """
+        Deactivate this site's jobs the full_refresh didn't see and whose deadline passed
+        
+        One set-wise UPDATE anti-joined against jobs_seen. A job counts as
+        seen if either its job_id or its apply_url was written this run, so a
+        row still carrying a pre-backfill id (migrations/backfill_job_ids.sql)
+        is not expired while the site still lists it. Must run after
+        flush_jobs, when the write connection is idle.
+        
+        Returns:
+            Number of jobs expired
+        """
+        if not (self.staging and self.seen_complete):
+            return 0
+        if not self.stats['jobs_found']:
+            self.logger.warning("No jobs seen this run, not expiring anything")
+            return 0
+        
+        try:
+            self.write_cursor.execute("""
+                UPDATE jobs SET is_active = false, last_updated = NOW()
+                WHERE source_site = %s
+                  AND is_active
+                  AND application_deadline < CURRENT_DATE
+                  AND NOT EXISTS (SELECT 1 FROM jobs_seen s WHERE s.job_id = jobs.job_id)
+                  AND NOT EXISTS (SELECT 1 FROM jobs_seen s WHERE s.apply_url = jobs.apply_url)
+            """, (self.site_name,))
+            expired = self.write_cursor.rowcount
+            self.write_conn.commit()
+        except Exception as e:
+            self.logger.error(f"Error expiring unseen jobs: {e}")
+            self.write_conn.rollback()
+            self.incr_stat('errors')
+            return 0
+        
+        self.stats['jobs_expired'] = expired
+        self.logger.info(f"Expired {expired} jobs not seen this run with a passed deadline")
+        return expired
+    
+    def count_written(self, rows: int, returned: List[tuple]) -> int:
+        """
+        Update new/updated/skipped counters from an insert's RETURNING rows
+        
+        Args:
+            rows: Rows sent
+            returned: (job_id, inserted) tuples
             
-            # Insert query
-            columns = ', '.join(job_data.keys())
-            placeholders = ', '.join(['%s'] * len(job_data))
-            query = f"INSERT INTO jobs ({columns}) VALUES ({placeholders}) ON CONFLICT (job_id) DO NOTHING"
+        Returns:
+            Number of new rows
+        """
+        new = sum(1 for _, inserted in returned if inserted)
+        updated = len(returned) - new
+        self.incr_stat('jobs_new', new)
+        self.incr_stat('jobs_updated', updated)
+        # Already stored and (when refreshing) unchanged
+        self.incr_stat('jobs_skipped', rows - len(returned))
+        return new
+    
+    def write_jobs(self, rows: List[Dict[str, Any]]):
+        """
+        Insert a batch of prepared jobs in one transaction
+        
+        Rows go out in multi-row INSERTs (see insert_statement), or during
+        a full_refresh through the staging table (see merge_staged), whose
+        RETURNING rows give exact new, updated and skipped counts. Chunk
+        sizes come from statement_chunks, so only a handful of statement
+        shapes ever exist and each is prepared once per connection. If the
+        batch fails it is rolled back and retried row by row, so one bad
+        row only loses itself.
+        
+        Args:
+            rows: Prepared job rows (see prepare_job)
+        """
+        started = time.perf_counter()
+        columns = self.job_column_names
+        # Stay under PostgreSQL's 65535 bind parameters per statement
+        max_rows = min(self.write_buffer.batch_size, 65535 // len(columns))
+        
+        returned = []
+        try:
+            if self.staging:
+                returned = self.merge_staged(rows)
+            else:
+                start = 0
+                for size in statement_chunks(len(rows), max_rows):
+                    chunk = rows[start:start + size]
+                    start += size
+                    self.execute_prepared(
+                        self.insert_statement(columns, size),
+                        [row[column] for row in chunk for column in columns]
+                    )
+                    returned.extend(self.write_cursor.fetchall())
+            self.write_conn.commit()
+        except Exception as e:
+            self.logger.warning(f"Batch insert of {len(rows)} jobs failed, retrying one by one: {e}")
+            self.write_conn.rollback()
+            for row in rows:
+                self.write_job(row)
+            return
+        
+        new = self.count_written(len(rows), returned)
+        self.incr_stat('write_batches')
+        if self.known_urls:
+            for row in rows:
+                self.known_urls.add(row['apply_url'])
+        
+        elapsed = (time.perf_counter() - started) * 1000
+        self.logger.debug(
+            f"Wrote batch of {len(rows)} jobs: {new} new, {len(returned) - new} updated, "
+            f"{len(rows) - len(returned)} unchanged or skipped in {elapsed:.1f}ms"
+        )
+    
+    def write_job(self, row: Dict[str, Any]) -> bool:
+        """
+        Insert one prepared job in its own transaction
+        
+        Args:
+            row: Prepared job row (see prepare_job)
             
-            self.cursor.execute(query, list(job_data.values()))
-            self.conn.commit()
+        Returns:
+            True if the row was inserted or updated, False otherwise
+        """
+        try:
+            self.execute_prepared(self.insert_statement(tuple(row.keys()), 1), list(row.values()))
+            returned = self.write_cursor.fetchall()
+            if self.staging:
+                self.write_cursor.execute(
+                    "INSERT INTO jobs_seen (job_id) VALUES (%s) ON CONFLICT DO NOTHING",
+                    (row['job_id'],)
+                )
+            self.write_conn.commit()
             
-            if self.cursor.rowcount > 0:
-                self.stats['jobs_new'] += 1
-                self.logger.debug(f"Inserted job: {job_data['title']}")
-                return True
-            else:
-                self.stats['jobs_skipped'] += 1
-                return False
+            if self.known_urls:
+                self.known_urls.add(row['apply_url'])
+            
+            self.count_written(1, returned)
+            if returned:
+                self.logger.debug(f"Wrote job: {row['title']}")
+            return bool(returned)
                 
         except Exception as e:
-            self.logger.error(f"Error inserting job: {e}")
-            self.conn.rollback()
-            self.stats['errors'] += 1
+            self.logger.error(f"Error inserting job {row.get('apply_url')}: {e}")
+            self.write_conn.rollback()
+            self.incr_stat('errors')
             return False
     
-    def update_job(self, source_url: str, job_data: Dict[str, Any]) -> bool:
+    def update_job(self, apply_url: str, job_data: Dict[str, Any]) -> bool:
         """
         Update existing job in database
         
         Args:
-            source_url: Job URL to update
+            apply_url: Job URL to update (same key insert_job and job_exists use)
             job_data: Updated fields
             
         Returns:
             True if successful, False otherwise
         """
         try:
-            # Build SET clause
-            set_clause = ', '.join([f"{k} = %s" for k in job_data.keys()])
-            values = list(job_data.values())
-            values.append(source_url)
+            # Build SET clause (sorted, so the same fields always give the same statement)
+            columns = sorted(job_data.keys())
+            set_clause = ', '.join([f"{k} = %s" for k in columns])
+            values = [job_data[k] for k in columns]
+            values.append(apply_url)
             
-            query = f"UPDATE jobs SET {set_clause}, last_updated = NOW() WHERE source_url = %s"
+            query = f"UPDATE jobs SET {set_clause}, last_updated = NOW() WHERE apply_url = %s"
             
-            self.cursor.execute(query, values)
+            self.cursor.execute(query, values, prepare=True)
             self.conn.commit()
             
             if self.cursor.rowcount > 0:
-                self.stats['jobs_updated'] += 1
-                self.logger.debug(f"Updated job: {source_url}")
+                self.incr_stat('jobs_updated')
+                self.logger.debug(f"Updated job: {apply_url}")
                 return True
             return False
             
@@ -295,13 +1220,15 @@ class BaseScraper(ABC):
                 INSERT INTO scraping_logs (
                     site_name, scrape_mode, started_at, completed_at,
                     jobs_found, jobs_new, jobs_updated, jobs_skipped, 
-                    status, errors
-                ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                    status, errors, retries, timeouts, breaker_open, jobs_expired
+                ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
             """, (
                 self.site_name, scrape_mode, start_time, end_time,
                 self.stats['jobs_found'], self.stats['jobs_new'], 
                 self.stats['jobs_updated'], self.stats['jobs_skipped'],
-                status, self.stats['errors']
+                status, self.stats['errors'],
+                self.stats['retries'], self.stats['timeouts'], self.stats['breaker_open'],
+                self.stats['jobs_expired']
             ))
             self.conn.commit()
             
@@ -309,9 +1236,23 @@ class BaseScraper(ABC):
                 f"Scrape completed: {self.stats['jobs_new']} new, "
                 f"{self.stats['jobs_updated']} updated, "
                 f"{self.stats['jobs_skipped']} skipped, "
-                f"{self.stats['errors']} errors"
+                f"{self.stats['jobs_expired']} expired, "
+                f"{self.stats['errors']} errors, "
+                f"{self.stats['http_connections_reused']}/{self.stats['http_requests']} requests on reused connections, "
+                f"{self.stats['pages_parsed']} pages parsed in {self.stats['parse_time_ms']}ms "
+                f"({self.stats['parse_fallback']} needed the full soup parse), "
+                f"{self.stats['db_lookups_avoided']} URLs answered by the known-URL index, "
+                f"{self.stats['existence_queries']} bulk existence queries, "
+                f"{self.stats['prepared_statement_hits']} prepared statement reuses"
             )
             
+            never_matched = [
+                field for field, counts in self.stats.get('field_stats', {}).items()
+                if counts['misses'] and not counts['hits']
+            ]
+            if never_matched:
+                self.logger.info(f"Fields that never matched this run: {', '.join(never_matched)}")
+            
         except Exception as e:
             self.logger.error(f"Error logging scrape run: {e}")
             self.conn.rollback()
@@ -326,8 +1267,6 @@ class BaseScraper(ABC):
         Returns:
             Dictionary with salary_min, salary_max, salary_currency
         """
-        import re
-        
         result = {
             'salary_text': salary_text,
             'salary_min': None,
@@ -368,9 +1307,8 @@ class BaseScraper(ABC):
         if not text:
             return ''
         
-        import re
         # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
+        text = WHITESPACE_RE.sub(' ', text)
         # Remove leading/trailing whitespace
         text = text.strip()
         return text
@@ -401,24 +1339,166 @@ class BaseScraper(ABC):
         """
         pass
     
+    def is_job_detail_url(self, url: str) -> bool:
+        """
+        Whether a URL is a job detail page (used to select archived pages for reparse)
+        
+        Args:
+            url: Page URL
+            
+        Returns:
+            True if the page can be handled by parse_job_page
+        """
+        return False
+    
+    def parse_job_page(self, content, job_url: str, content_type: str = None) -> Optional[Dict[str, Any]]:
+        """
+        Parse a fetched job detail page into job data - override in child classes
+        
+        The default parses nothing, so scrapers without a detail page parser
+        report every page as unparseable.
+        
+        Args:
+            content: Raw page bytes (or decoded HTML)
+            job_url: URL of the page
+            content_type: Content-Type header of the response, if known
+            
+        Returns:
+            Dictionary with job data or None if parsing failed
+        """
+        return None
+    
+    def parse_fetched_page(self, content: bytes, job_url: str, content_type: str = None) -> Optional[Dict[str, Any]]:
+        """
+        Parse a fetched job page, in the parse pool when one is running
+        
+        Safe to call from fetch threads: with a pool the calling thread only
+        waits on the worker process, so parsing does not hold the GIL here.
+        
+        Args:
+            content: Raw page bytes
+            job_url: URL of the page
+            content_type: Content-Type header of the response
+            
+        Returns:
+            Dictionary with job data or None if parsing failed
+        """
+        if not self.parse_pool:
+            return self.parse_job_page(content, job_url, content_type)
+        
+        try:
+            job_data, metrics = self.parse_pool.parse(content, job_url, content_type)
+        except Exception as e:
+            self.logger.error(f"Parse worker failed for {job_url}: {e}")
+            return None
+        
+        self.merge_parse_stats(metrics)
+        return job_data
+    
+    def start_parse_pool(self):
+        """Start the parse worker processes if PARSE_WORKERS is set"""
+        if self.parse_workers <= 0 or self.parse_pool:
+            return
+        try:
+            self.parse_pool = ParsePool(self, self.parse_workers)
+            self.parse_pool.start()
+            self.logger.info(f"Parsing job pages in {self.parse_workers} worker processes")
+        except Exception as e:
+            self.logger.warning(f"Parse pool unavailable, parsing inline: {e}")
+            self.close_parse_pool()
+    
+    def close_parse_pool(self):
+        """Stop the parse worker processes"""
+        if self.parse_pool:
+            self.parse_pool.shutdown()
+            self.parse_pool = None
+    
+    def reparse(self) -> Dict[str, int]:
+        """
+        Rebuild job rows from the page archive without any network I/O
+        
+        The latest archived copy of every job detail page is parsed in a
+        process pool (REPARSE_WORKERS, default one per core); new jobs are
+        inserted and existing rows whose content hash changed are updated
+        with the re-parsed fields.
+        
+        Returns:
+            Scraping statistics
+        """
+        if not self.page_archive:
+            self.logger.error("Reparse requested but PAGE_ARCHIVE_DIR is not configured")
+            self.incr_stat('errors')
+            return self.stats
+        
+        records = list(self.page_archive.latest_records(self.is_job_detail_url).values())
+        total = len(records)
+        self.logger.info(f"Reparsing {total} archived pages with {self.reparse_workers} workers")
+        self.update_progress(f"Reparsing {total} archived pages...", 10)
+        
+        pool = ParsePool(self, self.reparse_workers, self.page_archive.archive_dir)
+        try:
+            for idx, (job_url, job_data, metrics) in enumerate(pool.map_archived(records), 1):
+                if self.should_stop():
+                    self.logger.info(f"Stop signal received at archived page {idx}")
+                    pool.shutdown(cancel=True)
+                    break
+                
+                self.merge_parse_stats(metrics)
+                if not job_data:
+                    self.logger.warning(f"Could not reparse archived page {job_url}")
+                    self.incr_stat('errors')
+                    continue
+                
+                self.incr_stat('jobs_found')
+                # Inserted if new, updated if its content changed (refresh_existing)
+                self.insert_job(job_data)
+                
+                if idx % 100 == 0:
+                    self.update_progress(
+                        f"Reparsed {idx}/{total}: {self.stats['jobs_new']} new, {self.stats['jobs_updated']} updated",
+                        10 + int((idx / total) * 85)
+                    )
+        finally:
+            pool.shutdown()
+            self.flush_jobs()
+        
+        return self.stats
+    
     def run(self, mode: str = 'incremental') -> Dict[str, int]:
         """
         Execute scraping process with error handling
         
         Args:
-            mode: 'incremental' or 'full_refresh'
+            mode: 'incremental', 'full_refresh' or 'reparse' (rebuild from the page archive)
             
         Returns:
             Scraping statistics
         """
         start_time = datetime.now()
+        self._http_baseline = connection_stats(self.session)
         
         try:
             self.logger.info(f"Starting {mode} scrape for {self.site_name}")
             self.connect_db()
+            self.build_known_urls()
+            self.refresh_existing = mode in ('full_refresh', 'reparse')
+            self.start_writer()
+            if mode == 'full_refresh':
+                self.start_staging()
             
             # Run site-specific scraping logic
-            stats = self.scrape(mode=mode)
+            if mode == 'reparse':
+                stats = self.reparse()
+            else:
+                self.start_parse_pool()
+                stats = self.scrape(mode=mode)
+            self.flush_jobs()
+            
+            # Only a complete full_refresh knows which jobs have disappeared
+            if mode == 'full_refresh' and not self.should_stop():
+                self.expire_unseen_jobs()
+            self.update_http_stats()
+            self.update_field_stats()
             
             # Log the run
             self.log_scrape_run(start_time, mode)
@@ -427,7 +1507,15 @@ class BaseScraper(ABC):
             
         except Exception as e:
             self.logger.error(f"Scraping failed for {self.site_name}: {e}", exc_info=True)
-            self.stats['errors'] += 1
+            self.incr_stat('errors')
+            
+            # Don't lose jobs that were parsed before the failure
+            try:
+                self.flush_jobs()
+            except Exception as flush_error:
+                self.logger.error(f"Could not write buffered jobs: {flush_error}")
+            self.update_http_stats()
+            self.update_field_stats()
             
             # Still try to log the failed run
             try:
@@ -438,4 +1526,10 @@ class BaseScraper(ABC):
             return self.stats
             
         finally:
+            self.close_parse_pool()
+            # Drain the write-behind queue before the index and connection go away
+            self.close_writer()
+            self.close_known_urls()
             self.close_db()
+            self.close_session()
+
@@ -0,0 +1,218 @@
+"""
+Declarative field-extraction specs, compiled once per scraper
+"""
+
+import re
+import time
+import threading
+from datetime import datetime
+from typing import Any, Callable, Dict, List
+
+from .parsing import normalize_text
+
+# Sentinel for "field not extracted" (None and '' can be legitimate values)
+MISSING = object()
+
+
+def _coerce_text(value: str, rule: Dict[str, Any]) -> Any:
+    return value
+
+
+def _coerce_leading_int(value: str, rule: Dict[str, Any]) -> Any:
+    # "3 Posts" -> 3
+    return int(value.split()[0])
+
+
+def _coerce_date(value: str, rule: Dict[str, Any]) -> Any:
+    return datetime.strptime(value, rule['format']).date()
+
+
+COERCIONS: Dict[str, Callable[[str, Dict[str, Any]], Any]] = {
+    'text': _coerce_text,
+    'leading_int': _coerce_leading_int,
+    'date': _coerce_date,
+}
+
+
+class ExtractionSpec:
+    """
+    Compiled extraction spec for one site
+    
+    A spec is a plain dict with up to three sections:
+        
+        rows:      detail-row label -> column name, or a dict with
+                   'column', 'coerce' (see COERCIONS), 'format' and
+                   'default' (used when coercion fails; otherwise the
+                   field is left unset)
+        selectors: column -> list of rules tried in order; each rule has
+                   'selectors' (CSS), and optional 'exclude' (texts to
+                   skip), 'remove' (substrings to strip), 'min_length'
+                   and a 'default' on the field's last rule
+        patterns:  column -> {'source': column to search, 'regexes': [...],
+                   'flags': re flags}; only applied when the column is
+                   still empty, first match (group 0) wins
+    
+    Regexes and lookup tables are built once here; every field records
+    hits, misses and time spent so slow or dead selectors show up in stats.
+    """
+    
+    def __init__(self, spec: Dict[str, Any]):
+        """
+        Compile a spec
+        
+        Args:
+            spec: Declarative spec (see class docstring)
+        """
+        self.rows: Dict[str, Dict[str, Any]] = {}
+        for label, rule in spec.get('rows', {}).items():
+            if isinstance(rule, str):
+                rule = {'column': rule}
+            rule = dict(rule)
+            rule['coerce_fn'] = COERCIONS[rule.get('coerce', 'text')]
+            self.rows[label] = rule
+        
+        self.selectors: Dict[str, List[Dict[str, Any]]] = {}
+        for column, rules in spec.get('selectors', {}).items():
+            compiled = []
+            for rule in rules:
+                rule = dict(rule)
+                rule['exclude'] = frozenset(rule.get('exclude', ()))
+                rule['remove'] = tuple(rule.get('remove', ()))
+                rule['min_length'] = rule.get('min_length', 1)
+                compiled.append(rule)
+            self.selectors[column] = compiled
+        
+        self.patterns: Dict[str, Dict[str, Any]] = {}
+        for column, rule in spec.get('patterns', {}).items():
+            flags = rule.get('flags', 0)
+            self.patterns[column] = {
+                'source': rule['source'],
+                'regexes': [re.compile(pattern, flags) for pattern in rule['regexes']],
+            }
+        
+        columns = [rule['column'] for rule in self.rows.values()]
+        columns += list(self.selectors) + list(self.patterns)
+        self._lock = threading.Lock()
+        self._counters: Dict[str, List[float]] = {column: [0, 0, 0.0] for column in columns}
+    
+    def _record(self, column: str, hit: bool, elapsed: float):
+        with self._lock:
+            counter = self._counters.setdefault(column, [0, 0, 0.0])
+            counter[0 if hit else 1] += 1
+            counter[2] += elapsed
+    
+    def apply_rows(self, rows: Dict[str, str], job_data: Dict[str, Any]) -> None:
+        """
+        Map detail-row label/value pairs onto job fields in one pass
+        
+        Args:
+            rows: Label -> value pairs from the page
+            job_data: Job data, modified in place
+        """
+        for label, value in rows.items():
+            rule = self.rows.get(label)
+            if rule is None:
+                continue
+            
+            started = time.perf_counter()
+            try:
+                result = rule['coerce_fn'](value, rule)
+            except (ValueError, IndexError, TypeError):
+                result = rule.get('default', MISSING)
+            
+            hit = result is not MISSING
+            if hit:
+                job_data[rule['column']] = result
+            self._record(rule['column'], hit, time.perf_counter() - started)
+        
+        for label, rule in self.rows.items():
+            if label not in rows:
+                self._record(rule['column'], False, 0.0)
+    
+    def select(self, soup, column: str) -> Any:
+        """
+        Extract one column from a soup using its selector fallbacks
+        
+        Args:
+            soup: BeautifulSoup document
+            column: Column name in the spec's selectors section
+        
+        Returns:
+            Cleaned text of the first acceptable match, else the rule default (or None)
+        """
+        rules = self.selectors[column]
+        started = time.perf_counter()
+        
+        for rule in rules:
+            for selector in rule['selectors']:
+                for element in soup.select(selector):
+                    text = normalize_text(element.get_text())
+                    for suffix in rule['remove']:
+                        text = text.replace(suffix, '')
+                    text = text.strip()
+                    if text in rule['exclude'] or len(text) < rule['min_length']:
+                        continue
+                    self._record(column, True, time.perf_counter() - started)
+                    return text
+        
+        self._record(column, False, time.perf_counter() - started)
+        return rules[-1].get('default') if rules else None
+    
+    def apply_patterns(self, job_data: Dict[str, Any]) -> None:
+        """
+        Fill still-empty columns by searching other columns with regexes
+        
+        Args:
+            job_data: Job data, modified in place
+        """
+        for column, rule in self.patterns.items():
+            if job_data.get(column):
+                continue
+            
+            started = time.perf_counter()
+            source = job_data.get(rule['source']) or ''
+            match = None
+            for regex in rule['regexes']:
+                match = regex.search(source)
+                if match:
+                    job_data[column] = match.group(0)
+                    break
+            self._record(column, match is not None, time.perf_counter() - started)
+    
+    def drain(self) -> Dict[str, List[float]]:
+        """Return the raw counters and reset them (used by parse workers)"""
+        with self._lock:
+            counters = {column: list(values) for column, values in self._counters.items() if values[0] or values[1]}
+            for values in self._counters.values():
+                values[:] = [0, 0, 0.0]
+        return counters
+    
+    def merge(self, counters: Dict[str, List[float]]):
+        """Add counters drained from another process"""
+        with self._lock:
+            for column, (hits, misses, elapsed) in counters.items():
+                counter = self._counters.setdefault(column, [0, 0, 0.0])
+                counter[0] += hits
+                counter[1] += misses
+                counter[2] += elapsed
+    
+    def report(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Per-field extraction stats
+        
+        Returns:
+            Dictionary of column -> {hits, misses, hit_rate, time_ms}
+        """
+        with self._lock:
+            counters = {column: list(values) for column, values in self._counters.items()}
+        
+        report = {}
+        for column, (hits, misses, elapsed) in counters.items():
+            attempts = hits + misses
+            report[column] = {
+                'hits': int(hits),
+                'misses': int(misses),
+                'hit_rate': round(hits / attempts, 3) if attempts else None,
+                'time_ms': round(elapsed * 1000, 2),
+            }
+        return report
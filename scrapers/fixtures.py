@@ -0,0 +1,179 @@
+"""
+Record/replay HTTP fixtures for offline, deterministic scraper runs
+"""
+
+import os
+import io
+import json
+import time
+import hashlib
+import logging
+import threading
+from collections import defaultdict
+from typing import Any, Dict, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from .httpcache import cache_key
+
+logger = logging.getLogger('scraper.fixtures')
+
+MANIFEST_FILE = 'manifest.jsonl'
+BODIES_DIR = 'bodies'
+
+
+class FixtureRecorder:
+    """
+    Captures request/response pairs into a fixture bundle
+    
+    A bundle is a directory with a JSON-lines manifest (method, url, status,
+    headers, elapsed time, body file) and a `bodies/` folder of
+    content-addressed response bodies.
+    """
+    
+    def __init__(self, bundle_dir: str):
+        self.bundle_dir = bundle_dir
+        self._lock = threading.Lock()
+        os.makedirs(os.path.join(bundle_dir, BODIES_DIR), exist_ok=True)
+    
+    def record(self, method: str, url: str, response: requests.Response):
+        """
+        Add one response to the bundle
+        
+        Args:
+            method: HTTP method
+            url: Requested URL
+            response: Response received
+        """
+        body = response.content
+        digest = hashlib.sha256(body).hexdigest()
+        body_file = os.path.join(BODIES_DIR, f'{digest}.bin')
+        entry = {
+            'method': method.upper(),
+            'url': url,
+            'status': response.status_code,
+            'reason': response.reason,
+            'headers': dict(response.headers),
+            'elapsed_ms': int(response.elapsed.total_seconds() * 1000),
+            'body': body_file,
+        }
+        
+        with self._lock:
+            body_path = os.path.join(self.bundle_dir, body_file)
+            if not os.path.exists(body_path):
+                with open(body_path, 'wb') as f:
+                    f.write(body)
+            with open(os.path.join(self.bundle_dir, MANIFEST_FILE), 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry) + '\n')
+
+
+class ReplayAdapter(HTTPAdapter):
+    """
+    Transport adapter that serves responses from a fixture bundle
+    
+    Mounted on a session in place of the network adapter. Repeated requests
+    for the same URL replay the recorded responses in order (the last one is
+    repeated once exhausted). Unrecorded URLs get a 404 so runs never fall
+    through to the network.
+    """
+    
+    def __init__(self, bundle_dir: str, latency: Optional[str] = None):
+        """
+        Initialize replay adapter
+        
+        Args:
+            bundle_dir: Fixture bundle written by FixtureRecorder
+            latency: Simulated latency per response: milliseconds, 'recorded'
+                to reuse the latency seen while recording, or None for none
+        """
+        super().__init__()
+        self.bundle_dir = bundle_dir
+        self.latency = latency
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._served: Dict[tuple, int] = defaultdict(int)
+        self._entries: Dict[tuple, List[Dict[str, Any]]] = defaultdict(list)
+        
+        with open(os.path.join(bundle_dir, MANIFEST_FILE), 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    entry = json.loads(line)
+                    self._entries[(entry['method'], cache_key(entry['url']))].append(entry)
+        
+        logger.info(f"Loaded {sum(len(v) for v in self._entries.values())} recorded responses from {bundle_dir}")
+    
+    def _next_entry(self, method: str, url: str) -> Optional[Dict[str, Any]]:
+        key = (method.upper(), cache_key(url))
+        with self._lock:
+            entries = self._entries.get(key)
+            if not entries:
+                self.misses += 1
+                return None
+            idx = min(self._served[key], len(entries) - 1)
+            self._served[key] += 1
+            return entries[idx]
+    
+    def _delay(self, entry: Dict[str, Any]):
+        if not self.latency:
+            return
+        if self.latency == 'recorded':
+            seconds = entry.get('elapsed_ms', 0) / 1000
+        else:
+            seconds = float(self.latency) / 1000
+        if seconds > 0:
+            time.sleep(seconds)
+    
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        entry = self._next_entry(request.method, request.url)
+        
+        response = requests.Response()
+        response.request = request
+        response.url = request.url
+        response.raw = io.BytesIO()
+        response.connection = self
+        
+        if entry is None:
+            logger.warning(f"No recorded response for {request.method} {request.url}")
+            response.status_code = 404
+            response.reason = 'Not Recorded'
+            response.headers = CaseInsensitiveDict({'X-Replay-Miss': '1'})
+            response._content = b''
+            return response
+        
+        self._delay(entry)
+        
+        headers = CaseInsensitiveDict(entry['headers'])
+        # Bodies are stored decoded; drop transfer headers that no longer apply
+        headers.pop('Content-Encoding', None)
+        headers.pop('Transfer-Encoding', None)
+        
+        etag = headers.get('ETag')
+        if entry['status'] == 200 and etag and request.headers.get('If-None-Match') == etag:
+            response.status_code = 304
+            response.reason = 'Not Modified'
+            response.headers = headers
+            response._content = b''
+            return response
+        
+        with open(os.path.join(self.bundle_dir, entry['body']), 'rb') as f:
+            response._content = f.read()
+        response.status_code = entry['status']
+        response.reason = entry.get('reason') or ''
+        response.headers = headers
+        response.encoding = get_encoding_from_headers(headers)
+        return response
+    
+    def close(self):
+        pass
+
+
+def fixture_settings() -> Dict[str, Any]:
+    """Read fixture settings from the environment"""
+    return {
+        'mode': os.getenv('HTTP_FIXTURE_MODE', '').lower(),
+        'bundle_dir': os.getenv('HTTP_FIXTURE_DIR', 'fixtures/http'),
+        'latency': os.getenv('HTTP_REPLAY_LATENCY_MS') or None,
+    }
@@ -0,0 +1,194 @@
+"""
+URL frontier: dedup and scheduling of job detail fetches
+"""
+
+import os
+import json
+import heapq
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+from .urls import canonicalize_url
+
+try:
+    import fcntl
+except ImportError:  # not on Windows; the file is then only guarded within the process
+    fcntl = None
+
+logger = logging.getLogger('scraper.frontier')
+
+
+class URLFrontier:
+    """
+    Insertion-ordered set of discovered URLs plus a priority queue of pending ones
+    
+    Membership checks are O(1) dict lookups. Pending URLs are popped
+    freshest first: by listing page number, then by source rank (the
+    source's position in get_job_sources), then in discovery order.
+    
+    URLs that were popped but never marked done (in flight when a run
+    stopped) and URLs still pending can be saved to disk and are scheduled
+    again by the next run. load() takes the saved URLs out of the file and
+    save() adds to what is there, both under a file lock, so runs of the
+    same site in several processes neither lose nor duplicate URLs.
+    """
+    
+    def __init__(self, path: Optional[str] = None):
+        """
+        Initialize frontier
+        
+        Args:
+            path: JSON file used by load()/save(), or None for in-memory only
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._heap: List[tuple] = []
+        self._in_flight: Dict[str, Dict[str, Any]] = {}
+        self._seq = 0
+    
+    def __contains__(self, url: str) -> bool:
+        return (canonicalize_url(url) or url) in self._entries
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def add(self, url: str, source: str = '', source_rank: int = 0, page: int = 1) -> bool:
+        """
+        Add a discovered URL (deduplicated on its canonical form)
+        
+        Args:
+            url: Absolute job detail URL
+            source: Name of the source it was found on
+            source_rank: Position of the source (lower is fetched first)
+            page: Listing page it was found on (lower is fresher)
+        
+        Returns:
+            True if the URL was new, False if it was already known
+        """
+        url = canonicalize_url(url) or url
+        with self._lock:
+            if url in self._entries:
+                return False
+            entry = {'url': url, 'source': source, 'source_rank': source_rank, 'page': page}
+            self._entries[url] = entry
+            heapq.heappush(self._heap, (page, source_rank, self._seq, url))
+            self._seq += 1
+            return True
+    
+    def pop(self) -> Optional[str]:
+        """
+        Take the highest-priority pending URL
+        
+        Returns:
+            URL, or None when nothing is pending
+        """
+        with self._lock:
+            if not self._heap:
+                return None
+            _, _, _, url = heapq.heappop(self._heap)
+            self._in_flight[url] = self._entries[url]
+            return url
+    
+    def drain(self) -> Iterator[str]:
+        """Yield pending URLs in priority order until the queue is empty"""
+        while True:
+            url = self.pop()
+            if url is None:
+                return
+            yield url
+    
+    def mark_done(self, url: str):
+        """Record that a popped URL has been handled"""
+        with self._lock:
+            self._in_flight.pop(url, None)
+    
+    def pending(self) -> int:
+        """Number of URLs not yet handled (queued or in flight)"""
+        with self._lock:
+            return len(self._heap) + len(self._in_flight)
+    
+    def clear_pending(self):
+        """Drop queued URLs (e.g. after an intentional early stop); in-flight ones stay until marked done"""
+        with self._lock:
+            self._heap = []
+    
+    @contextmanager
+    def _file_lock(self) -> Iterator[None]:
+        """Hold an exclusive flock on the frontier file, shared with other processes"""
+        if fcntl is None:
+            yield
+            return
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        with open(f'{self.path}.lock', 'a') as lock_file:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+    
+    def _read(self) -> List[Dict[str, Any]]:
+        """Entries in the frontier file ([] if it is missing or unreadable)"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f).get('pending', [])
+        except FileNotFoundError:
+            return []
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable frontier file {self.path}: {e}")
+            return []
+    
+    def _write(self, pending: List[Dict[str, Any]]):
+        """Replace the frontier file with pending (removes it when empty)"""
+        if not pending:
+            if os.path.exists(self.path):
+                os.remove(self.path)
+            return
+        tmp_path = f'{self.path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'pending': pending}, f)
+        os.replace(tmp_path, self.path)
+    
+    def load(self) -> int:
+        """
+        Restore pending URLs saved by a previous run, taking them out of the file
+        
+        Returns:
+            Number of URLs restored
+        """
+        if not self.path:
+            return 0
+        try:
+            with self._file_lock():
+                entries = self._read()
+                self._write([])
+        except OSError as e:
+            logger.warning(f"Could not load frontier from {self.path}: {e}")
+            return 0
+        
+        restored = 0
+        for entry in entries:
+            if self.add(entry['url'], entry.get('source', ''), entry.get('source_rank', 0), entry.get('page', 1)):
+                restored += 1
+        return restored
+    
+    def save(self):
+        """Add pending URLs to the frontier file (kept alongside any saved by other processes)"""
+        if not self.path:
+            return
+        with self._lock:
+            pending = list(self._in_flight.values())
+            pending += [self._entries[url] for _, _, _, url in sorted(self._heap)]
+        if not pending:
+            return
+        
+        try:
+            with self._file_lock():
+                saved = self._read()
+                known = {entry['url'] for entry in saved}
+                self._write(saved + [entry for entry in pending if entry['url'] not in known])
+            logger.info(f"Saved {len(pending)} pending URLs to {self.path}")
+        except OSError as e:
+            logger.warning(f"Could not save frontier to {self.path}: {e}")
@@ -0,0 +1,173 @@
+"""
+On-disk HTTP cache for conditional requests (ETag / Last-Modified)
+"""
+
+import os
+import json
+import time
+import hashlib
+import logging
+import threading
+from typing import Any, Dict, List, Optional
+
+from .urls import canonicalize_url
+
+logger = logging.getLogger('scraper.httpcache')
+
+
+def cache_key(url: str) -> str:
+    """Hash of the canonical form of a URL"""
+    canonical = canonicalize_url(url) or url.strip()
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+class HTTPCache:
+    """
+    Size-bounded cache of response validators, bodies and extracted results
+    
+    Each entry is two files: `<key>.json` with the validators plus whatever
+    the caller extracted from the page, and `<key>.body` with the raw body.
+    When the total size exceeds max_bytes the least recently used entries
+    are evicted.
+    """
+    
+    def __init__(self, cache_dir: str, max_bytes: int):
+        """
+        Initialize cache
+        
+        Args:
+            cache_dir: Directory holding cache entries (created if missing)
+            max_bytes: Upper bound on total size of the cache directory
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+        self._total_bytes = sum(size for _, _, size in self._entries())
+    
+    def _path(self, key: str, suffix: str) -> str:
+        return os.path.join(self.cache_dir, f'{key}.{suffix}')
+    
+    def _size(self, key: str) -> int:
+        size = 0
+        for suffix in ('json', 'body'):
+            try:
+                size += os.path.getsize(self._path(key, suffix))
+            except OSError:
+                pass
+        return size
+    
+    def _entries(self):
+        """Yield (key, mtime, size) for every entry on disk"""
+        sizes: Dict[str, List[float]] = {}
+        for name in os.listdir(self.cache_dir):
+            key, _, suffix = name.partition('.')
+            if suffix not in ('json', 'body'):
+                continue
+            try:
+                st = os.stat(os.path.join(self.cache_dir, name))
+            except OSError:
+                continue
+            entry = sizes.setdefault(key, [0.0, 0])
+            if suffix == 'json':
+                entry[0] = st.st_mtime
+            entry[1] += st.st_size
+        for key, (mtime, size) in sizes.items():
+            yield key, mtime, size
+    
+    def lookup(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the cached metadata for a URL
+        
+        Args:
+            url: Page URL
+        
+        Returns:
+            Metadata dict (etag, last_modified, extracted, ...) or None
+        """
+        path = self._path(cache_key(url), 'json')
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+            os.utime(path)  # mark as recently used
+            return entry
+        except (OSError, ValueError):
+            return None
+    
+    def conditional_headers(self, entry: Dict[str, Any]) -> Dict[str, str]:
+        """Validator headers for revalidating a cached entry"""
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+    
+    def store(self, url: str, response, extracted: Any = None):
+        """
+        Store a 200 response and the data extracted from it
+        
+        Responses without an ETag or Last-Modified are not cached since they
+        can never be revalidated.
+        
+        Args:
+            url: Page URL
+            response: requests.Response
+            extracted: JSON-serialisable result of parsing the page
+        """
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return
+        
+        key = cache_key(url)
+        meta = {
+            'url': url,
+            'etag': etag,
+            'last_modified': last_modified,
+            'stored_at': time.time(),
+            'extracted': extracted,
+        }
+        
+        with self._lock:
+            old_size = self._size(key)
+            try:
+                with open(self._path(key, 'body'), 'wb') as f:
+                    f.write(response.content)
+                with open(self._path(key, 'json'), 'w', encoding='utf-8') as f:
+                    json.dump(meta, f)
+            except OSError as e:
+                logger.warning(f"Could not write cache entry for {url}: {e}")
+                return
+            
+            self._total_bytes += self._size(key) - old_size
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+    
+    def _evict(self):
+        """Remove least recently used entries until under max_bytes"""
+        entries = sorted(self._entries(), key=lambda e: e[1])
+        self._total_bytes = sum(size for _, _, size in entries)
+        for key, _, size in entries:
+            if self._total_bytes <= self.max_bytes:
+                break
+            for suffix in ('json', 'body'):
+                try:
+                    os.remove(self._path(key, suffix))
+                except OSError:
+                    pass
+            self._total_bytes -= size
+            logger.debug(f"Evicted cache entry {key}")
+
+
+def cache_from_env() -> Optional[HTTPCache]:
+    """Build the listing-page cache from HTTP_CACHE_DIR / HTTP_CACHE_MAX_MB"""
+    cache_dir = os.getenv('HTTP_CACHE_DIR', '.cache/http')
+    if not cache_dir:
+        return None
+    max_mb = float(os.getenv('HTTP_CACHE_MAX_MB', '50'))
+    try:
+        return HTTPCache(cache_dir, int(max_mb * 1024 * 1024))
+    except OSError as e:
+        logger.warning(f"HTTP cache disabled, cannot use {cache_dir}: {e}")
+        return None
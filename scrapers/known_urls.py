@@ -0,0 +1,100 @@
+"""
+Known-URL index: Bloom filter over jobs.apply_url in anonymous shared memory
+"""
+
+import math
+import mmap
+import hashlib
+import threading
+from typing import Iterable
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter whose bit array is an anonymous memory mapping
+    
+    The filter is rebuilt every run, so nothing is kept on disk; each process
+    (each gunicorn worker has its own scheduler) gets its own mapping. Uses
+    double hashing over one blake2b digest, so each add/lookup costs a single
+    hash regardless of the number of probes.
+    """
+    
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        """
+        Initialize an empty filter
+        
+        Args:
+            capacity: Expected number of keys
+            error_rate: Target false-positive rate at capacity
+        """
+        capacity = max(1, capacity)
+        self.num_bits = max(8, int(math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))))
+        self.num_hashes = max(1, int(round(self.num_bits / capacity * math.log(2))))
+        self._bits = mmap.mmap(-1, (self.num_bits + 7) // 8)
+    
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+    
+    def add(self, key: str):
+        for pos in self._positions(key):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+    
+    def __contains__(self, key: str) -> bool:
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+    
+    def close(self):
+        self._bits.close()
+
+
+class KnownURLIndex:
+    """
+    Answers "could this URL already be in the jobs table?" without a query
+    
+    A Bloom filter built from every apply_url at run start gives definite
+    negatives; URLs inserted during the run are also kept in an exact set
+    so they are known positives. Only Bloom positives need the database.
+    """
+    
+    def __init__(self, bloom: BloomFilter):
+        self.bloom = bloom
+        self.inserted = set()
+        self._lock = threading.Lock()
+    
+    @classmethod
+    def build(cls, urls: Iterable[str], capacity: int, error_rate: float = 0.001) -> 'KnownURLIndex':
+        """
+        Build an index from existing URLs
+        
+        Args:
+            urls: URLs already stored
+            capacity: Expected number of URLs (existing plus headroom for this run)
+            error_rate: Target false-positive rate
+        
+        Returns:
+            KnownURLIndex
+        """
+        index = cls(BloomFilter(capacity, error_rate))
+        for url in urls:
+            index.bloom.add(url)
+        return index
+    
+    def is_known(self, url: str) -> bool:
+        """True if the URL was inserted during this run"""
+        return url in self.inserted
+    
+    def might_exist(self, url: str) -> bool:
+        """False means the URL is definitely not stored"""
+        return url in self.inserted or url in self.bloom
+    
+    def add(self, url: str):
+        """Record a URL that is now stored"""
+        with self._lock:
+            self.inserted.add(url)
+            self.bloom.add(url)
+    
+    def close(self):
+        self.bloom.close()
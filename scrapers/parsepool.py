@@ -0,0 +1,122 @@
+"""
+Process pool for CPU-bound page parsing
+"""
+
+import logging
+import importlib
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+
+from .archive import PageArchive
+
+logger = logging.getLogger('scraper.parsepool')
+
+# Stats counters produced by parse_job_page that are shipped back from workers
+PARSE_STATS = ('pages_parsed', 'parse_time_ms', 'parse_fast_path', 'parse_fallback')
+
+
+class ParsePool:
+    """
+    Long-lived worker processes that turn raw page bytes into job dicts
+    
+    Each worker builds one parse-only scraper (see BaseScraper.for_parsing)
+    and optionally one archive reader at startup, and reuses them for every
+    page it is given. Callers get
+    back plain job dicts plus the parse counters the worker's scraper
+    recorded, so they can be merged into the parent's stats.
+    """
+    
+    def __init__(self, scraper, workers: int, archive_dir: Optional[str] = None):
+        """
+        Initialize parse pool
+        
+        Args:
+            scraper: Scraper whose class (and site) each worker parses for
+            workers: Number of worker processes
+            archive_dir: Page archive to open in each worker (for reparse)
+        """
+        self.workers = max(1, workers)
+        scraper_path = (type(scraper).__module__, type(scraper).__qualname__)
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_parse_worker,
+            initargs=(scraper_path, scraper.site_name, scraper.base_url, archive_dir)
+        )
+    
+    def start(self):
+        """Launch the workers now, before the caller starts its own threads"""
+        self._executor.submit(_ping).result()
+    
+    def parse(self, content: bytes, url: str, content_type: Optional[str] = None) -> Tuple[Optional[Dict[str, Any]], Dict[str, int]]:
+        """
+        Parse one fetched page in a worker (blocks the calling thread only)
+        
+        Args:
+            content: Raw page bytes
+            url: Page URL
+            content_type: Content-Type header of the response
+        
+        Returns:
+            Tuple of (job data or None, parse counters)
+        """
+        _, job_data, metrics = self._executor.submit(_parse_page, content, url, content_type).result()
+        return job_data, metrics
+    
+    def map_archived(self, entries: Iterable[Dict[str, Any]], chunksize: int = 32) -> Iterator[Tuple[str, Optional[Dict[str, Any]], Dict[str, int]]]:
+        """
+        Parse archived pages; workers read the records themselves
+        
+        Args:
+            entries: Page archive index entries
+            chunksize: Entries sent to a worker per round trip
+        
+        Returns:
+            Iterator of (url, job data or None, parse counters) in input order
+        """
+        return self._executor.map(_parse_archived, entries, chunksize=chunksize)
+    
+    def shutdown(self, cancel: bool = False):
+        """Stop the workers (dropping queued pages if cancel is set)"""
+        self._executor.shutdown(wait=not cancel, cancel_futures=cancel)
+
+
+# Per-process state for parse workers
+_worker_scraper = None
+_worker_archive = None
+
+
+def _init_parse_worker(scraper_path, site_name: str, base_url: str, archive_dir: Optional[str]):
+    """Create one parse-only scraper (and archive reader) per worker process"""
+    global _worker_scraper, _worker_archive
+    module_name, class_name = scraper_path
+    scraper_class = getattr(importlib.import_module(module_name), class_name)
+    _worker_scraper = scraper_class.for_parsing(site_name, base_url)
+    _worker_archive = PageArchive(archive_dir) if archive_dir else None
+
+
+def _ping():
+    return True
+
+
+def _parse_page(content: bytes, url: str, content_type: Optional[str]):
+    """Parse one page in a worker process"""
+    before = {key: _worker_scraper.stats.get(key, 0) for key in PARSE_STATS}
+    try:
+        job_data = _worker_scraper.parse_job_page(content, url, content_type)
+    except Exception as e:
+        logger.error(f"Failed to parse {url}: {e}")
+        job_data = None
+    metrics = {key: _worker_scraper.stats.get(key, 0) - before[key] for key in PARSE_STATS}
+    if _worker_scraper.extraction:
+        metrics['fields'] = _worker_scraper.extraction.drain()
+    return url, job_data, metrics
+
+
+def _parse_archived(entry: Dict[str, Any]):
+    """Read and parse one archived page in a worker process"""
+    try:
+        _, body = _worker_archive.read(entry)
+    except Exception as e:
+        logger.error(f"Failed to read archived page {entry.get('url')}: {e}")
+        return entry.get('url'), None, {}
+    return _parse_page(body, entry['url'], entry.get('content_type'))
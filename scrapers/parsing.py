@@ -0,0 +1,287 @@
+"""
+Fast HTML extraction paths that avoid building a full BeautifulSoup tree
+"""
+
+import os
+import re
+import html
+import codecs
+import json
+import logging
+from html.parser import HTMLParser
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+import lxml.html
+
+try:
+    from selectolax.lexbor import LexborHTMLParser as SelectolaxParser
+except ImportError:  # optional backend
+    SelectolaxParser = None
+
+logger = logging.getLogger('scraper.parsing')
+
+# First <script type="application/ld+json"> block, matched on raw bytes
+JSON_LD_RE = re.compile(
+    rb'<script\b[^>]*\btype\s*=\s*["\']?application/ld\+json["\']?[^>]*>(.*?)</script\s*>',
+    re.IGNORECASE | re.DOTALL
+)
+# href attribute of every <a> tag, matched on raw bytes (double, single or unquoted values)
+ANCHOR_HREF_RE = re.compile(
+    rb'<a\s[^>]*?\bhref\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s"\'>]+))',
+    re.IGNORECASE
+)
+CHARSET_HEADER_RE = re.compile(r'charset\s*=\s*["\']?([\w.:-]+)', re.IGNORECASE)
+CHARSET_META_RE = re.compile(rb'<meta[^>]+charset\s*=\s*["\']?([\w.:-]+)', re.IGNORECASE)
+WHITESPACE_RE = re.compile(r'\s+')
+
+# Value columns used by detail rows (<div class="row"><b>Label:</b><div class="col-lg-7">Value</div></div>)
+VALUE_CLASSES = ('col-lg-7', 'col-md-7')
+
+BACKENDS = ('lxml', 'selectolax', 'html.parser')
+
+
+def normalize_text(text: str) -> str:
+    """Collapse whitespace the same way BaseScraper.clean_text does"""
+    return WHITESPACE_RE.sub(' ', text or '').strip()
+
+
+def sniff_encoding(content: bytes, content_type: Optional[str] = None) -> str:
+    """
+    Pick the page encoding without statistical charset detection
+    
+    Uses an explicit charset from the Content-Type header, then a <meta>
+    charset in the first 2KB, then UTF-8. A declared charset Python doesn't
+    know (misspelled or bogus) is skipped, so callers can always decode.
+    
+    Args:
+        content: Raw response body
+        content_type: Content-Type header value
+    
+    Returns:
+        Encoding name
+    """
+    declared = []
+    if content_type:
+        match = CHARSET_HEADER_RE.search(content_type)
+        if match:
+            declared.append(match.group(1))
+    match = CHARSET_META_RE.search(content[:2048])
+    if match:
+        declared.append(match.group(1).decode('ascii', 'replace'))
+    for name in declared:
+        try:
+            return codecs.lookup(name).name
+        except LookupError:
+            continue
+    return 'utf-8'
+
+
+def extract_json_ld(content: bytes, encoding: str = 'utf-8') -> Optional[Any]:
+    """
+    Pull the first JSON-LD block out of raw page bytes
+    
+    Args:
+        content: Raw page body
+        encoding: Page encoding
+    
+    Returns:
+        Decoded JSON value, or None if missing or invalid
+    """
+    match = JSON_LD_RE.search(content)
+    if not match:
+        return None
+    try:
+        return json.loads(match.group(1).decode(encoding, 'replace'))
+    except (ValueError, LookupError):
+        return None
+
+
+def iter_anchor_hrefs(content: bytes, encoding: str = 'utf-8') -> Iterator[str]:
+    """
+    Yield the href of every <a> tag without parsing the document
+    
+    Args:
+        content: Raw page body
+        encoding: Page encoding
+    
+    Yields:
+        Decoded href values (entities unescaped, not stripped)
+    """
+    for match in ANCHOR_HREF_RE.finditer(content):
+        raw = next((g for g in match.groups() if g is not None), b'')
+        href = raw.decode(encoding, 'replace')
+        if '&' in href:
+            href = html.unescape(href)
+        yield href
+
+
+def _has_class(class_attr: Optional[str], name: str) -> bool:
+    return bool(class_attr) and name in class_attr.split()
+
+
+class LxmlBackend:
+    """Detail rows via an lxml tree and XPath"""
+    
+    ROW_XPATH = "//div[contains(concat(' ', normalize-space(@class), ' '), ' row ')]"
+    
+    def label_rows(self, content: bytes, encoding: str) -> Dict[str, str]:
+        parser = lxml.html.HTMLParser(encoding=encoding)
+        root = lxml.html.document_fromstring(content, parser=parser)
+        rows = {}
+        for row in root.xpath(self.ROW_XPATH):
+            label = next(iter(row.iter('b')), None)
+            if label is None:
+                continue
+            value = None
+            for cls in VALUE_CLASSES:
+                value = next((d for d in row.iter('div') if d is not row and _has_class(d.get('class'), cls)), None)
+                if value is not None:
+                    break
+            if value is None:
+                continue
+            rows[normalize_text(label.text_content()).strip(':').strip()] = normalize_text(value.text_content())
+        return rows
+
+
+class SelectolaxBackend:
+    """Detail rows via selectolax (lexbor) CSS selectors"""
+    
+    def label_rows(self, content: bytes, encoding: str) -> Dict[str, str]:
+        tree = SelectolaxParser(content.decode(encoding, 'replace'))
+        rows = {}
+        for row in tree.css('div.row'):
+            label = row.css_first('b')
+            if label is None:
+                continue
+            value = None
+            for cls in VALUE_CLASSES:
+                value = row.css_first(f'div.{cls}')
+                if value is not None:
+                    break
+            if value is None:
+                continue
+            rows[normalize_text(label.text()).strip(':').strip()] = normalize_text(value.text())
+        return rows
+
+
+class _RowCollector(HTMLParser):
+    """
+    Streaming html.parser handler that only tracks div.row label/value pairs
+    
+    Every open div.row keeps its own context, so nested rows behave like
+    BeautifulSoup's find(): the first <b> and first value div anywhere
+    inside a row win.
+    """
+    
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.rows: List[Dict[str, Any]] = []
+        self._open_rows: List[Dict[str, Any]] = []
+        self._div_stack: List[tuple] = []
+        self._active_values: List[List[str]] = []
+        self._active_labels: List[List[str]] = []
+        self._b_depth = 0
+    
+    def handle_starttag(self, tag, attrs):
+        if tag == 'b':
+            if self._b_depth == 0:
+                self._active_labels = []
+                for row in self._open_rows:
+                    if row['label'] is None:
+                        row['label'] = []
+                        self._active_labels.append(row['label'])
+            self._b_depth += 1
+            return
+        if tag != 'div':
+            return
+        
+        class_attr = dict(attrs).get('class')
+        captures = []
+        for row in self._open_rows:
+            for idx, cls in enumerate(VALUE_CLASSES):
+                if row['values'][idx] is None and _has_class(class_attr, cls):
+                    row['values'][idx] = []
+                    captures.append(row['values'][idx])
+        self._active_values.extend(captures)
+        
+        row = None
+        if _has_class(class_attr, 'row'):
+            row = {'label': None, 'values': [None] * len(VALUE_CLASSES)}
+            self._open_rows.append(row)
+            self.rows.append(row)
+        self._div_stack.append((row, captures))
+    
+    def handle_endtag(self, tag):
+        if tag == 'b' and self._b_depth:
+            self._b_depth -= 1
+            if self._b_depth == 0:
+                self._active_labels = []
+            return
+        if tag == 'div' and self._div_stack:
+            row, captures = self._div_stack.pop()
+            if captures:
+                self._active_values = [v for v in self._active_values if all(v is not c for c in captures)]
+            if row is not None:
+                self._open_rows = [r for r in self._open_rows if r is not row]
+    
+    def handle_data(self, data):
+        for parts in self._active_labels:
+            parts.append(data)
+        for parts in self._active_values:
+            parts.append(data)
+
+
+class HtmlParserBackend:
+    """Detail rows via the stdlib streaming html.parser (no tree at all)"""
+    
+    def label_rows(self, content: bytes, encoding: str) -> Dict[str, str]:
+        collector = _RowCollector()
+        collector.feed(content.decode(encoding, 'replace'))
+        collector.close()
+        rows = {}
+        for row in collector.rows:
+            if row['label'] is None:
+                continue
+            value = next((v for v in row['values'] if v is not None), None)
+            if value is None:
+                continue
+            rows[normalize_text(''.join(row['label'])).strip(':').strip()] = normalize_text(''.join(value))
+        return rows
+
+
+def get_backend(name: Optional[str] = None):
+    """
+    Get a parser backend by name (defaults to HTML_PARSER_BACKEND, then lxml)
+    
+    Args:
+        name: 'lxml', 'selectolax' or 'html.parser'
+    
+    Returns:
+        Backend instance
+    """
+    name = (name or os.getenv('HTML_PARSER_BACKEND', 'lxml')).lower()
+    if name == 'selectolax':
+        if SelectolaxParser is not None:
+            return SelectolaxBackend()
+        logger.warning("selectolax is not installed, falling back to lxml parser backend")
+        return LxmlBackend()
+    if name == 'html.parser':
+        return HtmlParserBackend()
+    return LxmlBackend()
+
+
+def label_rows(content: Union[bytes, str], encoding: str = 'utf-8', backend=None) -> Dict[str, str]:
+    """
+    Extract div.row label -> value pairs from a detail page
+    
+    Args:
+        content: Raw page body (str is encoded with `encoding` first)
+        encoding: Page encoding
+        backend: Backend instance (defaults to get_backend())
+    
+    Returns:
+        Dictionary of label (without trailing colon) -> cleaned value text
+    """
+    if isinstance(content, str):
+        content = content.encode(encoding, 'replace')
+    return (backend or get_backend()).label_rows(content, encoding)
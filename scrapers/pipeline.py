@@ -0,0 +1,296 @@
+"""
+Streaming staged pipeline (discovery -> select -> fetch -> parse -> write)
+"""
+
+import time
+import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional
+from urllib.parse import urlparse
+
+logger = logging.getLogger('scraper.pipeline')
+
+# End-of-input marker, one per worker of the receiving stage
+_STOP = object()
+
+
+class Stage:
+    """
+    One pipeline stage: a function, a worker count and a bounded input queue
+    
+    Blocking stages run their function on a thread pool sized to the
+    worker count. Inline stages run on the event loop thread, one item at a
+    time, which keeps things like the scraper's database cursor on a single
+    thread. A fan-out stage's function returns an iterable; each item it
+    yields is sent downstream as soon as it is produced. Otherwise a None
+    result is dropped and anything else is passed on.
+    """
+    
+    def __init__(self, name: str, func: Callable[[Any], Any], workers: int = 1,
+                 queue_size: int = 100, blocking: bool = True, fan_out: bool = False):
+        """
+        Initialize stage
+        
+        Args:
+            name: Stage name used in stats
+            func: Function applied to every input item
+            workers: Concurrent workers (forced to 1 for inline stages)
+            queue_size: Capacity of the input queue (backpressure on the previous stage)
+            blocking: Run func on a thread pool instead of the event loop
+            fan_out: func returns an iterable of outputs
+        """
+        self.name = name
+        self.func = func
+        self.blocking = blocking
+        self.workers = max(1, workers) if blocking else 1
+        self.queue_size = max(1, queue_size)
+        self.fan_out = fan_out
+        self.queue: Optional[asyncio.Queue] = None
+        self.executor: Optional[ThreadPoolExecutor] = None
+        self.index = 0
+        self.received = 0
+        self.done = 0
+        self.emitted = 0
+        self.errors = 0
+        self.busy = 0
+        self._lock = threading.Lock()
+    
+    def count_emitted(self):
+        with self._lock:
+            self.emitted += 1
+
+
+class Pipeline:
+    """
+    Runs stages concurrently, connected by bounded asyncio queues
+    
+    A full queue blocks the stage feeding it, so no stage runs further
+    ahead than its downstream queue allows. Once stopped (stop() or the
+    should_stop signal) producers stop emitting and queued items are
+    drained without processing. stop(through=<stage>) only halts that stage
+    and the ones before it; later stages finish what is already queued.
+    """
+    
+    def __init__(self, stages: List[Stage], should_stop: Optional[Callable[[], bool]] = None,
+                 on_progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+                 progress_interval: float = 2.0):
+        """
+        Initialize pipeline
+        
+        Args:
+            stages: Stages in order; each stage's output is the next stage's input
+            should_stop: External stop signal
+            on_progress: Called on the event loop thread with snapshot() every progress_interval seconds
+            progress_interval: Seconds between progress callbacks
+        """
+        self.stages = stages
+        self.should_stop = should_stop or (lambda: False)
+        self.on_progress = on_progress
+        self.progress_interval = progress_interval
+        self._stopped = threading.Event()
+        self._cutoff = -1
+        self._started = time.monotonic()
+        self._loop = None
+        for idx, stage in enumerate(stages):
+            stage.index = idx
+    
+    @property
+    def stopped(self) -> bool:
+        if not self._stopped.is_set() and self.should_stop():
+            self._stopped.set()
+        return self._stopped.is_set()
+    
+    def stop(self, through: Optional[str] = None):
+        """
+        Stop producing new work (safe to call from any stage)
+        
+        Args:
+            through: Only halt this stage and the stages before it
+        """
+        if through is None:
+            self._stopped.set()
+            return
+        idx = next(stage.index for stage in self.stages if stage.name == through)
+        self._cutoff = max(self._cutoff, idx)
+    
+    def _halted(self, stage: Stage) -> bool:
+        return self.stopped or stage.index <= self._cutoff
+    
+    def run(self, items: Iterable[Any], seed: Optional[Dict[str, Iterable[Any]]] = None) -> Dict[str, Any]:
+        """
+        Push items through the pipeline until every stage is drained
+        
+        Args:
+            items: Input for the first stage
+            seed: Extra input for later stages, by stage name
+        
+        Returns:
+            Final snapshot()
+        """
+        return asyncio.run(self._run(items, seed or {}))
+    
+    async def _run(self, items: Iterable[Any], seed: Dict[str, Iterable[Any]]) -> Dict[str, Any]:
+        self._loop = asyncio.get_running_loop()
+        self._started = time.monotonic()
+        for stage in self.stages:
+            stage.queue = asyncio.Queue(maxsize=stage.queue_size)
+            if stage.blocking:
+                stage.executor = ThreadPoolExecutor(max_workers=stage.workers, thread_name_prefix=stage.name)
+        
+        # A stage's input is closed once everything that feeds it has finished
+        producers: List[List[asyncio.Task]] = [[] for _ in self.stages]
+        producers[0].append(asyncio.ensure_future(self._feed(self.stages[0], items)))
+        by_name = {stage.name: idx for idx, stage in enumerate(self.stages)}
+        for name, seed_items in seed.items():
+            idx = by_name[name]
+            producers[idx].append(asyncio.ensure_future(self._feed(self.stages[idx], seed_items)))
+        
+        workers = []
+        for idx, stage in enumerate(self.stages):
+            downstream = self.stages[idx + 1] if idx + 1 < len(self.stages) else None
+            tasks = [asyncio.ensure_future(self._worker(stage, downstream)) for _ in range(stage.workers)]
+            workers.extend(tasks)
+            if downstream:
+                producers[idx + 1].extend(tasks)
+        
+        closers = [
+            asyncio.ensure_future(self._close_when_done(stage, producers[idx]))
+            for idx, stage in enumerate(self.stages)
+        ]
+        reporter = asyncio.ensure_future(self._report()) if self.on_progress else None
+        
+        try:
+            await asyncio.gather(*workers)
+            await asyncio.gather(*closers)
+        finally:
+            if reporter:
+                reporter.cancel()
+            for stage in self.stages:
+                if stage.executor:
+                    stage.executor.shutdown(wait=True)
+        
+        snapshot = self.snapshot()
+        if self.on_progress:
+            self.on_progress(snapshot)
+        return snapshot
+    
+    async def _feed(self, stage: Stage, items: Iterable[Any]):
+        for item in items:
+            if self._halted(stage):
+                break
+            await stage.queue.put(item)
+    
+    async def _close_when_done(self, stage: Stage, producers: List[asyncio.Task]):
+        await asyncio.gather(*producers, return_exceptions=True)
+        for _ in range(stage.workers):
+            await stage.queue.put(_STOP)
+    
+    async def _emit(self, stage: Stage, item: Any):
+        await stage.queue.put(item)
+    
+    def _run_fan_out(self, stage: Stage, downstream: Optional[Stage], item: Any):
+        """Iterate a fan-out function on a worker thread, emitting as it yields"""
+        for result in stage.func(item):
+            if self._halted(stage):
+                break
+            if result is None:
+                continue
+            if downstream:
+                asyncio.run_coroutine_threadsafe(self._emit(downstream, result), self._loop).result()
+            stage.count_emitted()
+    
+    async def _worker(self, stage: Stage, downstream: Optional[Stage]):
+        while True:
+            item = await stage.queue.get()
+            if item is _STOP:
+                return
+            stage.received += 1
+            if self._halted(stage):
+                continue
+            
+            stage.busy += 1
+            result = None
+            try:
+                if stage.fan_out and stage.blocking:
+                    await self._loop.run_in_executor(stage.executor, self._run_fan_out, stage, downstream, item)
+                elif stage.fan_out:
+                    for output in stage.func(item):
+                        if self._halted(stage):
+                            break
+                        if output is not None and downstream:
+                            await self._emit(downstream, output)
+                        stage.count_emitted()
+                elif stage.blocking:
+                    result = await self._loop.run_in_executor(stage.executor, stage.func, item)
+                else:
+                    result = stage.func(item)
+            except Exception as e:
+                logger.error(f"Stage {stage.name} failed: {e}", exc_info=True)
+                stage.errors += 1
+            finally:
+                stage.busy -= 1
+                stage.done += 1
+            
+            if result is not None and not stage.fan_out:
+                if downstream:
+                    await self._emit(downstream, result)
+                stage.count_emitted()
+    
+    async def _report(self):
+        while True:
+            await asyncio.sleep(self.progress_interval)
+            try:
+                self.on_progress(self.snapshot())
+            except Exception as e:
+                logger.debug(f"Progress callback failed: {e}")
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Queue depths and throughput per stage
+        
+        Returns:
+            Dictionary of stage name -> {workers, queued, busy, received,
+            done, emitted, errors, per_second}
+        """
+        elapsed = max(time.monotonic() - self._started, 1e-6)
+        return {
+            stage.name: {
+                'workers': stage.workers,
+                'queued': stage.queue.qsize() if stage.queue else 0,
+                'busy': stage.busy,
+                'received': stage.received,
+                'done': stage.done,
+                'emitted': stage.emitted,
+                'errors': stage.errors,
+                'per_second': round(stage.done / elapsed, 2),
+            }
+            for stage in self.stages
+        }
+
+
+def limit_per_host(func: Callable[[str], Any], per_host: int) -> Callable[[str], Any]:
+    """
+    Wrap a blocking URL function so at most per_host calls run against one host
+    
+    Args:
+        func: Function taking a URL
+        per_host: Max concurrent calls per host
+    
+    Returns:
+        Wrapped function
+    """
+    semaphores: Dict[str, threading.BoundedSemaphore] = {}
+    lock = threading.Lock()
+    
+    def limited(url: str) -> Any:
+        host = urlparse(url).netloc
+        with lock:
+            semaphore = semaphores.get(host)
+            if semaphore is None:
+                semaphore = semaphores[host] = threading.BoundedSemaphore(max(1, per_host))
+        with semaphore:
+            return func(url)
+    
+    return limited
@@ -0,0 +1,182 @@
+"""
+Per-domain token-bucket rate limiting shared across threads and scrapers
+"""
+
+import time
+import logging
+import threading
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+
+logger = logging.getLogger('scraper.ratelimit')
+
+# Statuses that mean "slow down"
+THROTTLE_STATUSES = {429, 503}
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket
+    
+    Tokens refill continuously at `rate` per second up to `capacity`.
+    A rate of None disables limiting entirely.
+    """
+    
+    def __init__(self, rate: Optional[float], capacity: float = 1.0):
+        self.rate = rate
+        self.capacity = max(1.0, capacity)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _refill(self, now: float):
+        if self.rate:
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+    
+    def reserve(self) -> float:
+        """
+        Take one token, going into debt if none are available
+        
+        Returns:
+            Seconds the caller must wait before using the token
+        """
+        with self._lock:
+            if not self.rate:
+                return 0.0
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+    
+    def acquire(self):
+        """Block until a token is available"""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+
+class AdaptiveRateLimiter(TokenBucket):
+    """
+    Token bucket that backs off on 429/503 and recovers on healthy responses
+    
+    Multiplicative decrease on throttle responses (and a hard pause when the
+    server sends Retry-After), additive increase back toward the configured
+    rate after a run of healthy responses.
+    """
+    
+    def __init__(self, rate: Optional[float], capacity: float = 1.0,
+                 min_rate: float = 0.05, recover_after: int = 10):
+        super().__init__(rate, capacity)
+        self.base_rate = rate
+        self.min_rate = min_rate
+        self.recover_after = recover_after
+        self._healthy_streak = 0
+        self._paused_until = 0.0
+    
+    def configure(self, rate: Optional[float], capacity: float = 1.0):
+        """Change the target rate (e.g. after reading user_config)"""
+        with self._lock:
+            self.base_rate = rate
+            self.rate = rate
+            self.capacity = max(1.0, capacity)
+            self._tokens = min(self._tokens, self.capacity)
+            self._healthy_streak = 0
+    
+    def acquire(self):
+        """Block until a token is available and any Retry-After pause has passed"""
+        with self._lock:
+            pause = self._paused_until - time.monotonic()
+        if pause > 0:
+            time.sleep(pause)
+        super().acquire()
+    
+    def on_response(self, status_code: int, retry_after: Optional[str] = None):
+        """
+        Adapt the rate to a response
+        
+        Args:
+            status_code: HTTP status of the response
+            retry_after: Raw Retry-After header value, if any
+        """
+        with self._lock:
+            if not self.base_rate:
+                return
+            
+            if status_code in THROTTLE_STATUSES:
+                self._healthy_streak = 0
+                self.rate = max(self.min_rate, self.rate / 2)
+                delay = parse_retry_after(retry_after)
+                if delay:
+                    self._paused_until = max(self._paused_until, time.monotonic() + delay)
+                logger.warning(f"Throttled ({status_code}), rate lowered to {self.rate:.3f} req/s")
+                return
+            
+            if status_code < 500:
+                self._healthy_streak += 1
+                if self._healthy_streak >= self.recover_after and self.rate < self.base_rate:
+                    self.rate = min(self.base_rate, self.rate + self.base_rate * 0.1)
+                    self._healthy_streak = 0
+    
+    def effective_rate(self) -> Optional[float]:
+        """Current requests per second (None means unlimited)"""
+        with self._lock:
+            if self._paused_until > time.monotonic():
+                return 0.0
+            return self.rate
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header (delta-seconds or HTTP-date)
+    
+    Args:
+        value: Raw header value
+    
+    Returns:
+        Seconds to wait, or None if absent/unparseable
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+# Limiters are shared per domain across every scraper in the process
+_limiters: Dict[str, AdaptiveRateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(domain: str, delay_seconds: float, burst: float = 1.0) -> AdaptiveRateLimiter:
+    """
+    Get the shared limiter for a domain, creating or reconfiguring it
+    
+    Args:
+        domain: Host name the limiter applies to
+        delay_seconds: Target spacing between requests (0 disables limiting)
+        burst: Bucket capacity
+    
+    Returns:
+        AdaptiveRateLimiter
+    """
+    rate = 1.0 / delay_seconds if delay_seconds > 0 else None
+    
+    with _limiters_lock:
+        limiter = _limiters.get(domain)
+        if limiter is None:
+            limiter = AdaptiveRateLimiter(rate, burst)
+            _limiters[domain] = limiter
+        elif limiter.base_rate != rate or limiter.capacity != max(1.0, burst):
+            limiter.configure(rate, burst)
+        return limiter
@@ -0,0 +1,145 @@
+"""
+Retry policy with jittered exponential backoff and per-host circuit breakers
+"""
+
+import os
+import time
+import random
+import logging
+import threading
+from typing import Dict
+
+logger = logging.getLogger('scraper.retry')
+
+# Only these methods are safe to repeat automatically
+IDEMPOTENT_METHODS = {'GET', 'HEAD', 'OPTIONS'}
+
+# Responses worth retrying (throttling and transient server errors)
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+
+
+class RetryPolicy:
+    """Jittered exponential backoff ("full jitter")"""
+    
+    def __init__(self, max_retries: int = 3, base_delay: float = 1.0, max_delay: float = 30.0):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+    
+    @classmethod
+    def from_env(cls) -> 'RetryPolicy':
+        return cls(
+            max_retries=int(os.getenv('HTTP_MAX_RETRIES', '3')),
+            base_delay=float(os.getenv('HTTP_BACKOFF_BASE', '1')),
+            max_delay=float(os.getenv('HTTP_BACKOFF_MAX', '30')),
+        )
+    
+    def attempts_for(self, method: str) -> int:
+        """Total attempts allowed for an HTTP method"""
+        return self.max_retries + 1 if method.upper() in IDEMPOTENT_METHODS else 1
+    
+    def backoff(self, attempt: int) -> float:
+        """
+        Delay before retry number `attempt` (0-based)
+        
+        Args:
+            attempt: How many attempts have already failed, minus one
+        
+        Returns:
+            Seconds to sleep
+        """
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+
+class CircuitBreaker:
+    """
+    Per-host circuit breaker
+    
+    closed    -> requests flow; consecutive failures are counted
+    open      -> requests fail fast until reset_timeout has passed
+    half_open -> a single probe request is let through; success closes the
+                 circuit, failure opens it again
+    """
+    
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+    
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 60.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.trips = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+    
+    def allow_request(self) -> bool:
+        """Whether a request may be sent now"""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN:
+                if time.monotonic() - self._opened_at < self.reset_timeout:
+                    return False
+                self.state = self.HALF_OPEN
+                self._probe_in_flight = False
+            # Half open: let exactly one probe through
+            if self._probe_in_flight:
+                return False
+            self._probe_in_flight = True
+            return True
+    
+    def record_success(self):
+        with self._lock:
+            if self.state != self.CLOSED:
+                logger.info("Circuit closed after successful probe")
+            self.state = self.CLOSED
+            self.failures = 0
+            self._probe_in_flight = False
+    
+    def release_probe(self):
+        """End a half-open probe that said nothing about the host (e.g. a bad request)"""
+        with self._lock:
+            self._probe_in_flight = False
+    
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            self._probe_in_flight = False
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    self.trips += 1
+                    logger.warning(
+                        f"Circuit opened after {self.failures} consecutive failures, "
+                        f"probing again in {self.reset_timeout:.0f}s"
+                    )
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
+
+
+# Breakers are shared per host across every scraper in the process
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(host: str) -> CircuitBreaker:
+    """
+    Get the shared circuit breaker for a host
+    
+    Args:
+        host: Host name
+    
+    Returns:
+        CircuitBreaker
+    """
+    with _breakers_lock:
+        breaker = _breakers.get(host)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                failure_threshold=int(os.getenv('BREAKER_FAILURE_THRESHOLD', '5')),
+                reset_timeout=float(os.getenv('BREAKER_RESET_SECONDS', '60')),
+            )
+            _breakers[host] = breaker
+        return breaker
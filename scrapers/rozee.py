@@ -2,16 +2,66 @@
 Rozee.pk scraper - Pakistan's leading job portal
 """
 
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any
 from datetime import datetime, timedelta
 from .base import BaseScraper
+from .frontier import URLFrontier
+from .pipeline import Pipeline, Stage, limit_per_host
+from .urls import extract_rozee_job_id
+from .parsing import extract_json_ld, iter_anchor_hrefs, label_rows, sniff_encoding
 import json
 import re
+import time
+
+# Job detail URLs end in "-jobs-<numeric id>"
+JOB_URL_PATTERN = re.compile(r'-jobs-\d+$')
+HTML_TAG_RE = re.compile(r'<.*?>')
+LEADING_NUMBER_RE = re.compile(r'(\d+)')
 
 
 class RozeeScraper(BaseScraper):
     """Scraper for Rozee.pk job listings"""
     
+    # Job page fields: detail rows (<b>Label:</b> value), HTML fallbacks and regex fills
+    EXTRACTION_SPEC = {
+        'rows': {
+            'Industry': 'industry',
+            'Functional Area': 'functional_area',
+            'Career Level': 'career_level',
+            'Job Shift': 'job_shift',
+            'Total Positions': {'column': 'total_positions', 'coerce': 'leading_int', 'default': 1},
+            'Minimum Education': 'minimum_education',
+            'Degree Title': 'degree_title',
+            'Gender': 'gender',
+            'Age': 'age_range',
+            'Apply Before': {'column': 'application_deadline', 'coerce': 'date', 'format': '%b %d, %Y'},
+        },
+        'selectors': {
+            # Main content first, then any h1 that is not a sidebar/nav heading, then <title>
+            'title': [
+                {
+                    'selectors': ['div.job-header h1', 'main h1', 'article h1', 'h1'],
+                    'exclude': ['Recommended Jobs', 'Similar Jobs', 'Jobs', 'Related Jobs', 'Popular Jobs'],
+                },
+                {'selectors': ['title'], 'remove': [' - ROZEE.PK', ' | ROZEE.PK'], 'min_length': 6},
+            ],
+            'company': [{'selectors': ['a[href*="/company/"]'], 'default': 'Unknown Company'}],
+            'description': [{'selectors': ['div.job-description', 'div#job-description']}],
+        },
+        'patterns': {
+            # "10+ years", "5-7 years", "minimum 3 years"
+            'minimum_experience': {
+                'source': 'description',
+                'regexes': [
+                    r'(\d+\+?\s*(?:to|-)\s*\d+|\d+\+)\s*years?',
+                    r'minimum\s+(\d+)\s*years?',
+                    r'at least\s+(\d+)\s*years?',
+                ],
+                'flags': re.IGNORECASE,
+            },
+        },
+    }
+    
     def __init__(self):
         super().__init__(
             site_name='rozee',
@@ -32,35 +82,38 @@ class RozeeScraper(BaseScraper):
         Returns:
             Scraping statistics
         """
-        job_urls = []
+        # Discovered URLs, deduplicated and scheduled freshest first; URLs left
+        # pending by an interrupted run are picked up again
+        frontier = self.open_frontier()
+        try:
+            return self.scrape_frontier(frontier, mode)
+        finally:
+            # Buffered jobs are written before the frontier forgets their URLs
+            self.flush_jobs()
+            frontier.save()
+    
+    def scrape_frontier(self, frontier: URLFrontier, mode: str) -> Dict[str, int]:
+        """
+        Discover job URLs into the frontier and fetch them as they arrive
         
-        # Step 1: Define comprehensive job sources with pagination support
-        sources = self.get_job_sources(mode)
+        Runs discovery -> select -> fetch -> parse -> write as a streaming
+        pipeline: detail fetches start as soon as the first listing page
+        yields URLs, and bounded queues keep each stage from running ahead.
+        Each listing page's URLs are checked against the jobs table in one
+        query, and the incremental stop rules run on that known/unknown split.
+        full_refresh fetches known jobs too; only those whose content hash
+        changed are rewritten.
         
-        # Collect job URLs from all sources
-        for source_name, source_url, max_pages in sources:
-            if self.should_stop():
-                break
-            
-            # Scrape with pagination
-            urls_from_source = self.scrape_source_with_pagination(source_name, source_url, max_pages)
-            
-            # Add to main list (avoiding duplicates)
-            for url in urls_from_source:
-                if url not in job_urls:
-                    job_urls.append(url)
+        Args:
+            frontier: URL frontier for this run
+            mode: 'incremental' or 'full_refresh'
             
-            self.logger.info(f"Total unique job URLs collected: {len(job_urls)}")
-        
-        self.logger.info(f"Total unique job URLs found: {len(job_urls)}")
-        total_urls = len(job_urls)
-        
-        if total_urls == 0:
-            self.logger.warning("No job URLs found!")
-            return self.stats
-        
-        # Update progress
-        self.update_progress(f"Found {total_urls} job URLs. Starting to scrape...", 20)
+        Returns:
+            Scraping statistics
+        """
+        # Step 1: Define comprehensive job sources with pagination support
+        sources = self.get_job_sources(mode)
+        restored = frontier.pending()
         
         # Step 2: Scrape job details with SMART incremental mode
         consecutive_seen = 0
@@ -74,64 +127,146 @@ class RozeeScraper(BaseScraper):
             min_check_before_percentage = 50
             existing_percentage_threshold = 0.8
         
-        for idx, job_url in enumerate(job_urls, 1):
-            # Check stop signal
-            if self.should_stop():
-                self.logger.info(f"Stop signal received at job {idx}")
-                break
-            
-            # Calculate progress (20% to 90% range for scraping)
-            progress = 20 + int((idx / total_urls) * 70)
-            
-            # Update progress
-            self.update_progress(
-                f"Scraping job {idx}/{total_urls}: {self.stats['jobs_new']} new, {self.stats['jobs_skipped']} skipped",
-                progress
-            )
-            
-            self.logger.info(f"Scraping job {idx}/{total_urls}: {job_url}")
-            total_checked += 1
-            
-            # Check if already exists
-            if self.job_exists(job_url):
+        def discover(source):
+            """Walk one source's listing pages (worker thread); yields the number of new URLs per page"""
+            source_rank, (source_name, source_url, max_pages) = source
+            for new_urls in self.scrape_source_with_pagination(source_name, source_url, max_pages, frontier, source_rank):
+                yield len(new_urls)
+            self.logger.info(f"Finished {source_name}; total unique job URLs collected: {len(frontier)}")
+        
+        def plan_batch(known: List[bool]) -> int:
+            """
+            Apply the smart-stop rules to a batch already split into known/unknown
+            
+            Returns how many URLs of the batch (in fetch order) to keep; the
+            cut falls on the URL that triggers a stop, so the result matches
+            checking the URLs one by one.
+            """
+            nonlocal consecutive_seen, total_checked
+            for position, exists in enumerate(known):
+                total_checked += 1
+                if not exists:
+                    # Reset consecutive counter when we find a new job
+                    consecutive_seen = 0
+                    continue
+                
                 consecutive_seen += 1
-                self.stats['jobs_skipped'] += 1
+                self.incr_stat('jobs_skipped')
                 
-                # Smart incremental mode stopping
-                if mode == 'incremental':
-                    # Check 1: Too many consecutive existing jobs
-                    if consecutive_seen >= max_consecutive:
-                        self.logger.info(f"Stopping: {consecutive_seen} consecutive existing jobs found")
-                        break
-                    
-                    # Check 2: High percentage of existing jobs (after minimum checked)
-                    if total_checked >= min_check_before_percentage:
-                        existing_percentage = self.stats['jobs_skipped'] / total_checked
-                        if existing_percentage >= existing_percentage_threshold:
-                            self.logger.info(f"Stopping: {existing_percentage*100:.1f}% of jobs already exist (checked {total_checked} jobs)")
-                            break
+                # Check 1: Too many consecutive existing jobs
+                if consecutive_seen >= max_consecutive:
+                    self.logger.info(f"Stopping: {consecutive_seen} consecutive existing jobs found")
+                    return position + 1
                 
-                continue
-            
-            # Reset consecutive counter when we find a new job
-            consecutive_seen = 0
-            
-            # Scrape job details
-            job_data = self.scrape_job_detail(job_url)
-            
+                # Check 2: High percentage of existing jobs (after minimum checked)
+                if total_checked >= min_check_before_percentage:
+                    existing_percentage = self.stats['jobs_skipped'] / total_checked
+                    if existing_percentage >= existing_percentage_threshold:
+                        self.logger.info(f"Stopping: {existing_percentage*100:.1f}% of jobs already exist (checked {total_checked} jobs)")
+                        return position + 1
+            return len(known)
+        
+        def select(count):
+            """Take the freshest pending URLs and yield the ones that need a fetch (event loop thread)"""
+            batch = []
+            while len(batch) < count:
+                job_url = frontier.pop()
+                if job_url is None:
+                    break
+                batch.append(job_url)
+            if not batch:
+                return
+            
+            # One query for the whole batch instead of one per URL (full_refresh
+            # refetches known jobs anyway, so it doesn't need to ask)
+            existing = self.known_job_urls(batch) if mode == 'incremental' else set()
+            known = [job_url in existing for job_url in batch]
+            keep = plan_batch(known)
+            
+            for job_url, exists in zip(batch[:keep], known):
+                if exists:
+                    frontier.mark_done(job_url)
+                    continue
+                self.logger.info(f"Scraping job ({total_checked} checked of {len(frontier)}): {job_url}")
+                yield job_url
+            
+            if keep < len(batch):
+                # The rest of the batch was popped but is dropped, like everything still queued
+                for job_url in batch[keep:]:
+                    frontier.mark_done(job_url)
+                frontier.clear_pending()
+                pipeline.stop(through='select')
+        
+        # On an early stop, select and everything before it halt; URLs already
+        # selected as new are still fetched and written
+        
+        def fetch(job_url):
+            """Download a job page (worker thread)"""
+            response = self.make_request(job_url)
+            if not response:
+                return job_url, None, None
+            return job_url, response.content, response.headers.get('Content-Type')
+        
+        def parse(page):
+            """Turn page bytes into job data (worker thread, or the parse pool)"""
+            job_url, content, content_type = page
+            if content is None:
+                return job_url, None
+            return job_url, self.parse_fetched_page(content, job_url, content_type)
+        
+        def write(result):
+            """Store a fetched job (event loop thread)"""
+            job_url, job_data = result
+            frontier.mark_done(job_url)
             if job_data:
-                self.stats['jobs_found'] += 1
+                self.incr_stat('jobs_found')
                 # Try to insert job
                 if not self.insert_job(job_data):
                     # If insert failed, log what we got
                     self.logger.warning(f"Failed to insert job. Data: title={job_data.get('title', 'MISSING')}, company={job_data.get('company', 'MISSING')}")
             else:
                 self.logger.error(f"Failed to scrape data from {job_url}")
-                self.stats['errors'] += 1
-                
-            # Be polite - delay between requests
-            import time
-            time.sleep(self.scrape_delay)
+                self.incr_stat('errors')
+        
+        def report(snapshot):
+            """Publish queue depths and per-stage throughput"""
+            self.stats['pipeline'] = snapshot
+            # Time-based flush, so a slow trickle of jobs is still written promptly
+            self.write_buffer.flush_if_due()
+            discovered = max(len(frontier), 1)
+            self.update_progress(
+                f"Scraping: {len(frontier)} URLs found, {total_checked} checked, "
+                f"{self.stats['jobs_new']} new, {self.stats['jobs_skipped']} skipped",
+                20 + int((total_checked / discovered) * 70)
+            )
+        
+        queue_size = self.pipeline_queue_size
+        pipeline = Pipeline(
+            [
+                Stage('discover', discover, workers=self.discovery_workers, queue_size=queue_size, fan_out=True),
+                Stage('select', select, queue_size=queue_size, blocking=False, fan_out=True),
+                # make_request enforces the shared rate limit; per-host cap on top
+                Stage('fetch', limit_per_host(fetch, self.fetch_per_host), workers=self.fetch_concurrency, queue_size=queue_size),
+                Stage('parse', parse, workers=self.parse_stage_workers, queue_size=queue_size),
+                Stage('write', write, queue_size=queue_size, blocking=False),
+            ],
+            should_stop=self.should_stop,
+            on_progress=report,
+            progress_interval=self.progress_interval
+        )
+        
+        self.update_progress("Discovering and scraping jobs...", 20)
+        # URLs restored from an interrupted run go straight to select
+        batch_size = max(1, self.existence_batch_size)
+        restored_batches = [min(batch_size, restored - start) for start in range(0, restored, batch_size)]
+        pipeline.run(enumerate(sources), seed={'select': restored_batches})
+        
+        if self.should_stop():
+            self.logger.info(f"Stop signal received after checking {total_checked} jobs")
+        
+        self.logger.info(f"Total unique job URLs found: {len(frontier)}")
+        if len(frontier) == 0:
+            self.logger.warning("No job URLs found!")
         
         return self.stats
     
@@ -229,19 +364,27 @@ class RozeeScraper(BaseScraper):
                 ('Banking Jobs', 'https://www.rozee.pk/industry/banking-financial-services-jobs', 2),
             ]
     
-    def scrape_source_with_pagination(self, source_name: str, base_url: str, max_pages: int) -> list:
+    def scrape_source_with_pagination(self, source_name: str, base_url: str, max_pages: int,
+                                      frontier: URLFrontier, source_rank: int = 0) -> Iterator[List[str]]:
         """
         Scrape job URLs from a source with pagination support
         
+        A generator: each listing page's URLs are added to the frontier and
+        the new ones yielded as one batch right away, so detail fetches can
+        start before the source is exhausted and existence checks can be
+        made per page rather than per URL.
+        
         Args:
             source_name: Name of the source for logging
             base_url: Base URL to scrape
             max_pages: Maximum number of pages to scrape
+            frontier: Frontier that receives the discovered URLs
+            source_rank: Position of the source (fetch priority)
             
-        Returns:
-            List of job URLs found
+        Yields:
+            Per listing page, the job URLs not seen before in this run
         """
-        job_urls = []
+        source_urls = set()
         
         for page_num in range(1, max_pages + 1):
             if self.should_stop():
@@ -260,8 +403,8 @@ class RozeeScraper(BaseScraper):
             
             self.logger.info(f"Fetching {source_name} (page {page_num}/{max_pages})...")
             
-            # Fetch page
-            response = self.make_request(page_url)
+            # Fetch page (revalidated against the listing cache)
+            response = self.make_request(page_url, conditional=True)
             if not response:
                 self.logger.warning(f"Failed to fetch {source_name} page {page_num}")
                 # If first page fails, stop. If later page fails, might be end of results
@@ -270,57 +413,76 @@ class RozeeScraper(BaseScraper):
                 else:
                     continue
             
-            soup = self.parse_html(response.text)
-            if not soup:
-                break
-            
-            # Find all job links
-            job_links = soup.find_all('a', href=re.compile(r'-jobs-\d+$'))
+            # Unchanged since last run: reuse the URLs extracted then, no parsing
+            page_links = self.cached_extraction(page_url, response)
+            if page_links is not None:
+                self.logger.info(f"{source_name} page {page_num} not modified, reusing {len(page_links)} cached URLs")
+            else:
+                if response.status_code == 304:
+                    # Cache entry vanished between request and lookup; fetch the full page
+                    response = self.make_request(page_url)
+                    if not response:
+                        continue
+                
+                page_links = self.extract_job_links(
+                    response.content,
+                    sniff_encoding(response.content, response.headers.get('Content-Type'))
+                )
+                self.cache_extraction(page_url, response, page_links)
             
-            if not job_links:
+            if not page_links:
                 self.logger.info(f"No job links found on {source_name} page {page_num}, stopping pagination")
                 break
             
-            # Extract and normalize URLs
+            # Validate and add
             page_urls_found = 0
-            for link in job_links:
-                url = link.get('href')
-                if url:
-                    # Clean and normalize
-                    url = url.strip()
-                    
-                    # Handle different URL formats
-                    if url.startswith('http'):
-                        full_url = url
-                    elif url.startswith('//'):
-                        full_url = f"https:{url}"
-                    elif url.startswith('/'):
-                        full_url = f"{self.base_url}{url}"
-                    else:
-                        full_url = f"{self.base_url}/{url}"
-                    
-                    # Clean double slashes
-                    full_url = full_url.replace('http://', 'HTTPTEMP').replace('https://', 'HTTPSTEMP')
-                    full_url = full_url.replace('//', '/')
-                    full_url = full_url.replace('HTTPTEMP', 'http://').replace('HTTPSTEMP', 'https://')
-                    
-                    # Validate and add
-                    if 'rozee.pk' in full_url and '-jobs-' in full_url and full_url not in job_urls:
-                        job_urls.append(full_url)
-                        page_urls_found += 1
-            
-            self.logger.info(f"Found {page_urls_found} unique job URLs on {source_name} page {page_num} (total from {source_name}: {len(job_urls)})")
+            new_urls = []
+            for full_url in page_links:
+                if 'rozee.pk' in full_url and '-jobs-' in full_url and full_url not in source_urls:
+                    source_urls.add(full_url)
+                    page_urls_found += 1
+                    if frontier.add(full_url, source_name, source_rank, page_num):
+                        new_urls.append(full_url)
+            if new_urls:
+                yield new_urls
+            
+            self.logger.info(f"Found {page_urls_found} unique job URLs on {source_name} page {page_num} (total from {source_name}: {len(source_urls)})")
             
             # If we found very few jobs on this page, likely near the end
             if page_urls_found < 5 and page_num > 1:
                 self.logger.info(f"Few jobs found on page {page_num}, stopping pagination for {source_name}")
                 break
+    
+    def extract_job_links(self, content: bytes, encoding: str = 'utf-8') -> List[str]:
+        """
+        Extract canonical job detail URLs from a listing page
+        
+        Scans anchor hrefs straight out of the raw bytes instead of building
+        a document tree; listing pages are large and only links matter.
+        
+        Args:
+            content: Raw listing page body
+            encoding: Page encoding
             
-            # Small delay between pages
-            import time
-            time.sleep(0.5)
+        Returns:
+            Unique canonical job URLs in page order
+        """
+        page_links = []
+        seen = set()
+        for href in iter_anchor_hrefs(content, encoding):
+            full_url = self.canonical_url(href)
+            if not full_url or full_url in seen or not JOB_URL_PATTERN.search(full_url):
+                continue
+            
+            seen.add(full_url)
+            page_links.append(full_url)
         
-        return job_urls
+        return page_links
+    
+    def job_key(self, apply_url: str) -> str:
+        """Rozee jobs are keyed by their numeric id when the URL has one"""
+        job_id = extract_rozee_job_id(apply_url)
+        return f"rozee-job:{job_id}" if job_id else self.canonical_url(apply_url)
     
     def scrape_job_detail(self, job_url: str) -> Optional[Dict[str, Any]]:
         """
@@ -333,12 +495,145 @@ class RozeeScraper(BaseScraper):
         Returns:
             Job data dictionary or None
         """
+        response = self.make_request(job_url)
+        if not response:
+            return None
+        
+        return self.parse_fetched_page(response.content, job_url, response.headers.get('Content-Type'))
+    
+    def is_job_detail_url(self, url: str) -> bool:
+        """Whether a URL is a Rozee job detail page"""
+        return bool(JOB_URL_PATTERN.search(url))
+    
+    def parse_job_page(self, content, job_url: str, content_type: str = None) -> Optional[Dict[str, Any]]:
+        """
+        Parse a job detail page (live or archived)
+        
+        Tries the fast path first (JSON-LD regex on raw bytes plus detail rows
+        from the configured parser backend) and only builds a full
+        BeautifulSoup tree when that fails.
+        
+        Args:
+            content: Raw page bytes (or already decoded HTML)
+            job_url: URL of the job detail page
+            content_type: Content-Type header, used to pick the encoding
+            
+        Returns:
+            Job data dictionary or None
+        """
+        if isinstance(content, str):
+            content = content.encode('utf-8')
+            content_type = 'text/html; charset=utf-8'
+        encoding = sniff_encoding(content, content_type)
+        started = time.perf_counter()
+        
         try:
-            response = self.make_request(job_url)
-            if not response:
+            job_data = self.parse_job_page_fast(content, job_url, encoding)
+            if job_data is not None:
+                self.incr_stat('parse_fast_path')
+                return job_data
+            
+            self.incr_stat('parse_fallback')
+            return self.parse_job_page_soup(content.decode(encoding, 'replace'), job_url)
+        finally:
+            self.record_parse_time(started)
+    
+    def parse_job_page_fast(self, content: bytes, job_url: str, encoding: str) -> Optional[Dict[str, Any]]:
+        """
+        Build job data from JSON-LD and detail rows without BeautifulSoup
+        
+        Args:
+            content: Raw page bytes
+            job_url: URL of the job detail page
+            encoding: Page encoding
+            
+        Returns:
+            Job data dictionary, or None if the page needs the full soup path
+        """
+        try:
+            job_json = extract_json_ld(content, encoding)
+            if not isinstance(job_json, dict) or not str(job_json.get('title', '')).strip():
                 return None
             
-            soup = self.parse_html(response.text)
+            job_data = self.job_data_from_json_ld(job_json, job_url)
+            self.apply_detail_rows(label_rows(content, encoding, self.parser_backend), job_data)
+            return job_data
+            
+        except Exception as e:
+            self.logger.debug(f"Fast parse failed for {job_url}, falling back to soup: {e}")
+            return None
+    
+    def job_data_from_json_ld(self, job_json: Dict[str, Any], job_url: str) -> Dict[str, Any]:
+        """
+        Map a JobPosting JSON-LD object to job fields
+        
+        Args:
+            job_json: Decoded JSON-LD
+            job_url: URL of the job detail page
+            
+        Returns:
+            Job data dictionary
+        """
+        title = job_json.get('title', '').strip()
+        
+        # Extract data from structured JSON
+        job_data = {
+            'source_site': self.site_name,
+            'apply_url': job_url,
+            'title': title,
+            'company': job_json.get('hiringOrganization', {}).get('name', 'Unknown'),
+            'description': self.clean_html(job_json.get('description', title)),  # Fallback to title
+            'posted_date': self.parse_json_date(job_json.get('datePosted')),
+            'job_type': job_json.get('employmentType', ''),
+        }
+        
+        # Location
+        location = job_json.get('jobLocation', {}).get('address', {})
+        if location:
+            job_data['location'] = location.get('addressLocality', '')
+        
+        # Salary with currency and period
+        salary_info = job_json.get('baseSalary', {}).get('value', {})
+        if salary_info and salary_info.get('value'):
+            job_data['salary'] = salary_info.get('value', '')
+        
+        base_salary = job_json.get('baseSalary', {})
+        if base_salary:
+            job_data['salary_currency'] = base_salary.get('currency', 'PKR')
+            if base_salary.get('value', {}).get('unitText'):
+                job_data['salary_period'] = base_salary['value']['unitText']
+        
+        # Company info
+        hiring_org = job_json.get('hiringOrganization', {})
+        if hiring_org:
+            if hiring_org.get('logo'):
+                job_data['company_logo_url'] = hiring_org['logo']
+            if hiring_org.get('sameAs'):
+                job_data['company_profile_url'] = hiring_org['sameAs']
+        
+        # Application deadline
+        if job_json.get('validThrough'):
+            job_data['application_deadline'] = self.parse_json_date(job_json.get('validThrough'))
+        
+        # External job ID from URL
+        job_data['external_job_id'] = extract_rozee_job_id(job_url)
+        
+        return job_data
+    
+    def parse_job_page_soup(self, html: str, job_url: str) -> Optional[Dict[str, Any]]:
+        """
+        Parse a job detail page with a full BeautifulSoup tree
+        Rozee.pk includes structured JSON-LD data in job pages
+        
+        Args:
+            html: Page HTML
+            job_url: URL of the job detail page
+            
+        Returns:
+            Job data dictionary or None
+        """
+        try:
+            soup = self.parse_html(html)
             if not soup:
                 return None
             
@@ -355,47 +650,7 @@ class RozeeScraper(BaseScraper):
                         self.logger.warning(f"No title found in JSON-LD for {job_url}")
                         return self.parse_job_html(soup, job_url)
                     
-                    # Extract data from structured JSON
-                    job_data = {
-                        'source_site': self.site_name,
-                        'apply_url': job_url,
-                        'title': title,
-                        'company': job_json.get('hiringOrganization', {}).get('name', 'Unknown'),
-                        'description': self.clean_html(job_json.get('description', title)),  # Fallback to title
-                        'posted_date': self.parse_json_date(job_json.get('datePosted')),
-                        'job_type': job_json.get('employmentType', ''),
-                    }
-                    
-                    # Location
-                    location = job_json.get('jobLocation', {}).get('address', {})
-                    if location:
-                        job_data['location'] = location.get('addressLocality', '')
-                    
-                    # Salary with currency and period
-                    salary_info = job_json.get('baseSalary', {}).get('value', {})
-                    if salary_info and salary_info.get('value'):
-                        job_data['salary'] = salary_info.get('value', '')
-                    
-                    base_salary = job_json.get('baseSalary', {})
-                    if base_salary:
-                        job_data['salary_currency'] = base_salary.get('currency', 'PKR')
-                        if base_salary.get('value', {}).get('unitText'):
-                            job_data['salary_period'] = base_salary['value']['unitText']
-                    
-                    # Company info
-                    hiring_org = job_json.get('hiringOrganization', {})
-                    if hiring_org:
-                        if hiring_org.get('logo'):
-                            job_data['company_logo_url'] = hiring_org['logo']
-                        if hiring_org.get('sameAs'):
-                            job_data['company_profile_url'] = hiring_org['sameAs']
-                    
-                    # Application deadline
-                    if job_json.get('validThrough'):
-                        job_data['application_deadline'] = self.parse_json_date(job_json.get('validThrough'))
-                    
-                    # External job ID from URL
-                    job_data['external_job_id'] = job_url.split('-')[-1] if '-' in job_url else None
+                    job_data = self.job_data_from_json_ld(job_json, job_url)
                     
                     # Now parse HTML for additional fields not in JSON-LD
                     self.enrich_job_data_from_html(soup, job_data)
@@ -409,7 +664,7 @@ class RozeeScraper(BaseScraper):
             return self.parse_job_html(soup, job_url)
             
         except Exception as e:
-            self.logger.error(f"Error scraping job detail {job_url}: {e}")
+            self.logger.error(f"Error parsing job detail {job_url}: {e}")
             return None
     
     def parse_job_html(self, soup, job_url: str) -> Optional[Dict[str, Any]]:
@@ -423,37 +678,9 @@ class RozeeScraper(BaseScraper):
             }
             
             # Try to find title - REQUIRED FIELD
-            # Look in main content area, NOT sidebars
-            title = None
-            
-            # Try to find main content area first
-            main_content = soup.find('div', class_='job-header') or soup.find('main') or soup.find('article')
-            
-            if main_content:
-                title = main_content.find('h1')
-            
-            # If not found in main content, try page-wide h1 (but filter out sidebar titles)
-            if not title:
-                for h1 in soup.find_all('h1'):
-                    title_text = self.clean_text(h1.get_text())
-                    # Skip common sidebar/nav titles
-                    if title_text and title_text not in ['Recommended Jobs', 'Similar Jobs', 'Jobs', 'Related Jobs', 'Popular Jobs']:
-                        title = h1
-                        break
-            
-            # Extract from page <title> tag as last resort
-            if not title:
-                page_title = soup.find('title')
-                if page_title:
-                    title_text = self.clean_text(page_title.get_text())
-                    # Remove common suffixes from page title
-                    title_text = title_text.replace(' - ROZEE.PK', '').replace(' | ROZEE.PK', '').strip()
-                    if title_text and len(title_text) > 5:
-                        job_data['title'] = title_text
-            
-            # If we have a title element, extract text
+            title = self.extraction.select(soup, 'title')
             if title:
-                job_data['title'] = self.clean_text(title.get_text())
+                job_data['title'] = title
             
             # Still no title? Extract from URL
             if not job_data.get('title') or job_data['title'].strip() == '':
@@ -468,19 +695,8 @@ class RozeeScraper(BaseScraper):
                 self.logger.error(f"No valid title found for {job_url}")
                 return None
             
-            # Try to find company name
-            company = soup.find('a', href=re.compile(r'/company/'))
-            if company:
-                job_data['company'] = self.clean_text(company.get_text())
-            else:
-                job_data['company'] = 'Unknown Company'
-            
-            # Try to find description
-            desc = soup.find('div', class_='job-description') or soup.find('div', {'id': 'job-description'})
-            if desc:
-                job_data['description'] = self.clean_text(desc.get_text())
-            else:
-                job_data['description'] = job_data.get('title', 'No description available')
+            job_data['company'] = self.extraction.select(soup, 'company')
+            job_data['description'] = self.extraction.select(soup, 'description') or job_data['title']
             
             self.logger.info(f"Parsed job from HTML: {job_data['title']} at {job_data['company']}")
             
@@ -500,9 +716,8 @@ class RozeeScraper(BaseScraper):
         """
         try:
             # Find all the detail rows (they follow pattern: <b>Label:</b> Value)
-            rows = soup.find_all('div', class_='row')
-            
-            for row in rows:
+            rows = {}
+            for row in soup.find_all('div', class_='row'):
                 label_elem = row.find('b')
                 if not label_elem:
                     continue
@@ -513,65 +728,30 @@ class RozeeScraper(BaseScraper):
                 if not value_elem:
                     continue
                 
-                value = self.clean_text(value_elem.get_text())
-                
-                # Map labels to fields
-                if label == 'Industry':
-                    job_data['industry'] = value
-                elif label == 'Functional Area':
-                    job_data['functional_area'] = value
-                elif label == 'Career Level':
-                    job_data['career_level'] = value
-                elif label == 'Job Shift':
-                    job_data['job_shift'] = value
-                elif label == 'Total Positions':
-                    # Extract number from "X Post" or "X Posts"
-                    positions = value.split()[0]
-                    try:
-                        job_data['total_positions'] = int(positions)
-                    except:
-                        job_data['total_positions'] = 1
-                elif label == 'Minimum Education':
-                    job_data['minimum_education'] = value
-                elif label == 'Degree Title':
-                    job_data['degree_title'] = value
-                elif label == 'Gender':
-                    job_data['gender'] = value
-                elif label == 'Age':
-                    job_data['age_range'] = value
-                elif label == 'Apply Before':
-                    # Parse date from "Nov 15, 2025" format
-                    try:
-                        from datetime import datetime
-                        date_obj = datetime.strptime(value, '%b %d, %Y').date()
-                        job_data['application_deadline'] = date_obj
-                    except:
-                        pass
-            
-            # Try to extract experience from description if not found
-            if not job_data.get('minimum_experience'):
-                desc = job_data.get('description', '')
-                # Look for patterns like "10+ years", "5-7 years", "minimum 3 years"
-                import re
-                exp_patterns = [
-                    r'(\d+\+?\s*(?:to|-)\s*\d+|\d+\+)\s*years?',
-                    r'minimum\s+(\d+)\s*years?',
-                    r'at least\s+(\d+)\s*years?',
-                ]
-                for pattern in exp_patterns:
-                    match = re.search(pattern, desc, re.IGNORECASE)
-                    if match:
-                        job_data['minimum_experience'] = match.group(0)
-                        break
+                rows[label] = self.clean_text(value_elem.get_text())
+            
+            self.apply_detail_rows(rows, job_data)
             
         except Exception as e:
             self.logger.debug(f"Error enriching job data from HTML: {e}")
     
+    def apply_detail_rows(self, rows: Dict[str, str], job_data: Dict[str, Any]) -> None:
+        """
+        Map detail-row labels to job fields
+        Modifies job_data in place
+        
+        Args:
+            rows: Label -> value pairs from the job page
+            job_data: Job data to enrich
+        """
+        self.extraction.apply_rows(rows, job_data)
+        
+        # Try to extract experience from description if not found
+        self.extraction.apply_patterns(job_data)
+    
     def clean_html(self, html_text: str) -> str:
         """Remove HTML tags from text"""
-        import re
-        clean = re.compile('<.*?>')
-        return re.sub(clean, '', html_text)
+        return HTML_TAG_RE.sub('', html_text)
     
     def parse_json_date(self, date_str: str) -> datetime.date:
         """Parse ISO date string"""
@@ -666,8 +846,6 @@ class RozeeScraper(BaseScraper):
         Returns:
             Date object
         """
-        import re
-        
         date_text = date_text.lower().strip()
         today = datetime.now().date()
         
@@ -677,7 +855,7 @@ class RozeeScraper(BaseScraper):
             return today - timedelta(days=1)
         else:
             # Extract number
-            match = re.search(r'(\d+)', date_text)
+            match = LEADING_NUMBER_RE.search(date_text)
             if match:
                 num = int(match.group(1))
                 
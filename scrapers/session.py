@@ -0,0 +1,243 @@
+"""
+Pooled keep-alive HTTP sessions for scrapers
+"""
+
+import os
+import socket
+import threading
+import time
+import logging
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple, Any
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.util.connection import allowed_gai_family
+
+logger = logging.getLogger('scraper.session')
+
+# Process-wide sessions keyed by pool size (used when HTTP_SHARED_SESSION=true)
+_shared_sessions: Dict[int, requests.Session] = {}
+_shared_lock = threading.Lock()
+
+
+class DNSCache:
+    """
+    Small bounded TTL cache of resolved addresses for scraper connections
+    
+    urllib3 resolves the host every time it opens a connection, so repeated
+    reconnects to the same site (after idle timeouts or pool overflow) would
+    otherwise hit the resolver each time. Only sessions from build_session
+    use it (through CachedDNSAdapter); socket.getaddrinfo is left alone, so
+    the web app, SMTP and other clients in the process resolve as usual.
+    """
+    
+    def __init__(self, ttl: int, max_entries: int = 256):
+        """
+        Initialize cache
+        
+        Args:
+            ttl: Seconds to keep a resolved address
+            max_entries: Hosts kept (least recently used dropped first)
+        """
+        self.ttl = ttl
+        self.max_entries = max(1, max_entries)
+        self.hits = 0
+        self.misses = 0
+        self._entries: 'OrderedDict[Tuple[str, int], Tuple[float, str]]' = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def resolve(self, host: str, port: int) -> str:
+        """
+        Address to connect to for host, from the cache or the resolver
+        
+        Args:
+            host: Host name (or IP literal)
+            port: Port
+        
+        Returns:
+            IP address
+        
+        Raises:
+            socket.gaierror: If the host can't be resolved
+        """
+        key = (host, port)
+        now = time.monotonic()
+        
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] > now:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+        
+        infos = socket.getaddrinfo(host, port, allowed_gai_family(), socket.SOCK_STREAM)
+        address = infos[0][4][0]
+        
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = (now + self.ttl, address)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return address
+    
+    def forget(self, host: str, port: int):
+        """Drop a cached address (e.g. after a failed connect)"""
+        with self._lock:
+            self._entries.pop((host, port), None)
+
+
+_dns_cache: Optional[DNSCache] = None
+
+
+def enable_dns_cache(ttl: int) -> Optional[DNSCache]:
+    """
+    Create the DNS cache used by scraper sessions (idempotent)
+    
+    Args:
+        ttl: Seconds to keep resolved addresses, 0 disables caching
+    
+    Returns:
+        The active DNSCache or None if disabled
+    """
+    global _dns_cache
+    if ttl <= 0:
+        return None
+    with _shared_lock:
+        if _dns_cache is None:
+            _dns_cache = DNSCache(ttl)
+            logger.debug(f"DNS cache enabled (ttl={ttl}s)")
+    return _dns_cache
+
+
+class _CachedDNSConnectionMixin:
+    """Connect to the cached address of _dns_host; TLS still checks the real host name"""
+    
+    def _new_conn(self):
+        cache = _dns_cache
+        if cache is None:
+            return super()._new_conn()
+        
+        host = self._dns_host
+        try:
+            self._dns_host = cache.resolve(host, self.port)
+        except OSError:
+            # Let urllib3 resolve it and raise its usual NameResolutionError
+            return super()._new_conn()
+        try:
+            return super()._new_conn()
+        except Exception:
+            cache.forget(host, self.port)
+            raise
+        finally:
+            self._dns_host = host
+
+
+class _CachedDNSHTTPConnection(_CachedDNSConnectionMixin, HTTPConnection):
+    pass
+
+
+class _CachedDNSHTTPSConnection(_CachedDNSConnectionMixin, HTTPSConnection):
+    pass
+
+
+class _CachedDNSHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _CachedDNSHTTPConnection
+
+
+class _CachedDNSHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _CachedDNSHTTPSConnection
+
+
+class CachedDNSAdapter(HTTPAdapter):
+    """HTTPAdapter whose connections resolve hosts through the DNS cache"""
+    
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': _CachedDNSHTTPConnectionPool,
+            'https': _CachedDNSHTTPSConnectionPool,
+        }
+
+
+def build_session(pool_size: int) -> requests.Session:
+    """
+    Create a keep-alive session with a connection pool of the given size
+    
+    Args:
+        pool_size: Max connections kept open per host
+    
+    Returns:
+        Configured requests.Session
+    """
+    session = requests.Session()
+    adapter = CachedDNSAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    session.headers['Connection'] = 'keep-alive'
+    return session
+
+
+def get_session(pool_size: int, shared: bool = False) -> requests.Session:
+    """
+    Get a pooled session, either private to the caller or shared process-wide
+    
+    Args:
+        pool_size: Max connections kept open per host
+        shared: Reuse one session for every scraper in this process
+    
+    Returns:
+        requests.Session
+    """
+    if not shared:
+        return build_session(pool_size)
+    
+    with _shared_lock:
+        session = _shared_sessions.get(pool_size)
+        if session is None:
+            session = build_session(pool_size)
+            _shared_sessions[pool_size] = session
+        return session
+
+
+def connection_stats(session: requests.Session) -> Dict[str, int]:
+    """
+    Collect connection reuse counters from the session's urllib3 pools
+    
+    Args:
+        session: Session to inspect
+    
+    Returns:
+        Dictionary with http_requests, http_connections_opened, dns_cache_hits
+    """
+    requests_sent = 0
+    connections_opened = 0
+    
+    for adapter in {id(a): a for a in session.adapters.values()}.values():
+        pools = getattr(getattr(adapter, 'poolmanager', None), 'pools', None)
+        if pools is None:
+            continue
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            requests_sent += getattr(pool, 'num_requests', 0)
+            connections_opened += getattr(pool, 'num_connections', 0)
+    
+    return {
+        'http_requests': requests_sent,
+        'http_connections_opened': connections_opened,
+        'dns_cache_hits': _dns_cache.hits if _dns_cache else 0,
+    }
+
+
+def session_settings() -> Dict[str, Any]:
+    """Read pool settings from the environment"""
+    return {
+        'pool_size': int(os.getenv('HTTP_POOL_SIZE', '10')),
+        'shared': os.getenv('HTTP_SHARED_SESSION', 'false').lower() == 'true',
+        'dns_cache_ttl': int(os.getenv('HTTP_DNS_CACHE_TTL', '300')),
+    }
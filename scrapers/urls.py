@@ -0,0 +1,146 @@
+"""
+URL canonicalization shared by discovery, dedup, caching and job ids
+"""
+
+import re
+from functools import lru_cache
+from typing import Optional
+from urllib.parse import urljoin, urlsplit, parse_qsl, urlencode
+
+# Query parameters that only track where a click came from
+TRACKING_PARAMS = frozenset({
+    'gclid', 'fbclid', 'msclkid', 'dclid', 'yclid', 'mc_cid', 'mc_eid',
+    'ref', 'referrer', 'source', 'src', 'from', 'trk', 'sid', '_ga', '_gl',
+})
+TRACKING_PREFIXES = ('utm_',)
+
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+DUPLICATE_SLASHES_RE = re.compile(r'/{2,}')
+
+# "scheme:" prefix as urlsplit recognizes it
+SCHEME_RE = re.compile(r'[A-Za-z][A-Za-z0-9+.-]*:')
+
+# scheme://netloc path ?query (the fragment is dropped)
+ABSOLUTE_URL_RE = re.compile(r'([A-Za-z][A-Za-z0-9+.-]*)://([^/?#]*)([^?#]*)(?:\?([^#]*))?')
+
+# Characters urlsplit removes anywhere in a URL
+UNSAFE_CHARS = str.maketrans('', '', '\t\r\n')
+
+# Rozee job pages end in "-jobs-<numeric id>" (optionally followed by a slash)
+ROZEE_JOB_ID_RE = re.compile(r'-jobs-(\d+)/?$')
+
+
+def _is_tracking_param(name: str) -> bool:
+    name = name.lower()
+    return name in TRACKING_PARAMS or name.startswith(TRACKING_PREFIXES)
+
+
+def _bare_host(host: str) -> str:
+    return host[4:] if host.startswith('www.') else host
+
+
+@lru_cache(maxsize=64)
+def _site(base_url: str):
+    """(scheme, host, bare host) of a site root, None if it has no host"""
+    parts = urlsplit(base_url.strip())
+    host = (parts.hostname or '').rstrip('.')
+    if not host or parts.port not in (None, DEFAULT_PORTS.get(parts.scheme.lower())):
+        return None
+    return parts.scheme.lower(), host, _bare_host(host)
+
+
+def _resolve(url: str, base_url: str) -> str:
+    """Absolute form of a link found on base_url's site"""
+    if not SCHEME_RE.match(url):
+        joined = f"{base_url.rstrip('/')}/{url.lstrip('/')}"
+        if '/.' not in joined:
+            return joined
+    # Dot segments or an explicit scheme: let urljoin handle them
+    return urljoin(base_url.rstrip('/') + '/', url.lstrip('/'))
+
+
+def _split_netloc(netloc: str, scheme: str):
+    """(host, port) of a netloc; raises ValueError for an invalid port"""
+    if '@' not in netloc and '[' not in netloc and ':' not in netloc:
+        return netloc.lower().rstrip('.'), None
+    parts = urlsplit(f'{scheme}://{netloc}')
+    return (parts.hostname or '').rstrip('.'), parts.port
+
+
+@lru_cache(maxsize=65536)
+def canonicalize_url(url: str, base_url: Optional[str] = None) -> str:
+    """
+    Canonical form of a URL
+    
+    Resolves relative and scheme-relative links against base_url, lowercases
+    scheme and host, drops default ports, the fragment and tracking
+    parameters, sorts the remaining query, collapses duplicate slashes and
+    removes a trailing slash from non-root paths. Results are memoized.
+    
+    Links to base_url's own host over http or https, with or without "www.",
+    take base_url's scheme and host, so every variant of a page on the site
+    is one URL. Other hosts keep their scheme and "www." as given: nothing
+    says an arbitrary host serves both, so folding them could produce URLs
+    that don't resolve.
+    
+    Args:
+        url: Absolute or relative URL
+        base_url: Site root used for relative links
+    
+    Returns:
+        Canonical URL ('' if the URL has no host)
+    """
+    url = url.strip()
+    if '\t' in url or '\r' in url or '\n' in url:
+        url = url.translate(UNSAFE_CHARS)
+    if url.startswith('//'):
+        url = f'https:{url}'
+    elif base_url and not url.startswith(('http://', 'https://')):
+        url = _resolve(url, base_url)
+    
+    match = ABSOLUTE_URL_RE.match(url)
+    if not match:
+        return ''
+    scheme, netloc, path, query = match.groups()
+    scheme = scheme.lower()
+    try:
+        host, port = _split_netloc(netloc, scheme)
+    except ValueError:
+        return ''
+    if not host:
+        return ''
+    if port == DEFAULT_PORTS.get(scheme):
+        port = None
+    
+    site = _site(base_url) if base_url else None
+    if site and port is None and scheme in DEFAULT_PORTS and _bare_host(host) == site[2]:
+        scheme, host = site[0], site[1]
+    netloc = f'{host}:{port}' if port else host
+    
+    if '//' in path:
+        path = DUPLICATE_SLASHES_RE.sub('/', path)
+    if len(path) > 1 and path.endswith('/'):
+        path = path.rstrip('/') or '/'
+    path = path or '/'
+    
+    if query:
+        params = [(k, v) for k, v in parse_qsl(query, keep_blank_values=True) if not _is_tracking_param(k)]
+        query = urlencode(sorted(params))
+        if query:
+            return f'{scheme}://{netloc}{path}?{query}'
+    return f'{scheme}://{netloc}{path}'
+
+
+@lru_cache(maxsize=65536)
+def extract_rozee_job_id(url: str) -> Optional[str]:
+    """
+    Numeric Rozee job id from a job detail URL
+    
+    Args:
+        url: Job URL (raw or canonical)
+    
+    Returns:
+        Job id string, or None if the URL is not a Rozee job page
+    """
+    match = ROZEE_JOB_ID_RE.search(urlsplit(url.strip()).path)
+    return match.group(1) if match else None
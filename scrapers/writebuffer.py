@@ -0,0 +1,98 @@
+"""
+Write buffer: batches validated job rows into few, larger transactions
+"""
+
+import time
+import threading
+from typing import Any, Callable, Dict, Iterator, List
+
+
+def statement_chunks(count: int, max_rows: int) -> Iterator[int]:
+    """
+    Split count rows into statement sizes drawn from a small fixed set
+    
+    Full chunks of max_rows first, then the remainder as powers of two
+    (37 -> 32, 4, 1), so a batch of any size needs at most
+    log2(max_rows) + 2 distinct multi-row statements.
+    
+    Args:
+        count: Rows to write
+        max_rows: Largest statement size
+    
+    Yields:
+        Rows per statement
+    """
+    max_rows = max(1, max_rows)
+    full, rest = divmod(count, max_rows)
+    for _ in range(full):
+        yield max_rows
+    size = 1 << max(0, rest.bit_length() - 1)
+    while rest:
+        if rest >= size:
+            yield size
+            rest -= size
+        size >>= 1
+
+
+class WriteBuffer:
+    """
+    Collects rows and hands them to a flush function in batches
+    
+    A batch is flushed once it holds batch_size rows or its oldest row has
+    waited flush_seconds. Rows are keyed (e.g. by job_id) so a job queued
+    twice before a flush is only written once, with its latest data.
+    """
+    
+    def __init__(self, flush: Callable[[List[Dict[str, Any]]], Any], batch_size: int = 200,
+                 flush_seconds: float = 5.0):
+        """
+        Initialize buffer
+        
+        Args:
+            flush: Called with the buffered rows (in insertion order)
+            batch_size: Rows per batch (1 writes every row immediately)
+            flush_seconds: Max age of a buffered row before a flush
+        """
+        self._flush = flush
+        self.batch_size = max(1, batch_size)
+        self.flush_seconds = flush_seconds
+        self._rows: Dict[Any, Dict[str, Any]] = {}
+        self._oldest = None
+        self._lock = threading.RLock()
+    
+    def __len__(self) -> int:
+        return len(self._rows)
+    
+    def add(self, key: Any, row: Dict[str, Any]):
+        """
+        Buffer a row, flushing if the batch is full or old enough
+        
+        Args:
+            key: Dedup key (a later row with the same key replaces the earlier one)
+            row: Row to write
+        """
+        with self._lock:
+            # Replacing keeps the key's first position and the batch's age
+            self._rows[key] = row
+            if self._oldest is None:
+                self._oldest = time.monotonic()
+            if len(self._rows) >= self.batch_size:
+                self.flush()
+            else:
+                self.flush_if_due()
+    
+    def flush_if_due(self):
+        """Flush when the oldest buffered row has waited flush_seconds"""
+        with self._lock:
+            if self._oldest is not None and time.monotonic() - self._oldest >= self.flush_seconds:
+                self.flush()
+    
+    def flush(self):
+        """Write everything buffered"""
+        with self._lock:
+            if not self._rows:
+                return
+            rows = list(self._rows.values())
+            self._rows = {}
+            self._oldest = None
+            self._flush(rows)
@@ -0,0 +1,94 @@
+"""
+Write-behind database writer: commits job batches on its own connection
+"""
+
+import queue
+import logging
+import threading
+from typing import Any, Dict, List
+
+import psycopg
+
+logger = logging.getLogger('scraper.writer')
+
+# Tells the writer thread to exit once everything before it is written
+_STOP = object()
+
+
+class BackgroundWriter:
+    """
+    Thread that writes job batches handed over by the scraper
+    
+    The scraper's WriteBuffer passes each full (or aged) batch to submit(),
+    which only blocks when max_batches batches are already waiting. The
+    thread writes them with scraper.write_jobs on a connection of its own,
+    so a slow commit never stalls fetching. write_jobs counts new, updated,
+    skipped and failed rows in scraper.stats (under its stats lock).
+    """
+    
+    def __init__(self, scraper, max_batches: int = 4):
+        """
+        Initialize writer
+        
+        Args:
+            scraper: Scraper whose write_jobs is used
+            max_batches: Capacity of the batch queue (backpressure on the scraper)
+        """
+        self.scraper = scraper
+        self.queue: queue.Queue = queue.Queue(maxsize=max(1, max_batches))
+        self.conn = None
+        self.thread = None
+    
+    def start(self):
+        """Open the writer's connection and start the thread"""
+        self.connect()
+        self.thread = threading.Thread(
+            target=self._run,
+            name=f'{self.scraper.site_name}-writer',
+            daemon=True
+        )
+        self.thread.start()
+    
+    def connect(self):
+        """(Re)open the writer connection and point the scraper's write path at it"""
+        if self.conn:
+            try:
+                self.conn.close()
+            except Exception:
+                pass
+        self.conn = psycopg.connect(self.scraper.database_url)
+        self.scraper.use_write_connection(self.conn)
+    
+    def submit(self, rows: List[Dict[str, Any]]):
+        """Queue a batch for writing (blocks only while the queue is full)"""
+        self.queue.put(rows)
+    
+    def drain(self):
+        """Wait until every submitted batch has been written"""
+        self.queue.join()
+    
+    def close(self):
+        """Write what is queued, stop the thread and close the connection"""
+        if self.thread:
+            self.queue.put(_STOP)
+            self.thread.join()
+            self.thread = None
+        if self.conn:
+            self.conn.close()
+            self.conn = None
+    
+    def _run(self):
+        while True:
+            rows = self.queue.get()
+            try:
+                if rows is _STOP:
+                    return
+                if self.conn.closed or self.conn.broken:
+                    logger.warning("Writer connection lost, reconnecting")
+                    self.connect()
+                self.scraper.write_jobs(rows)
+            except Exception as e:
+                logger.error(f"Writer failed to store {len(rows)} jobs: {e}", exc_info=True)
+                self.scraper.incr_stat('errors', len(rows))
+            finally:
+                self.queue.task_done()
@@ -0,0 +1,71 @@
+"""
+Ranked full-text job search over the stored jobs.search_vector column
+"""
+
+import os
+from typing import Any, List, Optional, Tuple
+
+from pagination import ORDER_BY_SQL
+
+# websearch_to_tsquery accepts what people type into a search box: quoted
+# phrases, "or" and -exclusions, and it never raises on stray punctuation.
+# search_vector and idx_jobs_search_vector come from migrations/add_search_vector.sql
+MATCH_SQL = "search_vector @@ websearch_to_tsquery('english', %s)"
+
+# Normalization 32 maps the cover-density rank into [0, 1) (rank / (rank + 1))
+RANK_SQL = "ts_rank_cd(search_vector, websearch_to_tsquery('english', %s), 32)"
+
+# Up to 2x for a job posted today, halving with every half-life of age
+RECENCY_SQL = (
+    "(1 + power(0.5::float8, GREATEST(CURRENT_DATE - COALESCE(posted_date, scraped_at::date), 0)"
+    " / %s::float8))"
+)
+
+# Days for the recency boost to halve (0 ranks by text relevance only)
+RECENCY_HALF_LIFE_DAYS = float(os.getenv('SEARCH_RECENCY_HALF_LIFE_DAYS', '30'))
+
+
+class SearchQuery:
+    """
+    A user's search text, as a WHERE condition and a ranking ORDER BY
+    
+    Both /jobs and /api/v1/jobs/search build their SQL from this, so the
+    match always hits the GIN index and results rank the same everywhere.
+    """
+    
+    def __init__(self, text: Optional[str], recency: bool = True,
+                 half_life_days: float = RECENCY_HALF_LIFE_DAYS):
+        """
+        Initialize search query
+        
+        Args:
+            text: Search box text (None/blank means no search)
+            recency: Boost newer jobs on top of text relevance
+            half_life_days: Age in days at which the recency boost halves
+        """
+        self.text = (text or '').strip()
+        self.recency = recency and half_life_days > 0
+        self.half_life_days = half_life_days
+    
+    def __bool__(self) -> bool:
+        return bool(self.text)
+    
+    def where(self) -> Tuple[str, List[Any]]:
+        """
+        WHERE condition matching the search text
+        
+        Returns:
+            (SQL, params)
+        """
+        return MATCH_SQL, [self.text]
+    
+    def order_by(self) -> Tuple[str, List[Any]]:
+        """
+        ORDER BY list: best match first, newest first among equal ranks
+        
+        Returns:
+            (SQL, params)
+        """
+        if self.recency:
+            return f"{RANK_SQL} * {RECENCY_SQL} DESC, {ORDER_BY_SQL}", [self.text, self.half_life_days]
+        return f"{RANK_SQL} DESC, {ORDER_BY_SQL}", [self.text]